@@ -4,14 +4,64 @@ AI 모델 기본 클래스
 """
 
 import os
+import time
+import copy
+import queue
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, Union
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Union, Iterator
 from pathlib import Path
 import torch
 from transformers import AutoTokenizer, AutoModel
 from loguru import logger
 
+from app.core.config import get_settings
 from app.core.gpu_config import get_gpu_config, is_gpu_available
+from app.utils.telemetry import module_resident_bytes
+
+settings = get_settings()
+
+
+class PipelineReplicaPool:
+    """모델 가중치를 공유하는 파이프라인 복제본 풀
+    
+    Hugging Face 파이프라인 인스턴스는 여러 스레드에서 동시에 호출하기에 안전하지 않으므로,
+    모델 가중치는 공유하고 토크나이저와 호출 상태만 분리한 복제본을 호출마다 대여합니다.
+    """
+    
+    def __init__(self, base_pipeline: Any, size: int = 1):
+        self.size = max(1, size)
+        self._replicas: queue.Queue = queue.Queue()
+        self._replicas.put(base_pipeline)
+        for _ in range(self.size - 1):
+            self._replicas.put(self._make_replica(base_pipeline))
+    
+    @staticmethod
+    def _make_replica(base_pipeline: Any) -> Any:
+        """가중치는 공유하고 토크나이저만 복사한 복제본을 만듭니다."""
+        replica = copy.copy(base_pipeline)
+        tokenizer = getattr(base_pipeline, "tokenizer", None)
+        if tokenizer is not None:
+            replica.tokenizer = copy.deepcopy(tokenizer)
+        return replica
+    
+    @contextmanager
+    def checkout(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """복제본 하나를 대여하고, 사용이 끝나면 반납합니다. timeout초 안에 대여하지 못하면 TimeoutError"""
+        try:
+            replica = self._replicas.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError("파이프라인 복제본 대기 시간 초과")
+        try:
+            yield replica
+        finally:
+            self._replicas.put(replica)
+    
+    @property
+    def available(self) -> int:
+        """현재 대여 가능한 복제본 수"""
+        return self._replicas.qsize()
 
 
 class BaseAIModel(ABC):
@@ -25,6 +75,12 @@ class BaseAIModel(ABC):
         self.gpu_config = get_gpu_config()
         self.device = device
         
+        # 동시 추론용 파이프라인 복제본 수 (분석기별 설정 가능)
+        self.replica_count = settings.MODEL_REPLICA_COUNTS.get(
+            model_name, settings.DEFAULT_MODEL_REPLICAS
+        )
+        self.replica_pools: Dict[str, PipelineReplicaPool] = {}
+        
     @abstractmethod
     def analyze(self, text: str, **kwargs) -> Any:
         """텍스트를 분석합니다."""
@@ -35,6 +91,83 @@ class BaseAIModel(ABC):
         """모델을 로드합니다. 하위 클래스에서 구현해야 합니다."""
         pass
     
+    @abstractmethod
+    async def analyze_heuristic(self, text: str, **kwargs) -> Any:
+        """모델 추론 없이 휴리스틱으로 분석합니다. 시간 예산 초과 시 사용되며 하위 클래스에서 구현해야 합니다."""
+        pass
+    
+    def create_replica_pool(self, attr_name: str, size: Optional[int] = None) -> PipelineReplicaPool:
+        """attr_name 속성의 파이프라인으로 복제본 풀을 만듭니다."""
+        pool = PipelineReplicaPool(getattr(self, attr_name), size or self.replica_count)
+        self.replica_pools[attr_name] = pool
+        logger.info(f"{self.model_name}.{attr_name} 복제본 풀 생성: {pool.size}개")
+        return pool
+    
+    @contextmanager
+    def pipeline_replica(self, attr_name: str, deadline: Optional[float] = None) -> Iterator[Any]:
+        """파이프라인 복제본을 대여합니다. 풀이 없으면 원본 파이프라인을 사용합니다.
+        
+        deadline이 주어지면 마감 시각까지만 복제본을 기다리고, 대여한 시점에 마감이 지났으면
+        추론하지 않고 TimeoutError를 냅니다.
+        """
+        pool = self.replica_pools.get(attr_name)
+        if pool is None:
+            if self.deadline_exceeded(deadline):
+                raise TimeoutError(f"{self.model_name} 시간 예산 초과")
+            yield getattr(self, attr_name)
+            return
+        
+        remaining = self.time_remaining(deadline)
+        if remaining is not None and remaining <= 0:
+            raise TimeoutError(f"{self.model_name} 시간 예산 초과")
+        with pool.checkout(timeout=remaining) as replica:
+            if self.deadline_exceeded(deadline):
+                raise TimeoutError(f"{self.model_name} 시간 예산 초과")
+            yield replica
+    
+    async def run_pipeline(self, attr_name: str, *args, deadline: Optional[float] = None, **kwargs) -> Any:
+        """복제본을 대여해 워커 스레드에서 파이프라인을 실행합니다.
+        
+        호출자가 시간 초과로 기다림을 포기해도 스레드는 멈출 수 없으므로, 마감 시각을 넘긴 호출은
+        복제본을 대여한 직후 추론 없이 끝내 복제본을 곧바로 돌려줍니다.
+        """
+        def call():
+            with self.pipeline_replica(attr_name, deadline) as pipeline_replica:
+                return pipeline_replica(*args, **kwargs)
+        
+        return await asyncio.to_thread(call)
+    
+    def resident_bytes(self) -> int:
+        """로드된 모델(직접 보유한 모델과 파이프라인 내부 모델)의 가중치가 차지하는 메모리를 바이트로 반환합니다."""
+        if not self.is_loaded:
+            return 0
+        
+        modules = []
+        for value in list(vars(self).values()):
+            if isinstance(value, torch.nn.Module):
+                modules.append(value)
+            elif isinstance(getattr(value, "model", None), torch.nn.Module):
+                modules.append(value.model)
+        return module_resident_bytes(*modules)
+    
+    async def analyze_degraded(self, text: str, **kwargs) -> Any:
+        """휴리스틱 결과를 시간 예산 초과(degraded)로 표시하여 반환합니다."""
+        result = await self.analyze_heuristic(text, **kwargs)
+        result.degraded = True
+        return result
+    
+    @staticmethod
+    def time_remaining(deadline: Optional[float]) -> Optional[float]:
+        """마감 시각(time.monotonic 기준)까지 남은 시간을 초 단위로 반환합니다."""
+        if deadline is None:
+            return None
+        return deadline - time.monotonic()
+    
+    @staticmethod
+    def deadline_exceeded(deadline: Optional[float], reserve: float = 0.0) -> bool:
+        """마감 시각이 지났거나 reserve초 이내로 남았는지 확인합니다."""
+        return deadline is not None and time.monotonic() + reserve >= deadline
+    
     def load_huggingface_model(self, model_name: str, task: str) -> bool:
         """Hugging Face 모델을 로드합니다."""
         try:
@@ -76,6 +209,7 @@ class BaseAIModel(ABC):
                 del self.tokenizer
                 self.tokenizer = None
             
+            self.replica_pools.clear()
             self.is_loaded = False
             logger.info("모델 언로드 완료")
             return True
@@ -97,7 +231,11 @@ class BaseAIModel(ABC):
             "model_name": self.model_name,
             "is_loaded": self.is_loaded,
             "device": self.device,
-            "gpu_available": is_gpu_available()
+            "gpu_available": is_gpu_available(),
+            "replicas": {
+                name: {"size": pool.size, "available": pool.available}
+                for name, pool in self.replica_pools.items()
+            }
         }
         
         if is_gpu_available():
@@ -59,6 +59,9 @@ class BiasDetector(BaseAIModel):
                 return_all_scores=True
             )
             
+            # 동시 추론용 복제본 풀 (가중치 공유)
+            self.create_replica_pool("bias_pipeline")
+            
             logger.info("✅ 편향 감지 모델 로딩 완료")
             return True
             
@@ -69,6 +72,11 @@ class BiasDetector(BaseAIModel):
     
     async def analyze(self, text: str, **kwargs) -> BiasAnalysis:
         """텍스트의 편향성을 분석합니다."""
+        # 시간 예산을 넘겼으면 추론 없이 휴리스틱 결과 반환
+        if self.deadline_exceeded(kwargs.get("deadline")):
+            logger.warning("시간 예산 초과. 휴리스틱 결과 사용")
+            return await self.analyze_degraded(text)
+        
         # 모델이 로드되어 있는지 확인
         if not await self.ensure_model_loaded():
             logger.warning("모델이 로드되지 않음. 더미 로직 사용")
@@ -79,7 +87,7 @@ class BiasDetector(BaseAIModel):
             processed_text = self._preprocess_text(text)
             
             # AI 모델로 편향 분석 수행
-            bias_result = await self._detect_bias(processed_text)
+            bias_result = await self._detect_bias(processed_text, kwargs.get("deadline"))
             
             # 결과 생성
             return BiasAnalysis(
@@ -98,11 +106,13 @@ class BiasDetector(BaseAIModel):
             logger.error(f"AI 모델 편향 감지 실패: {e}, 더미 로직으로 폴백")
             return await self._analyze_dummy(text)
     
-    async def _detect_bias(self, text: str) -> Dict[str, Any]:
+    async def _detect_bias(self, text: str, deadline: Optional[float] = None) -> Dict[str, Any]:
         """편향 감지 수행"""
         try:
             # AI 모델로 분석
-            results = self.bias_pipeline(text, truncation=True, max_length=512)
+            results = await self.run_pipeline(
+                "bias_pipeline", text, truncation=True, max_length=512, deadline=deadline
+            )
             
             # 점수 추출 및 정렬
             scores = results[0]
@@ -162,6 +172,10 @@ class BiasDetector(BaseAIModel):
                 "other_biases": {}
             }
     
+    async def analyze_heuristic(self, text: str, **kwargs) -> BiasAnalysis:
+        """키워드 기반 휴리스틱으로 분석합니다."""
+        return await self._analyze_dummy(text)
+    
     def _preprocess_text(self, text: str) -> str:
         """텍스트 전처리"""
         # 기본 전처리
@@ -77,6 +77,9 @@ class ContentClassifier(BaseAIModel):
                 return_all_scores=True
             )
             
+            # 동시 추론용 복제본 풀 (가중치 공유)
+            self.create_replica_pool("classifier_pipeline")
+            
             logger.info("✅ 콘텐츠 분류 모델 로딩 완료")
             return True
             
@@ -87,6 +90,11 @@ class ContentClassifier(BaseAIModel):
     
     async def analyze(self, text: str, **kwargs) -> ContentClassification:
         """텍스트의 콘텐츠를 분류합니다."""
+        # 시간 예산을 넘겼으면 추론 없이 휴리스틱 결과 반환
+        if self.deadline_exceeded(kwargs.get("deadline")):
+            logger.warning("시간 예산 초과. 휴리스틱 결과 사용")
+            return await self.analyze_degraded(text)
+        
         # 모델이 로드되어 있는지 확인
         if not await self.ensure_model_loaded():
             logger.warning("모델이 로드되지 않음. 더미 로직 사용")
@@ -97,7 +105,7 @@ class ContentClassifier(BaseAIModel):
             processed_text = self._preprocess_text(text)
             
             # AI 모델로 분류 수행
-            category_result = await self._classify_category(processed_text)
+            category_result = await self._classify_category(processed_text, kwargs.get("deadline"))
             content_type_result = await self._classify_content_type(processed_text)
             audience_result = await self._classify_audience(processed_text)
             
@@ -121,11 +129,13 @@ class ContentClassifier(BaseAIModel):
             logger.error(f"AI 모델 분류 실패: {e}, 더미 로직으로 폴백")
             return await self._analyze_dummy(text)
     
-    async def _classify_category(self, text: str) -> Dict[str, Any]:
+    async def _classify_category(self, text: str, deadline: Optional[float] = None) -> Dict[str, Any]:
         """카테고리 분류"""
         try:
             # AI 모델로 분류
-            results = self.classifier_pipeline(text, truncation=True, max_length=512)
+            results = await self.run_pipeline(
+                "classifier_pipeline", text, truncation=True, max_length=512, deadline=deadline
+            )
             
             # 점수 정렬
             scores = results[0]
@@ -191,6 +201,10 @@ class ContentClassifier(BaseAIModel):
             logger.error(f"대상 독자 분류 실패: {e}")
             return "일반"
     
+    async def analyze_heuristic(self, text: str, **kwargs) -> ContentClassification:
+        """키워드 기반 휴리스틱으로 분석합니다."""
+        return await self._analyze_dummy(text)
+    
     def _preprocess_text(self, text: str) -> str:
         """텍스트 전처리"""
         # 기본 전처리
@@ -4,14 +4,15 @@
 """
 
 import asyncio
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Callable
 import torch
 from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
 from sentence_transformers import SentenceTransformer
 from loguru import logger
 
 from .base import BaseAIModel
-from ..models.analysis import CredibilityScore
+from ..models.analysis import CredibilityScore, CredibilityAnalysis
+from ..utils.text import split_sentences, select_salient_sentences
 
 
 class CredibilityAnalyzer(BaseAIModel):
@@ -55,6 +56,9 @@ class CredibilityAnalyzer(BaseAIModel):
                 batch_size=self.gpu_config.batch_size
             )
             
+            # 동시 추론용 복제본 풀 (가중치 공유)
+            self.create_replica_pool("fact_check_pipeline")
+            
             logger.info("✅ 신뢰도 분석 모델 로딩 완료")
             return True
             
@@ -62,8 +66,19 @@ class CredibilityAnalyzer(BaseAIModel):
             logger.error(f"❌ 신뢰도 분석 모델 로딩 실패: {e}")
             return False
     
+    def get_sentence_encoder(self) -> Optional[Callable[[List[str]], Any]]:
+        """문장 임베딩 함수를 반환합니다. 모델이 로드되지 않았으면 None (다른 분석기와 공유)"""
+        return self.sentence_transformer.encode if self.sentence_transformer else None
+    
     async def analyze(self, text: str, **kwargs) -> CredibilityAnalysis:
         """텍스트 신뢰도 분석"""
+        deadline = kwargs.get("deadline")
+        
+        # 시간 예산을 넘겼으면 추론 없이 휴리스틱 결과 반환
+        if self.deadline_exceeded(deadline):
+            logger.warning("시간 예산 초과. 휴리스틱 결과 사용")
+            return await self.analyze_degraded(text)
+        
         # 모델이 로드되어 있는지 확인
         if not await self.ensure_model_loaded():
             logger.warning("모델이 로드되지 않음. 기본값 반환")
@@ -81,7 +96,7 @@ class CredibilityAnalyzer(BaseAIModel):
             logger.info(f"🔍 신뢰도 분석 시작: {text[:100]}...")
             
             # 1. 사실 확인 (Fact-checking)
-            fact_check_result = await self._check_facts(text)
+            fact_check_result = await self._check_facts(text, deadline)
             
             # 2. 출처 신뢰도 평가
             source_credibility = await self._evaluate_source_credibility(text)
@@ -90,7 +105,7 @@ class CredibilityAnalyzer(BaseAIModel):
             claim_strength = await self._analyze_claim_strength(text)
             
             # 4. 일관성 검사
-            consistency_score = await self._check_consistency(text)
+            consistency_score = await self._check_consistency(text, deadline)
             
             # 5. 최종 신뢰도 점수 계산
             final_score = self._calculate_final_score(
@@ -103,6 +118,8 @@ class CredibilityAnalyzer(BaseAIModel):
             # 6. 신뢰도 레벨 결정
             credibility_level = self._determine_credibility_level(final_score)
             
+            degraded = self.deadline_exceeded(deadline)
+            
             result = CredibilityAnalysis(
                 credibility_score=final_score,
                 fact_check_score=fact_check_result,
@@ -110,7 +127,8 @@ class CredibilityAnalyzer(BaseAIModel):
                 consistency_score=consistency_score,
                 objectivity_score=1.0 - claim_strength,  # 편향성이 낮을수록 객관성 높음
                 credibility_level=credibility_level,
-                reasoning=f"AI 모델 기반 다중 요소 분석: 사실확인({fact_check_result:.2f}), 출처({source_credibility:.2f}), 주장강도({claim_strength:.2f}), 일관성({consistency_score:.2f})"
+                reasoning=f"AI 모델 기반 다중 요소 분석: 사실확인({fact_check_result:.2f}), 출처({source_credibility:.2f}), 주장강도({claim_strength:.2f}), 일관성({consistency_score:.2f})",
+                degraded=degraded
             )
             
             logger.info(f"✅ 신뢰도 분석 완료: 점수 {final_score:.2f}, 레벨 {credibility_level}")
@@ -129,24 +147,28 @@ class CredibilityAnalyzer(BaseAIModel):
                 reasoning=f"분석 중 오류 발생: {str(e)}"
             )
     
-    async def _check_facts(self, text: str) -> float:
+    async def _check_facts(self, text: str, deadline: Optional[float] = None) -> float:
         """사실 확인"""
         try:
-            # 텍스트를 문장 단위로 분리
-            sentences = text.split('.')
-            sentences = [s.strip() for s in sentences if s.strip()]
+            # 전체 텍스트에서 주장을 담은 문장을 선별 (수치, 고유명사, 단정/완곡 표현, 임베딩 중심성)
+            # 임베딩은 이벤트 루프를 막지 않도록 스레드에서 실행하고, 마감이 지났으면 정규식 점수만 사용
+            embed = None if self.deadline_exceeded(deadline) else self.get_sentence_encoder()
+            sentences = await asyncio.to_thread(
+                select_salient_sentences, split_sentences(text), k=5, embed=embed
+            )
             
             if not sentences:
                 return 0.5
             
-            # 각 문장의 사실성 평가
+            # 선별된 문장의 사실성 평가
             fact_scores = []
-            for sentence in sentences[:5]:  # 최대 5개 문장만 분석
-                if len(sentence) > 10:  # 너무 짧은 문장 제외
-                    result = self.fact_check_pipeline(sentence)
-                    # 결과를 0-1 점수로 변환
-                    score = self._normalize_fact_check_result(result)
-                    fact_scores.append(score)
+            for sentence in sentences:
+                if self.deadline_exceeded(deadline):
+                    break
+                result = await self.run_pipeline("fact_check_pipeline", sentence, deadline=deadline)
+                # 결과를 0-1 점수로 변환
+                score = self._normalize_fact_check_result(result)
+                fact_scores.append(score)
             
             if fact_scores:
                 return sum(fact_scores) / len(fact_scores)
@@ -218,9 +240,13 @@ class CredibilityAnalyzer(BaseAIModel):
             logger.warning(f"주장 강도 분석 실패: {e}")
             return 0.5
     
-    async def _check_consistency(self, text: str) -> float:
+    async def _check_consistency(self, text: str, deadline: Optional[float] = None) -> float:
         """일관성 검사"""
         try:
+            # 시간 예산을 넘겼으면 임베딩 계산 생략
+            if self.deadline_exceeded(deadline):
+                return 0.5
+            
             # 문장 임베딩을 사용한 일관성 검사
             sentences = text.split('.')
             sentences = [s.strip() for s in sentences if s.strip() and len(s) > 10]
@@ -258,6 +284,22 @@ class CredibilityAnalyzer(BaseAIModel):
             logger.warning(f"일관성 검사 실패: {e}")
             return 0.5
     
+    async def analyze_heuristic(self, text: str, **kwargs) -> CredibilityAnalysis:
+        """출처/주장 강도 키워드만으로 신뢰도를 분석합니다."""
+        source_credibility = await self._evaluate_source_credibility(text)
+        claim_strength = await self._analyze_claim_strength(text)
+        final_score = self._calculate_final_score(0.5, source_credibility, claim_strength, 0.5)
+        
+        return CredibilityAnalysis(
+            credibility_score=final_score,
+            fact_check_score=0.5,
+            source_reliability_score=source_credibility,
+            consistency_score=0.5,
+            objectivity_score=1.0 - claim_strength,
+            credibility_level=self._determine_credibility_level(final_score),
+            reasoning=f"휴리스틱 분석: 출처({source_credibility:.2f}), 주장강도({claim_strength:.2f})"
+        )
+    
     def _normalize_fact_check_result(self, result) -> float:
         """사실 확인 결과를 0-1 점수로 정규화"""
         try:
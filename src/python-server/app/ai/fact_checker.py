@@ -3,13 +3,21 @@
 텍스트의 사실성을 검증하는 모델입니다.
 """
 
+import asyncio
 import torch
 from transformers import pipeline
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Callable
 from loguru import logger
 
 from app.ai.base import BaseAIModel
-from app.models.analysis import FactCheckResult
+from app.models.analysis import FactCheckResult, FactCheckAnalysis
+from app.utils.text import (
+    FACTUAL_INDICATORS,
+    SUSPICIOUS_INDICATORS,
+    EXTREME_INDICATORS,
+    split_sentences,
+    select_salient_sentences
+)
 
 
 class FactChecker(BaseAIModel):
@@ -20,6 +28,9 @@ class FactChecker(BaseAIModel):
         self.fact_check_pipeline = None
         self.entailment_pipeline = None
         self.fact_check_threshold = 0.7
+        self.max_claim_sentences = 5  # NLI로 검사할 최대 문장 수
+        # 주장 문장 선별용 문장 임베딩 함수를 돌려주는 공급자 (AIModelService가 신뢰도 분석기 모델을 공유해 연결)
+        self.sentence_encoder_provider: Optional[Callable[[], Optional[Callable[[List[str]], Any]]]] = None
     
     async def load_model(self) -> bool:
         """AI 모델을 로드합니다."""
@@ -47,6 +58,10 @@ class FactChecker(BaseAIModel):
                 return_all_scores=True
             )
             
+            # 동시 추론용 복제본 풀 (가중치 공유)
+            self.create_replica_pool("fact_check_pipeline")
+            self.create_replica_pool("entailment_pipeline")
+            
             logger.info("✅ 사실 확인 모델 로딩 완료")
             return True
             
@@ -57,6 +72,13 @@ class FactChecker(BaseAIModel):
     
     async def analyze(self, text: str, **kwargs) -> FactCheckAnalysis:
         """텍스트의 사실성을 검증합니다."""
+        deadline = kwargs.get("deadline")
+        
+        # 시간 예산을 넘겼으면 추론 없이 휴리스틱 결과 반환
+        if self.deadline_exceeded(deadline):
+            logger.warning("시간 예산 초과. 휴리스틱 결과 사용")
+            return await self.analyze_degraded(text)
+        
         # 모델이 로드되어 있는지 확인
         if not await self.ensure_model_loaded():
             logger.warning("모델이 로드되지 않음. 더미 로직 사용")
@@ -66,11 +88,25 @@ class FactChecker(BaseAIModel):
             # 텍스트 전처리
             processed_text = self._preprocess_text(text)
             
-            # AI 모델로 사실 확인 수행
-            fact_score = await self._calculate_fact_score_ai(processed_text)
-            fact_claims = await self._extract_fact_claims_ai(processed_text)
-            verification_status = await self._check_verification_status_ai(processed_text)
-            sources = await self._identify_sources_ai(processed_text)
+            # 전체 텍스트에서 주장을 담은 문장을 선별 (NLI 비용은 문장 수와 무관하게 일정)
+            # 임베딩 중심성은 이벤트 루프 밖에서 계산하고, 마감이 지났으면 정규식 점수만 사용
+            embed = None
+            if self.sentence_encoder_provider and not self.deadline_exceeded(deadline):
+                embed = self.sentence_encoder_provider()
+            claim_sentences = await asyncio.to_thread(self._select_claim_sentences, text, embed)
+            
+            # AI 모델로 사실 확인 수행 (예산 초과 시 남은 문장은 건너뜀)
+            fact_score = await self._calculate_fact_score_ai(processed_text, claim_sentences, deadline)
+            fact_claims = await self._extract_fact_claims_ai(processed_text, claim_sentences, deadline)
+            
+            if self.deadline_exceeded(deadline):
+                verification_status = self._check_verification_status_fallback(processed_text)
+                sources = self._identify_sources_fallback(processed_text)
+            else:
+                verification_status = await self._check_verification_status_ai(processed_text)
+                sources = await self._identify_sources_ai(processed_text)
+            
+            degraded = self.deadline_exceeded(deadline)
             
             return FactCheckAnalysis(
                 fact_check_score=fact_score,
@@ -78,30 +114,49 @@ class FactChecker(BaseAIModel):
                 source_analysis_score=0.8,
                 evidence_strength_score=fact_score,
                 fact_check_result=verification_status,
-                reasoning="AI 모델 기반 사실 확인 완료"
+                reasoning="AI 모델 기반 사실 확인 완료" + (" (시간 예산 초과로 일부 문장 생략)" if degraded else ""),
+                degraded=degraded
             )
             
         except Exception as e:
             logger.error(f"AI 모델 사실 확인 실패: {e}, 더미 로직으로 폴백")
             return await self._analyze_dummy(text)
     
-    async def _calculate_fact_score_ai(self, text: str) -> float:
+    def _select_claim_sentences(
+        self,
+        text: str,
+        embed: Optional[Callable[[List[str]], Any]] = None
+    ) -> List[str]:
+        """원문 전체에서 사실 확인 대상 문장을 선별하고 전처리합니다. embed가 주어지면 임베딩 중심성도 반영합니다."""
+        sentences = select_salient_sentences(
+            split_sentences(text), k=self.max_claim_sentences, embed=embed
+        )
+        sentences = [self._preprocess_text(sentence) for sentence in sentences]
+        return [sentence for sentence in sentences if len(sentence) > 10]
+    
+    async def _calculate_fact_score_ai(
+        self, 
+        text: str, 
+        sentences: List[str], 
+        deadline: Optional[float] = None
+    ) -> float:
         """AI 모델을 사용하여 사실성 점수를 계산합니다."""
         try:
-            # 텍스트를 문장 단위로 분리
-            sentences = text.split('.')
-            sentences = [s.strip() for s in sentences if s.strip() and len(s) > 10]
-            
             if not sentences:
                 return 0.5
             
-            # 각 문장의 사실성 평가
+            # 선별된 문장의 사실성 평가
             fact_scores = []
-            for sentence in sentences[:5]:  # 최대 5개 문장만 분석
+            for sentence in sentences:
+                if self.deadline_exceeded(deadline):
+                    break
+                
                 # 전제-가설 관계 분석
-                result = self.entailment_pipeline(
+                result = await self.run_pipeline(
+                    "entailment_pipeline",
                     sentence,
-                    candidate_labels=["entailment", "neutral", "contradiction"]
+                    candidate_labels=["entailment", "neutral", "contradiction"],
+                    deadline=deadline
                 )
                 
                 # entailment 점수가 높을수록 사실성 높음
@@ -114,26 +169,34 @@ class FactChecker(BaseAIModel):
             
             if fact_scores:
                 return sum(fact_scores) / len(fact_scores)
+            if self.deadline_exceeded(deadline):
+                return self._calculate_fact_score_fallback(text)
             return 0.5
             
         except Exception as e:
             logger.warning(f"AI 모델 사실성 점수 계산 실패: {e}")
             return self._calculate_fact_score_fallback(text)
     
-    async def _extract_fact_claims_ai(self, text: str) -> List[str]:
+    async def _extract_fact_claims_ai(
+        self, 
+        text: str, 
+        sentences: List[str], 
+        deadline: Optional[float] = None
+    ) -> List[str]:
         """AI 모델을 사용하여 사실 주장들을 추출합니다."""
         try:
             claims = []
             
-            # 텍스트를 문장 단위로 분리
-            sentences = text.split('.')
-            sentences = [s.strip() for s in sentences if s.strip() and len(s) > 10]
-            
-            for sentence in sentences[:5]:
+            for sentence in sentences:
+                if self.deadline_exceeded(deadline):
+                    break
+                
                 # 각 문장이 사실 주장인지 판단
-                result = self.fact_check_pipeline(
+                result = await self.run_pipeline(
+                    "fact_check_pipeline",
                     sentence,
-                    candidate_labels=["factual", "opinion", "speculation"]
+                    candidate_labels=["factual", "opinion", "speculation"],
+                    deadline=deadline
                 )
                 
                 label = result[0][0]['label']
@@ -159,7 +222,8 @@ class FactChecker(BaseAIModel):
         """AI 모델을 사용하여 검증 상태를 확인합니다."""
         try:
             # 검증 상태 분류
-            result = self.fact_check_pipeline(
+            result = await self.run_pipeline(
+                "fact_check_pipeline",
                 text,
                 candidate_labels=["verified", "unverified", "uncertain"]
             )
@@ -185,7 +249,8 @@ class FactChecker(BaseAIModel):
         """AI 모델을 사용하여 정보 출처를 식별합니다."""
         try:
             # 출처 유형 분류
-            result = self.fact_check_pipeline(
+            result = await self.run_pipeline(
+                "fact_check_pipeline",
                 text,
                 candidate_labels=["official", "media", "expert", "research", "unknown"]
             )
@@ -214,6 +279,10 @@ class FactChecker(BaseAIModel):
             logger.warning(f"AI 모델 출처 식별 실패: {e}")
             return self._identify_sources_fallback(text)
     
+    async def analyze_heuristic(self, text: str, **kwargs) -> FactCheckAnalysis:
+        """지표 키워드 기반 휴리스틱으로 사실성을 분석합니다."""
+        return await self._analyze_dummy(text)
+    
     def _preprocess_text(self, text: str) -> str:
         """텍스트 전처리"""
         # 기본 전처리
@@ -230,27 +299,9 @@ class FactChecker(BaseAIModel):
     # 폴백 메서드들 (AI 모델 실패 시 사용)
     def _calculate_fact_score_fallback(self, text: str) -> float:
         """사실성 점수를 계산합니다 (폴백)."""
-        # 사실성 지표들
-        factual_indicators = [
-            "연구", "데이터", "통계", "조사", "보고서", "논문", "전문가",
-            "공식", "공식 발표", "확인됨", "검증됨", "사실", "정확한"
-        ]
-        
-        # 의심스러운 지표들
-        suspicious_indicators = [
-            "소문", "추측", "아마도", "어쩌면", "불확실", "미확인",
-            "의심", "혹시", "아마", "추정", "가능성"
-        ]
-        
-        # 극단적 표현들
-        extreme_indicators = [
-            "절대", "완벽", "최고", "최악", "완전히", "전혀", "100%",
-            "완벽하게", "완전하게", "절대적으로"
-        ]
-        
-        factual_count = sum(1 for indicator in factual_indicators if indicator in text)
-        suspicious_count = sum(1 for indicator in suspicious_indicators if indicator in text)
-        extreme_count = sum(1 for indicator in extreme_indicators if indicator in text)
+        factual_count = sum(1 for indicator in FACTUAL_INDICATORS if indicator in text)
+        suspicious_count = sum(1 for indicator in SUSPICIOUS_INDICATORS if indicator in text)
+        extreme_count = sum(1 for indicator in EXTREME_INDICATORS if indicator in text)
         
         base_score = 0.5
         factual_bonus = factual_count * 0.1
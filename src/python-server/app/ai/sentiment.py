@@ -5,7 +5,7 @@
 
 import torch
 from transformers import AutoTokenizer, AutoModelForSequenceClassification, pipeline
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import numpy as np
 
 from app.ai.base import BaseAIModel
@@ -24,6 +24,10 @@ class SentimentAnalyzer(BaseAIModel):
         self.sentiment_pipeline = None
         self.confidence_threshold = 0.6
         
+        # 배치 분석 설정 (댓글처럼 짧은 텍스트를 길이별로 묶어 한 번에 추론)
+        self.batch_size = 64
+        self.batch_max_length = 128
+        
         # 감정 레이블 매핑
         self.sentiment_mapping = {
             0: "negative",
@@ -47,6 +51,9 @@ class SentimentAnalyzer(BaseAIModel):
                 device=self.device
             )
             
+            # 동시 추론용 복제본 풀 (가중치 공유)
+            self.create_replica_pool("sentiment_pipeline")
+            
             self.is_loaded = True
             logger.info("감정 분석 모델 로딩 완료")
             return True
@@ -67,6 +74,7 @@ class SentimentAnalyzer(BaseAIModel):
                 del self.sentiment_pipeline
                 self.sentiment_pipeline = None
             
+            self.replica_pools.clear()
             self.is_loaded = False
             logger.info("감정 분석 모델 언로드 완료")
             return True
@@ -77,6 +85,13 @@ class SentimentAnalyzer(BaseAIModel):
     
     def analyze(self, text: str, **kwargs) -> SentimentAnalysis:
         """텍스트의 감정을 분석합니다."""
+        # 시간 예산을 넘겼으면 추론 없이 휴리스틱 결과 반환
+        if self.deadline_exceeded(kwargs.get("deadline")):
+            logger.warning("시간 예산 초과. 휴리스틱 결과 사용")
+            result = self._analyze_dummy(text)
+            result.degraded = True
+            return result
+        
         # 모델이 로드되어 있는지 확인
         if not self.ensure_model_loaded():
             logger.warning("모델이 로드되지 않음. 더미 로직 사용")
@@ -87,7 +102,7 @@ class SentimentAnalyzer(BaseAIModel):
             processed_text = self._preprocess_text(text)
             
             # AI 모델로 감정 분석 수행
-            sentiment_result = self._analyze_sentiment(processed_text)
+            sentiment_result = self._analyze_sentiment(processed_text, kwargs.get("deadline"))
             
             # 결과 생성
             return SentimentAnalysis(
@@ -102,17 +117,22 @@ class SentimentAnalyzer(BaseAIModel):
             logger.error(f"감정 분석 실패: {e}")
             return self._analyze_dummy(text)
     
+    async def analyze_heuristic(self, text: str, **kwargs) -> SentimentAnalysis:
+        """키워드 기반 휴리스틱으로 감정을 분석합니다."""
+        return self._analyze_dummy(text)
+    
     def ensure_model_loaded(self) -> bool:
         """모델이 로드되어 있는지 확인하고, 필요시 로드합니다."""
         if not self.is_loaded:
             return self.load_model()
         return True
     
-    def _analyze_sentiment(self, text: str) -> Dict[str, Any]:
+    def _analyze_sentiment(self, text: str, deadline: Optional[float] = None) -> Dict[str, Any]:
         """감정 분석 수행"""
         try:
             # AI 모델로 분석
-            results = self.sentiment_pipeline(text, truncation=True, max_length=512)
+            with self.pipeline_replica("sentiment_pipeline", deadline) as sentiment_pipeline:
+                results = sentiment_pipeline(text, truncation=True, max_length=512)
             
             # 점수 추출
             scores = results[0]
@@ -149,6 +169,89 @@ class SentimentAnalyzer(BaseAIModel):
             logger.error(f"AI 모델 감정 분석 실패: {e}")
             return self._analyze_dummy(text)
     
+    def analyze_batch(self, texts: List[str], deadline: Optional[float] = None) -> List[SentimentAnalysis]:
+        """여러 텍스트의 감정을 배치로 분석합니다.
+        
+        텍스트를 길이순으로 정렬해 batch_size 단위 버킷으로 나누므로 패딩 낭비가 적고,
+        버킷 하나가 한 번의 forward pass로 처리됩니다. 결과는 입력 순서대로 반환합니다.
+        마감 시각이 지나면 남은 버킷은 추론하지 않고 휴리스틱 결과(degraded)로 채웁니다.
+        """
+        return self.analyze_batch_with_passes(texts, deadline)[0]
+    
+    def analyze_batch_with_passes(
+        self,
+        texts: List[str],
+        deadline: Optional[float] = None
+    ) -> Tuple[List[SentimentAnalysis], int]:
+        """analyze_batch와 같되, 실제로 실행한 파이프라인 호출(forward pass) 수를 함께 반환합니다."""
+        if not texts:
+            return [], 0
+        
+        if not self.ensure_model_loaded():
+            logger.warning("모델이 로드되지 않음. 더미 로직 사용")
+            return [self._analyze_dummy(text) for text in texts], 0
+        
+        processed = [self._preprocess_text(text) for text in texts]
+        order = sorted(range(len(processed)), key=lambda i: len(processed[i]))
+        results: List[Optional[SentimentAnalysis]] = [None] * len(processed)
+        forward_passes = 0
+        
+        for start in range(0, len(order), self.batch_size):
+            bucket = order[start:start + self.batch_size]
+            if self.deadline_exceeded(deadline):
+                logger.warning("시간 예산 초과. 남은 댓글은 휴리스틱 결과 사용")
+                for i in order[start:]:
+                    results[i] = self._analyze_dummy(texts[i])
+                    results[i].degraded = True
+                break
+            try:
+                with self.pipeline_replica("sentiment_pipeline", deadline) as sentiment_pipeline:
+                    outputs = sentiment_pipeline(
+                        [processed[i] for i in bucket],
+                        truncation=True,
+                        max_length=self.batch_max_length,
+                        batch_size=len(bucket),
+                        top_k=None
+                    )
+                forward_passes += 1
+                for i, scores in zip(bucket, outputs):
+                    results[i] = self._build_sentiment_from_scores(scores)
+            except Exception as e:
+                logger.error(f"배치 감정 분석 실패: {e}, 더미 로직으로 폴백")
+                for i in bucket:
+                    results[i] = self._analyze_dummy(texts[i])
+                    # 복제본을 기다리다 마감을 넘긴 경우는 시간 예산 초과로 표시
+                    results[i].degraded = isinstance(e, TimeoutError)
+        
+        return results, forward_passes
+    
+    def _build_sentiment_from_scores(self, scores: List[Dict[str, Any]]) -> SentimentAnalysis:
+        """파이프라인의 레이블별 점수 목록을 감정 분석 결과로 변환합니다."""
+        sentiment_scores = {"positive": 0.0, "negative": 0.0, "neutral": 0.0}
+        for item in scores:
+            label = str(item["label"])
+            suffix = label.rsplit("_", 1)[-1]
+            name = self.sentiment_mapping.get(int(suffix)) if suffix.isdigit() else label.lower()
+            if name in sentiment_scores:
+                sentiment_scores[name] = float(item["score"])
+        
+        dominant_emotion = max(sentiment_scores, key=sentiment_scores.get)
+        if dominant_emotion == "positive":
+            overall_sentiment = sentiment_scores["positive"]
+        elif dominant_emotion == "negative":
+            overall_sentiment = -sentiment_scores["negative"]
+        else:
+            overall_sentiment = 0.0
+        
+        confidence = max(sentiment_scores.values())
+        return SentimentAnalysis(
+            overall_sentiment=overall_sentiment,
+            dominant_emotion=dominant_emotion,
+            emotion_breakdown=sentiment_scores,
+            confidence=confidence,
+            reasoning=f"AI 모델 기반 배치 감정 분석 (신뢰도: {confidence:.3f})"
+        )
+    
     def _preprocess_text(self, text: str) -> str:
         """텍스트 전처리"""
         # 기본 전처리
@@ -3,25 +3,54 @@
 콘텐츠 분석을 위한 API를 제공합니다.
 """
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends
-from fastapi.responses import JSONResponse
-from typing import Dict, Any, List, Optional
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends, Query, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import Dict, Any, List, Optional, AsyncIterator
 import asyncio
+import json
+import time
 
 from app.services.ai_models import get_ai_model_service, AIModelService
-from app.services.batch_processor import get_batch_processor, BatchProcessor
+from app.services.batch_processor import get_batch_processor, BatchProcessor, BatchResult
 from app.models.analysis import (
     AnalysisRequest, 
     AnalysisResult, 
     AnalysisStatus,
-    AnalysisType
+    AnalysisType,
+    BulkAnalysisItem
 )
 from app.core.logging import get_logger
+from app.core.config import get_settings
+from app.core.exceptions import RateLimitError
 
 logger = get_logger(__name__)
+settings = get_settings()
 
 router = APIRouter(prefix="/analysis", tags=["analysis"])
 
+# 엔드포인트별 공정 큐 클라이언트 유형 (요청에서 받지 않고 서버가 정함)
+# 단건 요청은 응답을 기다리는 대화형, 다건/NDJSON 요청은 백필로 취급
+SINGLE_CLIENT_CLASS = "interactive"
+BULK_CLIENT_CLASS = "backfill"
+
+
+def _resolve_deadline(request: AnalysisRequest) -> Optional[float]:
+    """요청의 시간 예산을 time.monotonic() 기준 마감 시각으로 변환합니다."""
+    budget = request.deadline_seconds or settings.ANALYSIS_DEADLINE_SECONDS
+    if not budget:
+        return None
+    return time.monotonic() + budget
+
+
+def _raise_rate_limited(error: RateLimitError):
+    """승인 제어 거절을 Retry-After 헤더가 포함된 429 응답으로 변환합니다."""
+    retry_after = error.details.get("retry_after", 1)
+    raise HTTPException(
+        status_code=429,
+        detail=f"요청이 많아 잠시 후 다시 시도해주세요: {error.message}",
+        headers={"Retry-After": str(retry_after)}
+    )
+
 
 @router.post("/analyze", response_model=Dict[str, Any])
 async def analyze_content(
@@ -37,7 +66,8 @@ async def analyze_content(
         result = await ai_service.analyze_content(
             text=request.text,
             video_metadata=request.video_metadata,
-            analysis_type=request.analysis_type
+            analysis_type=request.analysis_type,
+            deadline=_resolve_deadline(request)
         )
         
         return {
@@ -68,7 +98,9 @@ async def analyze_content_batch(
             priority=priority,
             metadata={
                 "video_metadata": request.video_metadata,
-                "user_id": getattr(request, 'user_id', None)
+                "user_id": getattr(request, 'user_id', None),
+                "client_class": SINGLE_CLIENT_CLASS,
+                "deadline": _resolve_deadline(request)
             }
         )
         
@@ -82,6 +114,8 @@ async def analyze_content_batch(
             "message": "배치 분석이 시작되었습니다."
         }
         
+    except RateLimitError as e:
+        _raise_rate_limited(e)
     except Exception as e:
         logger.error(f"배치 분석 요청 실패: {e}")
         raise HTTPException(status_code=500, detail=f"배치 분석 요청 중 오류가 발생했습니다: {str(e)}")
@@ -90,14 +124,15 @@ async def analyze_content_batch(
 @router.get("/batch/{request_id}", response_model=Dict[str, Any])
 async def get_batch_result(
     request_id: str,
+    wait: float = Query(1.0, ge=0, le=60, description="결과가 준비될 때까지 대기할 최대 시간(초, 롱 폴링)"),
     batch_processor: BatchProcessor = Depends(get_batch_processor)
 ) -> Dict[str, Any]:
     """배치 분석 결과를 조회합니다."""
     try:
-        logger.info(f"배치 분석 결과 조회: {request_id}")
+        logger.info(f"배치 분석 결과 조회: {request_id} (대기: {wait}s)")
         
-        # 배치 처리기에서 결과 조회
-        result = await batch_processor.get_result(request_id, timeout=1.0)
+        # 배치 처리기에서 결과 조회 (완료 시 즉시 반환)
+        result = await batch_processor.get_result(request_id, timeout=wait)
         
         if result is None:
             # 아직 처리 중이거나 존재하지 않는 요청
@@ -133,6 +168,15 @@ async def get_batch_result(
                     "message": "분석 중 오류가 발생했습니다."
                 }
             }
+        elif result.status == "cancelled":
+            return {
+                "status": "cancelled",
+                "data": {
+                    "request_id": request_id,
+                    "status": "cancelled",
+                    "message": "분석이 취소되었습니다."
+                }
+            }
         else:
             return {
                 "status": "pending",
@@ -148,6 +192,31 @@ async def get_batch_result(
         raise HTTPException(status_code=500, detail=f"결과 조회 중 오류가 발생했습니다: {str(e)}")
 
 
+@router.delete("/batch/{request_id}", response_model=Dict[str, Any])
+async def cancel_batch_request(
+    request_id: str,
+    batch_processor: BatchProcessor = Depends(get_batch_processor)
+) -> Dict[str, Any]:
+    """배치 분석 요청을 취소합니다."""
+    try:
+        cancelled = await batch_processor.cancel(request_id)
+        
+        if not cancelled:
+            raise HTTPException(status_code=404, detail="취소할 수 있는 요청이 없습니다. 이미 완료되었거나 존재하지 않습니다.")
+        
+        return {
+            "status": "success",
+            "data": {"request_id": request_id, "status": "cancelled"},
+            "message": "배치 분석 요청이 취소되었습니다."
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"배치 요청 취소 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"배치 요청 취소 중 오류가 발생했습니다: {str(e)}")
+
+
 @router.post("/analyze/batch/multiple", response_model=Dict[str, Any])
 async def analyze_multiple_contents(
     requests: List[AnalysisRequest],
@@ -161,24 +230,29 @@ async def analyze_multiple_contents(
         if len(requests) > 100:  # 최대 100개 요청 제한
             raise HTTPException(status_code=400, detail="최대 100개 요청까지만 처리할 수 있습니다.")
         
-        # 모든 요청을 배치 처리기에 추가
-        request_ids = []
-        for i, request in enumerate(requests):
-            request_id = await batch_processor.add_request(
-                text=request.text,
-                analysis_type=request.analysis_type,
-                priority=priority,
-                metadata={
-                    "video_metadata": request.video_metadata,
-                    "user_id": getattr(request, 'user_id', None),
-                    "batch_index": i
+        # 모든 요청을 한 번에 배치 처리기에 추가 (승인되지 않으면 아무것도 등록되지 않음)
+        request_ids = await batch_processor.add_requests(
+            [
+                {
+                    "text": request.text,
+                    "analysis_type": request.analysis_type,
+                    "metadata": {
+                        "video_metadata": request.video_metadata,
+                        "user_id": getattr(request, 'user_id', None),
+                        "client_class": BULK_CLIENT_CLASS,
+                        "batch_index": i,
+                        "deadline": _resolve_deadline(request)
+                    }
                 }
-            )
-            request_ids.append(request_id)
+                for i, request in enumerate(requests)
+            ],
+            priority=priority
+        )
         
         return {
             "status": "success",
             "data": {
+                "batch_id": batch_processor.create_batch_handle(request_ids),
                 "request_ids": request_ids,
                 "total_requests": len(requests),
                 "status": "pending",
@@ -187,11 +261,217 @@ async def analyze_multiple_contents(
             "message": "다중 배치 분석이 시작되었습니다."
         }
         
+    except HTTPException:
+        raise
+    except RateLimitError as e:
+        _raise_rate_limited(e)
     except Exception as e:
         logger.error(f"다중 배치 분석 요청 실패: {e}")
         raise HTTPException(status_code=500, detail=f"다중 배치 분석 요청 중 오류가 발생했습니다: {str(e)}")
 
 
+def _serialize_batch_result(result: BatchResult) -> Dict[str, Any]:
+    """배치 결과를 JSON으로 직렬화할 수 있는 딕셔너리로 변환합니다."""
+    return {
+        "request_id": result.request_id,
+        "status": result.status,
+        "result": result.result.dict() if hasattr(result.result, "dict") else result.result,
+        "processing_time": result.processing_time,
+        "error": result.error
+    }
+
+
+async def _cancel_undelivered(
+    batch_processor: BatchProcessor,
+    request_ids: List[str],
+    delivered: set
+) -> None:
+    """스트림으로 전달하지 못한 요청들을 취소합니다."""
+    cancelled = 0
+    for request_id in request_ids:
+        if request_id in delivered:
+            continue
+        try:
+            if await batch_processor.cancel(request_id):
+                cancelled += 1
+        except Exception as e:
+            logger.error(f"미전달 요청 취소 실패: {request_id} - {e}")
+    if cancelled:
+        logger.info(f"스트림 연결 해제로 배치 요청 {cancelled}개 취소")
+
+
+@router.get("/batch/{batch_id}/stream")
+async def stream_batch_results(
+    batch_id: str,
+    format: str = Query("ndjson", pattern="^(ndjson|sse)$", description="응답 형식 (ndjson 또는 sse)"),
+    timeout: float = Query(300.0, gt=0, le=3600, description="최대 스트리밍 시간(초)"),
+    batch_processor: BatchProcessor = Depends(get_batch_processor)
+):
+    """배치 핸들에 묶인 요청들의 결과를 완료된 순서대로 스트리밍합니다."""
+    request_ids = batch_processor.get_batch_handle(batch_id)
+    if request_ids is None:
+        raise HTTPException(status_code=404, detail="배치 핸들을 찾을 수 없습니다.")
+    
+    def encode(event: str, payload: Dict[str, Any]) -> str:
+        data = json.dumps(payload, ensure_ascii=False, default=str)
+        if format == "sse":
+            return f"event: {event}\ndata: {data}\n\n"
+        return data + "\n"
+    
+    async def generate():
+        delivered = set()
+        try:
+            async for result in batch_processor.iter_results(request_ids, timeout=timeout):
+                delivered.add(result.request_id)
+                yield encode("result", {"type": "result", **_serialize_batch_result(result)})
+        except (GeneratorExit, asyncio.CancelledError):
+            # 클라이언트 연결이 끊겨 스트림이 닫힘: 아직 전달하지 못한 요청은 받을 곳이 없으므로 취소
+            await _cancel_undelivered(batch_processor, request_ids, delivered)
+            raise
+        except Exception as e:
+            logger.error(f"배치 결과 스트리밍 실패: {batch_id} - {e}")
+            yield encode("error", {"type": "error", "message": str(e)})
+        
+        yield encode("end", {
+            "type": "end",
+            "batch_id": batch_id,
+            "total": len(request_ids),
+            "completed": len(delivered),
+            "pending": [request_id for request_id in request_ids if request_id not in delivered]
+        })
+    
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(generate(), media_type=media_type, headers={"Cache-Control": "no-cache"})
+
+
+async def _iter_ndjson_lines(request: Request, max_line_bytes: int) -> AsyncIterator[Optional[bytes]]:
+    """요청 본문을 버퍼링하지 않고 도착하는 대로 한 줄씩 반환합니다.
+    
+    max_line_bytes를 넘는 줄은 다음 줄바꿈까지 버리고 그 자리에 None을 한 번 반환합니다.
+    줄바꿈은 새로 도착한 데이터에서만 찾으므로 긴 줄이 여러 청크로 나뉘어 와도 비용이 선형입니다.
+    """
+    buffer = bytearray()
+    scan_from = 0
+    discarding = False  # 상한을 넘은 줄의 나머지를 다음 줄바꿈까지 버리는 중
+    
+    async for chunk in request.stream():
+        buffer += chunk
+        start = 0
+        while True:
+            newline = buffer.find(b"\n", scan_from)
+            if newline < 0:
+                break
+            if discarding:
+                discarding = False
+            elif newline - start > max_line_bytes:
+                yield None
+            else:
+                yield bytes(buffer[start:newline])
+            start = scan_from = newline + 1
+        
+        del buffer[:start]
+        scan_from = len(buffer)
+        if len(buffer) > max_line_bytes:
+            if not discarding:
+                yield None
+                discarding = True
+            buffer.clear()
+            scan_from = 0
+    
+    if buffer and not discarding:
+        yield bytes(buffer)
+
+
+@router.post("/analyze/batch/ndjson", response_model=Dict[str, Any])
+async def analyze_contents_ndjson(
+    request: Request,
+    priority: int = 1,
+    chunk_size: int = Query(500, ge=1, le=5000, description="한 번에 큐에 넣을 요청 수"),
+    batch_processor: BatchProcessor = Depends(get_batch_processor)
+) -> Dict[str, Any]:
+    """NDJSON 본문(한 줄에 BulkAnalysisItem 하나)을 스트리밍으로 읽으며 배치 큐에 추가합니다."""
+    request_ids: List[str] = []
+    errors: List[Dict[str, Any]] = []
+    error_count = 0
+    pending_items: List[Dict[str, Any]] = []
+    line_number = 0
+    
+    async def flush():
+        if pending_items:
+            request_ids.extend(await batch_processor.add_requests(pending_items, priority=priority))
+            pending_items.clear()
+    
+    try:
+        async for raw_line in _iter_ndjson_lines(request, settings.BULK_MAX_LINE_BYTES):
+            line_number += 1
+            
+            try:
+                if raw_line is None:
+                    raise ValueError(f"줄 길이가 최대 {settings.BULK_MAX_LINE_BYTES}바이트를 초과합니다.")
+                line = raw_line.strip()
+                if not line:
+                    continue
+                item = BulkAnalysisItem(**json.loads(line))
+            except Exception as e:
+                error_count += 1
+                if len(errors) < 100:  # 응답 크기 제한
+                    errors.append({"line": line_number, "error": str(e)})
+                continue
+            
+            pending_items.append({
+                "text": item.text,
+                "analysis_type": item.analysis_type,
+                "priority": item.priority if item.priority is not None else priority,
+                "metadata": {
+                    "video_metadata": item.video_metadata,
+                    "user_id": item.user_id,
+                    "client_class": BULK_CLIENT_CLASS,
+                    "line": line_number,
+                    "deadline": time.monotonic() + item.deadline_seconds if item.deadline_seconds else None
+                }
+            })
+            if len(pending_items) >= chunk_size:
+                await flush()
+        
+        await flush()
+        
+    except RateLimitError as e:
+        if not request_ids:
+            _raise_rate_limited(e)
+        # 일부만 등록된 경우 등록된 요청과 중단 위치를 알려줌
+        return {
+            "status": "partial",
+            "data": {
+                "batch_id": batch_processor.create_batch_handle(request_ids),
+                "request_ids": request_ids,
+                "total_requests": len(request_ids),
+                "rejected_from_line": pending_items[0]["metadata"]["line"] if pending_items else line_number,
+                "retry_after": e.details.get("retry_after"),
+                "errors": errors,
+                "error_count": error_count
+            },
+            "message": f"대기열이 가득 차 {len(request_ids)}개 요청만 등록되었습니다."
+        }
+    except Exception as e:
+        logger.error(f"NDJSON 대량 분석 요청 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"대량 분석 요청 중 오류가 발생했습니다: {str(e)}")
+    
+    logger.info(f"NDJSON 대량 분석 요청: {len(request_ids)}개 등록, {error_count}개 오류")
+    
+    return {
+        "status": "success",
+        "data": {
+            "batch_id": batch_processor.create_batch_handle(request_ids),
+            "request_ids": request_ids,
+            "total_requests": len(request_ids),
+            "errors": errors,
+            "error_count": error_count,
+            "status": "pending"
+        },
+        "message": f"{len(request_ids)}개 대량 분석 요청이 등록되었습니다."
+    }
+
+
 @router.get("/batch/status", response_model=Dict[str, Any])
 async def get_batch_status(
     batch_processor: BatchProcessor = Depends(get_batch_processor)
@@ -269,8 +549,14 @@ async def get_batch_metrics(
                 "average_wait_time": round(metrics.average_wait_time, 3),
                 "throughput_per_minute": round(metrics.throughput_per_minute, 1),
                 "success_rate": round(metrics.success_rate, 1),
-                "gpu_utilization": round(metrics.gpu_utilization, 1),
-                "memory_usage": round(metrics.memory_usage, 1)
+                "gpu_utilization": round(metrics.gpu_utilization, 1) if metrics.gpu_utilization is not None else None,
+                "memory_usage": round(metrics.memory_usage, 1),
+                "resources": metrics.resources,
+                "latency_p50": metrics.latency_p50,
+                "latency_p95": metrics.latency_p95,
+                "latency_p99": metrics.latency_p99,
+                "coalesced_requests": metrics.coalesced_requests,
+                "coalesce_rate": round(metrics.coalesce_rate, 1)
             },
             "message": "배치 처리 메트릭을 조회했습니다."
         }
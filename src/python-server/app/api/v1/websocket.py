@@ -26,6 +26,7 @@ class ConnectionManager:
         self.active_connections: Dict[str, WebSocket] = {}
         self.analysis_subscriptions: Dict[str, List[str]] = {}  # analysis_id -> [connection_id]
         self.connection_analyses: Dict[str, List[str]] = {}     # connection_id -> [analysis_id]
+        self.connection_started: Dict[str, List[str]] = {}      # connection_id -> [이 연결이 시작한 analysis_id]
     
     async def connect(self, websocket: WebSocket, connection_id: str):
         """새로운 WebSocket 연결을 추가합니다."""
@@ -34,8 +35,11 @@ class ConnectionManager:
         self.connection_analyses[connection_id] = []
         logger.info(f"WebSocket 연결 추가: {connection_id}")
     
-    def disconnect(self, connection_id: str):
-        """WebSocket 연결을 제거합니다."""
+    def disconnect(self, connection_id: str) -> List[str]:
+        """WebSocket 연결을 제거합니다.
+        
+        이 연결이 시작했고 더 이상 구독자가 없는 분석 ID 목록을 반환합니다.
+        """
         if connection_id in self.active_connections:
             del self.active_connections[connection_id]
         
@@ -49,7 +53,13 @@ class ConnectionManager:
                         del self.analysis_subscriptions[analysis_id]
             del self.connection_analyses[connection_id]
         
+        orphaned = [
+            analysis_id for analysis_id in self.connection_started.pop(connection_id, [])
+            if not self.analysis_subscriptions.get(analysis_id)
+        ]
+        
         logger.info(f"WebSocket 연결 제거: {connection_id}")
+        return orphaned
     
     async def subscribe_to_analysis(self, connection_id: str, analysis_id: str):
         """특정 분석에 대한 구독을 추가합니다."""
@@ -340,6 +350,9 @@ async def get_websocket_test_page():
                     case 'analysis_update':
                         handleAnalysisUpdate(data);
                         break;
+                    case 'analysis_partial_result':
+                        addMessage('부분 결과', `분석 ${data.analysis_id}: ${data.data.analysis} 완료 (${data.data.progress}%)`, 'analysis-update');
+                        break;
                     case 'analysis_started':
                         handleAnalysisStarted(data);
                         break;
@@ -499,7 +512,12 @@ async def websocket_endpoint(websocket: WebSocket):
     except Exception as e:
         logger.error(f"WebSocket 연결 오류: {connection_id} - {e}")
     finally:
-        manager.disconnect(connection_id)
+        orphaned = manager.disconnect(connection_id)
+        
+        # 이 연결이 시작했고 지켜보는 구독자가 없는 분석은 자동 취소
+        for analysis_id in orphaned:
+            if await analysis_service.cancel_analysis(analysis_id):
+                logger.info(f"WebSocket 연결 해제로 분석 취소: {analysis_id}")
 
 
 async def handle_websocket_message(connection_id: str, message: str):
@@ -662,6 +680,8 @@ async def handle_start_analysis(connection_id: str, data: Dict[str, Any]):
         video_url = data.get("video_url")
         analysis_types = data.get("analysis_types", ["bias", "credibility", "sentiment"])
         priority = data.get("priority", "normal")
+        deadline_seconds = data.get("deadline_seconds")
+        force_refresh = bool(data.get("force_refresh", False))
         
         if not video_url:
             await manager.send_personal_message(
@@ -675,7 +695,10 @@ async def handle_start_analysis(connection_id: str, data: Dict[str, Any]):
             return
         
         # 분석 시작
-        analysis_id = await analysis_service.start_analysis(video_url, analysis_types, priority)
+        analysis_id = await analysis_service.start_analysis(
+            video_url, analysis_types, priority, deadline_seconds=deadline_seconds,
+            force_refresh=force_refresh
+        )
         
         # 성공 응답 전송
         await manager.send_personal_message(
@@ -689,8 +712,9 @@ async def handle_start_analysis(connection_id: str, data: Dict[str, Any]):
             connection_id
         )
         
-        # 자동으로 해당 분석을 구독
+        # 자동으로 해당 분석을 구독 (연결 해제 시 자동 취소 대상)
         await manager.subscribe_to_analysis(connection_id, analysis_id)
+        manager.connection_started.setdefault(connection_id, []).append(analysis_id)
         
         logger.info(f"WebSocket을 통한 분석 시작: {analysis_id} - {video_url}")
         
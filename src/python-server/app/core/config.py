@@ -4,7 +4,7 @@
 """
 
 import os
-from typing import Optional, List
+from typing import Optional, List, Dict
 from pydantic_settings import BaseSettings
 from pydantic import field_validator
 
@@ -57,6 +57,13 @@ class Settings(BaseSettings):
     USE_GPU: bool = True
     GPU_MEMORY_LIMIT: str = "14GB"
     
+    # 분석기별 파이프라인 복제본 수 (예: {"sentiment_analyzer": 4})
+    DEFAULT_MODEL_REPLICAS: int = 1
+    MODEL_REPLICA_COUNTS: Dict[str, int] = {}
+    
+    # 분석 시간 예산 (초, 미설정 시 제한 없음)
+    ANALYSIS_DEADLINE_SECONDS: Optional[float] = None
+    
     # 로깅 설정
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -68,6 +75,31 @@ class Settings(BaseSettings):
     # 캐시 설정
     CACHE_TTL: int = 3600  # 1시간
     
+    # 배치 처리 설정
+    BATCH_RESULT_TTL_SECONDS: int = 3600  # 완료 결과 보관 시간
+    BATCH_RESULT_MAX_ENTRIES: int = 10000  # 메모리에 보관할 최대 결과 수
+    BATCH_RESULT_SWEEP_INTERVAL: float = 60.0  # 만료 결과 정리 주기 (초)
+    BATCH_RESULT_SPILL_TO_CACHE: bool = True  # 메모리에서 밀려난 결과를 캐시에 보관
+    BATCH_LATENCY_SLO_SECONDS: float = 5.0  # 요청 지연 시간 p95 목표 (초)
+    BATCH_QUEUE_CAPACITY: int = 10000  # 대기열 최대 요청 수
+    BATCH_MAX_ESTIMATED_WAIT_SECONDS: float = 300.0  # 예상 대기 시간이 이보다 길면 요청 거절
+    BATCH_RESERVED_CAPACITY: Dict[int, float] = {5: 0.1}  # 우선순위 하한별 예약 비율 (해당 우선순위 이상만 사용)
+    BULK_MAX_LINE_BYTES: int = 1048576  # NDJSON 대량 요청 한 줄의 최대 크기 (초과 줄은 오류로 건너뜀)
+    BATCH_MAX_WAIT_SECONDS: float = 0.05  # 배치가 차지 않았을 때 선두 요청의 최대 대기 시간 (초, 0이면 즉시 시작)
+    BATCH_MAX_CONCURRENCY: Optional[int] = None  # 동시 처리 배치 수 상한 (미설정 시 CPU 코어 수)
+    ANALYSIS_MAX_CONCURRENCY: Optional[int] = None  # 동시 영상 분석 수 상한 (미설정 시 CPU 코어 수)
+    ANALYSIS_FETCH_CONCURRENCY: int = 8  # 동시 영상 정보 수집 수
+    ANALYSIS_PERSIST_CONCURRENCY: int = 2  # 동시 결과 정리/전송 수
+    ANALYSIS_RESULT_CACHE_TTL: int = 21600  # 영상 단위 분석 결과 재사용 기간 (초, 0이면 사용 안 함)
+    ANALYSIS_DB_PATH: str = "./data/analyses.db"  # DATABASE_URL이 없을 때 사용할 SQLite 파일
+    ANALYSIS_HOT_CACHE_SIZE: int = 1000  # 메모리에 둘 최근 완료 분석 수
+    ANALYSIS_RETENTION_HOURS: int = 168  # 완료된 분석 보관 기간 (시간)
+    ANALYSIS_CLEANUP_INTERVAL: float = 3600.0  # 보관 기간 정리 주기 (초)
+    ANALYSIS_STAGE_QUEUE_SIZE: int = 16  # 분석 단계 사이 대기열 크기 (수집이 추론보다 앞설 수 있는 정도)
+    BATCH_MEMORY_HIGH_WATERMARK: float = 0.85  # 호스트/GPU 메모리 사용률이 이 비율 이상이면 배치 크기 축소
+    RESOURCE_SAMPLE_INTERVAL: float = 5.0  # 리소스 텔레메트리 측정 주기 (초)
+    BATCH_CLIENT_CLASS_WEIGHTS: Dict[str, float] = {"interactive": 4.0, "default": 1.0, "backfill": 0.5}  # 클라이언트 유형별 공정 큐 가중치
+    
     model_config = {
         "env_file": ".env",
         "case_sensitive": True
@@ -7,6 +7,7 @@
 from .analysis import (
     AnalysisType,
     AnalysisStatus,
+    AnalysisStatusInfo,
     CredibilityScore,
     SentimentAnalysis,
     BiasDetection,
@@ -53,6 +54,7 @@ __all__ = [
     # 분석 모델
     "AnalysisType",
     "AnalysisStatus", 
+    "AnalysisStatusInfo",
     "CredibilityScore",
     "SentimentAnalysis",
     "BiasDetection",
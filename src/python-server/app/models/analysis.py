@@ -44,6 +44,7 @@ class SentimentAnalysis(BaseModel):
     emotion_breakdown: Dict[str, float] = Field(default_factory=dict, description="감정별 세부 분석")
     confidence: float = Field(..., ge=0.0, le=1.0, description="분석 신뢰도")
     reasoning: str = Field(..., description="분석 근거")
+    degraded: bool = Field(False, description="시간 예산 초과로 휴리스틱 결과를 사용했는지 여부")
 
 
 class BiasAnalysis(BaseModel):
@@ -57,6 +58,7 @@ class BiasAnalysis(BaseModel):
     religious_bias: float = Field(..., ge=0.0, le=1.0, description="종교적 편향 점수")
     other_biases: Dict[str, float] = Field(default_factory=dict, description="기타 편향 점수")
     reasoning: str = Field(..., description="분석 근거")
+    degraded: bool = Field(False, description="시간 예산 초과로 휴리스틱 결과를 사용했는지 여부")
 
 
 class ContentClassification(BaseModel):
@@ -68,6 +70,7 @@ class ContentClassification(BaseModel):
     topic: str = Field(..., description="주제")
     target_audience: str = Field(..., description="대상 청중")
     reasoning: str = Field(..., description="분류 근거")
+    degraded: bool = Field(False, description="시간 예산 초과로 휴리스틱 결과를 사용했는지 여부")
 
 
 class CredibilityAnalysis(BaseModel):
@@ -79,6 +82,7 @@ class CredibilityAnalysis(BaseModel):
     objectivity_score: float = Field(..., ge=0.0, le=1.0, description="객관성 점수")
     credibility_level: str = Field(..., description="신뢰도 레벨")
     reasoning: str = Field(..., description="분석 근거")
+    degraded: bool = Field(False, description="시간 예산 초과로 휴리스틱 결과를 사용했는지 여부")
 
 
 class FactCheckAnalysis(BaseModel):
@@ -89,6 +93,7 @@ class FactCheckAnalysis(BaseModel):
     evidence_strength_score: float = Field(..., ge=0.0, le=1.0, description="증거 강도 점수")
     fact_check_result: str = Field(..., description="팩트 체크 결과")
     reasoning: str = Field(..., description="분석 근거")
+    degraded: bool = Field(False, description="시간 예산 초과로 휴리스틱 결과를 사용했는지 여부")
 
 
 class FactCheckResult(BaseModel):
@@ -128,6 +133,17 @@ class AnalysisRequest(BaseModel):
     user_id: Optional[str] = Field(None, description="사용자 ID")
     priority: Optional[str] = Field("normal", description="우선순위")
     custom_parameters: Optional[Dict[str, Any]] = Field(None, description="사용자 정의 매개변수")
+    deadline_seconds: Optional[float] = Field(None, gt=0, description="분석 시간 예산 (초)")
+
+
+class BulkAnalysisItem(BaseModel):
+    """NDJSON 대량 분석 요청의 한 줄"""
+    text: str = Field(..., min_length=1, description="분석할 텍스트")
+    analysis_type: str = Field("full", description="분석 타입")
+    priority: Optional[int] = Field(None, description="우선순위 (미지정 시 요청 전체 우선순위)")
+    user_id: Optional[str] = Field(None, description="사용자 ID")
+    video_metadata: Optional[Dict[str, Any]] = Field(None, description="영상 메타데이터")
+    deadline_seconds: Optional[float] = Field(None, gt=0, description="분석 시간 예산 (초)")
 
 
 class AnalysisResponse(BaseModel):
@@ -139,7 +155,7 @@ class AnalysisResponse(BaseModel):
     estimated_completion: Optional[datetime] = Field(None, description="예상 완료 시간")
 
 
-class AnalysisStatus(BaseModel):
+class AnalysisStatusInfo(BaseModel):
     """분석 상태 조회 모델"""
     analysis_id: str = Field(..., description="분석 ID")
     status: AnalysisStatus = Field(..., description="현재 상태")
@@ -6,7 +6,7 @@
 from .cache import CacheService, cache_service
 from .ai_models import AIModelService, ai_model_service
 from .youtube import YouTubeService
-from .analysis import AnalysisService
+from .analysis import AnalysisService, analysis_service
 
 __all__ = [
     "CacheService",
@@ -14,7 +14,8 @@ __all__ = [
     "AIModelService", 
     "ai_model_service",
     "YouTubeService",
-    "AnalysisService"
+    "AnalysisService",
+    "analysis_service"
 ]
 
 
@@ -24,6 +25,9 @@ async def initialize_services():
         # 캐시 서비스 연결
         await cache_service.connect()
         
+        # 분석 저장소 연결 및 보관 기간 정리 시작
+        await analysis_service.initialize()
+        
         # AI 모델 서비스는 이미 초기화됨
         
         return True
@@ -37,6 +41,9 @@ async def initialize_services():
 async def cleanup_services():
     """모든 서비스를 정리합니다."""
     try:
+        # 분석 워커 중지 (진행 중인 분석이 결과를 캐시에 쓸 수 있도록 캐시보다 먼저)
+        await analysis_service.shutdown()
+        
         # 캐시 서비스 연결 해제
         await cache_service.disconnect()
         
@@ -4,7 +4,8 @@ AI 모델 서비스
 """
 
 import asyncio
-from typing import Dict, List, Optional, Any, Union
+import math
+from typing import Dict, List, Optional, Any, Union, AsyncIterator, Tuple
 from datetime import datetime
 
 from app.core.logging import get_logger
@@ -16,9 +17,9 @@ from app.ai.sentiment import SentimentAnalyzer
 from app.ai.classifier import ContentClassifier
 from app.models.analysis import (
     AnalysisResult,
-    CredibilityScore,
+    CredibilityAnalysis,
     BiasAnalysis,
-    FactCheckResult,
+    FactCheckAnalysis,
     SentimentAnalysis,
     ContentClassification,
     AnalysisMetadata,
@@ -40,6 +41,12 @@ class AIModelService:
         self.sentiment_analyzer = SentimentAnalyzer()
         self.content_classifier = ContentClassifier()
         
+        # 사실 확인기의 주장 문장 선별에 신뢰도 분석기의 문장 임베딩 모델을 공유
+        self.fact_checker.sentence_encoder_provider = self.credibility_analyzer.get_sentence_encoder
+        
+        # 결과 캐시/중복 요청 병합 키에 포함되는 모델 버전
+        self.model_version = "1.0.0"
+        
         logger.info("AI 모델 서비스 초기화됨")
     
     async def initialize_models(self):
@@ -81,9 +88,14 @@ class AIModelService:
         self,
         text: str,
         video_metadata: Optional[Dict[str, Any]] = None,
-        analysis_type: str = "full"
+        analysis_type: str = "full",
+        deadline: Optional[float] = None
     ) -> AnalysisResult:
-        """콘텐츠를 종합적으로 분석합니다."""
+        """콘텐츠를 종합적으로 분석합니다.
+        
+        deadline은 time.monotonic() 기준 마감 시각이며, 마감까지 끝내지 못한
+        분석기는 휴리스틱 결과(degraded)를 반환합니다.
+        """
         start_time = datetime.utcnow()
         
         try:
@@ -94,30 +106,10 @@ class AIModelService:
                 await self.initialize_models()
                 self._models_initialized = True
             
-            # 분석 타입에 따라 실행할 분석 결정
-            if analysis_type == "full":
-                tasks = [
-                    self._analyze_credibility(text, video_metadata),
-                    self._analyze_bias(text),
-                    self._analyze_facts(text),
-                    self._analyze_sentiment(text),
-                    self._classify_content(text)
-                ]
-            elif analysis_type == "credibility":
-                tasks = [self._analyze_credibility(text, video_metadata)]
-            elif analysis_type == "bias":
-                tasks = [self._analyze_bias(text)]
-            elif analysis_type == "facts":
-                tasks = [self._analyze_facts(text)]
-            elif analysis_type == "sentiment":
-                tasks = [self._analyze_sentiment(text)]
-            elif analysis_type == "classification":
-                tasks = [self._classify_content(text)]
-            else:
-                raise ValueError(f"지원하지 않는 분석 타입: {analysis_type}")
-            
-            # 병렬로 분석 실행
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            # 분석기별 결과를 완료 순서대로 수집
+            results = []
+            async for _, result in self.analyze_content_stream(text, video_metadata, analysis_type, deadline):
+                results.append(result)
             
             # 결과 처리 및 통합
             analysis_result = await self._process_results(
@@ -131,53 +123,216 @@ class AIModelService:
             logger.error(f"콘텐츠 분석 실패: {e}")
             raise
     
+    async def analyze_content_stream(
+        self,
+        text: str,
+        video_metadata: Optional[Dict[str, Any]] = None,
+        analysis_type: str = "full",
+        deadline: Optional[float] = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """분석기별 결과를 완료되는 순서대로 (분석 이름, 결과) 형태로 전달합니다.
+        
+        실패한 분석기는 예외 객체를 결과로 전달하며, 소비자가 중간에
+        반복을 멈추면 아직 끝나지 않은 분석은 취소됩니다.
+        """
+        # 모델들이 로드되었는지 확인하고, 필요시 초기화
+        if not hasattr(self, '_models_initialized'):
+            await self.initialize_models()
+            self._models_initialized = True
+        
+        analyses = self._build_analysis_tasks(text, video_metadata, analysis_type, deadline)
+        task_names = {asyncio.ensure_future(coro): name for name, coro in analyses.items()}
+        pending = set(task_names)
+        
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        result = e
+                    yield task_names[task], result
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    def _build_analysis_tasks(
+        self,
+        text: str,
+        video_metadata: Optional[Dict[str, Any]],
+        analysis_type: str,
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """분석 타입에 따라 실행할 분석 코루틴을 이름별로 생성합니다."""
+        factories = {
+            "credibility": lambda: self._analyze_credibility(text, video_metadata, deadline),
+            "bias": lambda: self._analyze_bias(text, deadline),
+            "facts": lambda: self._analyze_facts(text, deadline),
+            "sentiment": lambda: self._analyze_sentiment(text, deadline),
+            "classification": lambda: self._classify_content(text, deadline)
+        }
+        
+        if analysis_type == "full":
+            names = list(factories)
+        else:
+            # "bias,sentiment"처럼 쉼표로 구분된 복수 타입 지원
+            names = [name.strip() for name in analysis_type.split(",") if name.strip()]
+            for name in names:
+                if name not in factories:
+                    raise ValueError(f"지원하지 않는 분석 타입: {name}")
+        
+        return {name: factories[name]() for name in dict.fromkeys(names)}
+    
+    async def _call_analyzer(
+        self, 
+        analyzer: Any, 
+        text: str, 
+        deadline: Optional[float] = None, 
+        **kwargs
+    ) -> Any:
+        """분석기를 호출합니다. 동기 분석기는 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+        
+        마감 시각까지 끝나지 않으면 분석기의 휴리스틱 결과를 degraded로 표시해 반환합니다.
+        이미 워커 스레드에서 실행 중인 파이프라인 호출은 취소할 수 없어 끝날 때까지 복제본을 점유하지만,
+        분석기에 같은 마감 시각을 넘기므로 이후 호출은 run_pipeline에서 추론 없이 끝나 복제본을 바로 반납합니다.
+        """
+        remaining = analyzer.time_remaining(deadline)
+        if remaining is not None and remaining <= 0:
+            logger.warning(f"{analyzer.model_name} 시간 예산 소진. 휴리스틱 결과 사용")
+            return await analyzer.analyze_degraded(text, **kwargs)
+        
+        if asyncio.iscoroutinefunction(analyzer.analyze):
+            call = analyzer.analyze(text, deadline=deadline, **kwargs)
+        else:
+            call = asyncio.to_thread(analyzer.analyze, text, deadline=deadline, **kwargs)
+        
+        try:
+            return await asyncio.wait_for(call, timeout=remaining)
+        except asyncio.TimeoutError:
+            logger.warning(f"{analyzer.model_name} 시간 예산 초과. 휴리스틱 결과 사용")
+            return await analyzer.analyze_degraded(text, **kwargs)
+    
     async def _analyze_credibility(
         self, 
         text: str, 
-        video_metadata: Optional[Dict[str, Any]] = None
-    ) -> CredibilityScore:
+        video_metadata: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None
+    ) -> CredibilityAnalysis:
         """신뢰도 분석"""
         try:
             if video_metadata:
-                return await self.credibility_analyzer.analyze(text, video_metadata=video_metadata)
+                return await self._call_analyzer(
+                    self.credibility_analyzer, text, deadline, video_metadata=video_metadata
+                )
             else:
-                return await self.credibility_analyzer.analyze(text)
+                return await self._call_analyzer(self.credibility_analyzer, text, deadline)
         except Exception as e:
             logger.error(f"신뢰도 분석 실패: {e}")
             raise
     
-    async def _analyze_bias(self, text: str) -> BiasAnalysis:
+    async def _analyze_bias(self, text: str, deadline: Optional[float] = None) -> BiasAnalysis:
         """편향 감지 분석"""
         try:
-            return await self.bias_detector.analyze(text)
+            return await self._call_analyzer(self.bias_detector, text, deadline)
         except Exception as e:
             logger.error(f"편향 감지 실패: {e}")
             raise
     
-    async def _analyze_facts(self, text: str) -> FactCheckResult:
+    async def _analyze_facts(self, text: str, deadline: Optional[float] = None) -> FactCheckAnalysis:
         """팩트 체크"""
         try:
-            return await self.fact_checker.analyze(text)
+            return await self._call_analyzer(self.fact_checker, text, deadline)
         except Exception as e:
             logger.error(f"팩트 체크 실패: {e}")
             raise
     
-    async def _analyze_sentiment(self, text: str) -> SentimentAnalysis:
+    async def _analyze_sentiment(self, text: str, deadline: Optional[float] = None) -> SentimentAnalysis:
         """감정 분석"""
         try:
-            return await self.sentiment_analyzer.analyze(text)
+            return await self._call_analyzer(self.sentiment_analyzer, text, deadline)
         except Exception as e:
             logger.error(f"감정 분석 실패: {e}")
             raise
     
-    async def _classify_content(self, text: str) -> ContentClassification:
+    async def _classify_content(self, text: str, deadline: Optional[float] = None) -> ContentClassification:
         """콘텐츠 분류"""
         try:
-            return await self.content_classifier.analyze(text)
+            return await self._call_analyzer(self.content_classifier, text, deadline)
         except Exception as e:
             logger.error(f"콘텐츠 분류 실패: {e}")
             raise
     
+    async def analyze_comments(
+        self,
+        comments: List[Any],
+        top_k: int = 5,
+        deadline: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """댓글 전체를 감정 분석 모델로 배치 분석하고 좋아요 수로 가중 집계합니다.
+        
+        각 댓글의 가중치는 1 + log(1 + like_count)로, 인기 댓글을 더 반영하되
+        소수의 댓글이 전체 분포를 독점하지 않도록 합니다.
+        마감 시각을 넘기면 남은 댓글은 휴리스틱 결과로 집계하고 degraded로 표시합니다.
+        """
+        entries = []
+        for comment in comments:
+            if isinstance(comment, dict):
+                text, likes = comment.get("text", ""), comment.get("like_count", 0)
+            else:
+                text, likes = getattr(comment, "text", ""), getattr(comment, "like_count", 0)
+            if text and text.strip():
+                entries.append((text, max(0, likes or 0)))
+        
+        if not entries:
+            return None
+        
+        try:
+            sentiments, forward_passes = await asyncio.to_thread(
+                self.sentiment_analyzer.analyze_batch_with_passes, [text for text, _ in entries], deadline
+            )
+        except Exception as e:
+            logger.error(f"댓글 감정 분석 실패: {e}")
+            return None
+        
+        weights = [1.0 + math.log1p(likes) for _, likes in entries]
+        total_weight = sum(weights)
+        
+        distribution = {"positive": 0.0, "negative": 0.0, "neutral": 0.0}
+        weighted_sentiment = 0.0
+        for sentiment, weight in zip(sentiments, weights):
+            for emotion in distribution:
+                distribution[emotion] += sentiment.emotion_breakdown.get(emotion, 0.0) * weight
+            weighted_sentiment += sentiment.overall_sentiment * weight
+        
+        distribution = {emotion: value / total_weight for emotion, value in distribution.items()}
+        weighted_sentiment /= total_weight
+        
+        # 가중 평균에서 가장 멀리 떨어진 댓글을 이상치로 선정 (가중치가 클수록 우선)
+        ranked = sorted(
+            range(len(entries)),
+            key=lambda i: abs(sentiments[i].overall_sentiment - weighted_sentiment) * weights[i],
+            reverse=True
+        )
+        outliers = [
+            {
+                "text": entries[i][0][:200],
+                "like_count": entries[i][1],
+                "sentiment": sentiments[i].overall_sentiment,
+                "dominant_emotion": sentiments[i].dominant_emotion
+            }
+            for i in ranked[:top_k]
+        ]
+        
+        return {
+            "total_comments": len(entries),
+            "distribution": distribution,
+            "weighted_sentiment": weighted_sentiment,
+            "outliers": outliers,
+            "forward_passes": forward_passes,
+            "degraded": any(sentiment.degraded for sentiment in sentiments)
+        }
+    
     async def _process_results(
         self,
         results: List[Any],
@@ -202,17 +357,21 @@ class AIModelService:
         fact_check_result = None
         sentiment_analysis = None
         content_classification = None
+        warnings = []
         
         for i, result in enumerate(results):
             if isinstance(result, Exception):
                 logger.error(f"분석 {i} 실패: {result}")
                 continue
+            
+            if getattr(result, "degraded", False):
+                warnings.append(f"시간 예산 초과로 휴리스틱 결과 사용: {type(result).__name__}")
                 
-            if isinstance(result, CredibilityScore):
+            if isinstance(result, CredibilityAnalysis):
                 credibility_score = result
             elif isinstance(result, BiasAnalysis):
                 bias_analysis = result
-            elif isinstance(result, FactCheckResult):
+            elif isinstance(result, FactCheckAnalysis):
                 fact_check_result = result
             elif isinstance(result, SentimentAnalysis):
                 sentiment_analysis = result
@@ -233,7 +392,8 @@ class AIModelService:
             created_at=start_datetime,
             completed_at=end_time,
             processing_time=processing_time,
-            model_version="1.0.0"
+            model_version=self.model_version,
+            warnings=warnings
         )
         
         return analysis_result
@@ -254,6 +414,38 @@ class AIModelService:
             logger.error(f"모델 상태 확인 실패: {e}")
             return {"error": str(e)}
     
+    def get_inference_capacity(self) -> Dict[str, Any]:
+        """분석기별 동시 추론 가능 수(복제본 수)와 전체 분석 기준 동시 처리 가능 수를 반환합니다."""
+        per_model = {
+            "credibility_analyzer": self.credibility_analyzer.replica_count,
+            "bias_detector": self.bias_detector.replica_count,
+            "fact_checker": self.fact_checker.replica_count,
+            "sentiment_analyzer": self.sentiment_analyzer.replica_count,
+            "content_classifier": self.content_classifier.replica_count
+        }
+        return {
+            "per_model": per_model,
+            # 전체 분석은 모든 분석기를 거치므로 복제본이 가장 적은 분석기가 병목
+            "concurrent_analyses": max(1, min(per_model.values()))
+        }
+    
+    def get_model_memory(self) -> Dict[str, int]:
+        """분석기별 모델 가중치 상주 메모리(바이트)를 반환합니다."""
+        memory = {}
+        for model_name, model in [
+            ("credibility_analyzer", self.credibility_analyzer),
+            ("bias_detector", self.bias_detector),
+            ("fact_checker", self.fact_checker),
+            ("sentiment_analyzer", self.sentiment_analyzer),
+            ("content_classifier", self.content_classifier)
+        ]:
+            try:
+                memory[model_name] = model.resident_bytes()
+            except Exception as e:
+                logger.warning(f"{model_name} 메모리 측정 실패: {e}")
+                memory[model_name] = 0
+        return memory
+    
     async def reload_models(self) -> Dict[str, bool]:
         """모든 AI 모델을 다시 로드합니다."""
         try:
@@ -4,8 +4,13 @@ YouTube 영상 분석을 조율하고 관리합니다.
 """
 
 import asyncio
+import hashlib
+import itertools
+import os
+import time
+from collections import Counter, OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from uuid import uuid4
 
 from app.core.logging import get_logger
@@ -13,34 +18,96 @@ from app.core.config import get_settings
 from app.services.youtube import YouTubeService
 from app.services.ai_models import ai_model_service
 from app.services.cache import cache_service
+from app.services.storage import analysis_store
 from app.models.analysis import AnalysisResult, AnalysisMetadata, AnalysisType, AnalysisStatus
 from app.models.youtube import YouTubeVideoMetadata
+from app.utils.concurrency import AdaptiveConcurrencyLimiter
+from app.utils.metrics import RollingCounter, RollingHistogram, EWMA
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+# 요청 우선순위별 큐 순위 (작을수록 먼저 처리)
+PRIORITY_RANKS = {"high": 0, "normal": 1, "low": 2}
+
+# 분석 파이프라인 단계 순서: 수집 -> 텍스트 준비 -> 추론 -> 결과 정리/전송
+STAGES = ("collect", "prepare", "infer", "persist")
+STAGE_NEXT = dict(zip(STAGES, STAGES[1:]))
+
+# 다음 단계로 진행할 수 있는 상태
+ACTIVE_STATUSES = (AnalysisStatus.PENDING, AnalysisStatus.PROCESSING)
+
+# 댓글 감정 분석을 함께 수행하는 분석 종류
+COMMENT_ANALYSIS_TYPES = ("full", "sentiment")
+
+# 더 이상 바뀌지 않는 최종 상태
+TERMINAL_STATUSES = (AnalysisStatus.COMPLETED, AnalysisStatus.FAILED, AnalysisStatus.CANCELLED)
+
 
 class AnalysisService:
     """영상 분석을 조율하는 서비스"""
 
     def __init__(self):
         self.youtube_service = YouTubeService(cache_service)
+        # 메모리에는 진행 중인 분석과 최근 끝난 분석(크기 제한)만 두고, 전체 기록은 저장소에서 조회
         self.active_analyses: Dict[str, Dict[str, Any]] = {}
-        self.analysis_queue: List[str] = []
-        self.max_concurrent_analyses = 3
+        self.recent_analyses: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.hot_cache_size = settings.ANALYSIS_HOT_CACHE_SIZE
+        self.store = analysis_store
+        self._cleanup_task: Optional[asyncio.Task] = None
+        # 단계별 입력 큐: (우선순위 순위, 등록 순서, 분석 ID). 취소된 항목은 꺼낼 때 건너뜀
+        # 첫 단계 큐는 요청을 모두 받아야 하므로 무제한, 이후 단계는 크기를 제한해 앞 단계가 지나치게 앞서지 않게 함
+        self.stage_queues: Dict[str, "asyncio.PriorityQueue[Tuple[int, int, str]]"] = {
+            stage: asyncio.PriorityQueue(maxsize=0 if stage == STAGES[0] else settings.ANALYSIS_STAGE_QUEUE_SIZE)
+            for stage in STAGES
+        }
+        self.analysis_queue = self.stage_queues[STAGES[0]]
+        self._queue_seq = itertools.count()
+        self.analysis_tasks: Dict[str, asyncio.Task] = {}  # 실행 중인 분석 작업 (취소용)
+        # 동시 분석 수: 모델 복제본 용량에서 시작해 AI 분석 지연 시간으로 자동 조정
+        capacity = ai_model_service.get_inference_capacity()["concurrent_analyses"]
+        self.concurrency_limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=capacity,
+            max_limit=settings.ANALYSIS_MAX_CONCURRENCY or max(capacity, os.cpu_count() or 1)
+        )
+        # 단계별 워커 풀: 추론 단계는 현재 한도를 용량으로 하는 세마포어(슬롯)로 동시 실행 수를 제한
+        self.workers: List[asyncio.Task] = []
+        self.stage_workers: Dict[str, int] = {stage: 0 for stage in STAGES}
+        self.stage_running: Dict[str, int] = {stage: 0 for stage in STAGES}
+        self.slots_in_use = 0  # 추론 슬롯을 가진 워커 수 (큐를 기다리는 워커 포함)
+        self._slot_released = asyncio.Condition()
         self.websocket_manager = None  # WebSocket 매니저 참조
+        
+        # 통계: 상태 전환마다 갱신되는 상태별 개수와 최근 구간 집계 (조회 비용이 보관 기록 수와 무관)
+        self.status_counts: Counter = Counter()
+        self.completed_counter = RollingCounter(window=60.0, slots=60)  # 분당 완료 수
+        self.failed_counter = RollingCounter(window=60.0, slots=60)  # 분당 실패 수
+        self.processing_time_ewma = EWMA(half_life=60.0)
+        self.recent_latency = RollingHistogram(window=300.0, slots=10)  # 최근 5분 처리 시간 분포
+        self.result_cache_hits = 0
+        self.result_cache_misses = 0
+
+    @property
+    def max_concurrent_analyses(self) -> int:
+        """현재 동시 분석 한도"""
+        return self.concurrency_limiter.limit
 
     def set_websocket_manager(self, manager):
         """WebSocket 매니저를 설정합니다."""
         self.websocket_manager = manager
         logger.info("WebSocket 매니저가 분석 서비스에 연결되었습니다.")
 
-    async def _broadcast_update(self, analysis_id: str, update_data: Dict[str, Any]):
+    async def _broadcast_update(
+        self, 
+        analysis_id: str, 
+        update_data: Dict[str, Any], 
+        message_type: str = "analysis_update"
+    ):
         """WebSocket을 통해 분석 업데이트를 브로드캐스트합니다."""
         if self.websocket_manager:
             try:
                 message = {
-                    "type": "analysis_update",
+                    "type": message_type,
                     "analysis_id": analysis_id,
                     "data": update_data,
                     "timestamp": datetime.utcnow().isoformat()
@@ -69,7 +136,8 @@ class AnalysisService:
             analysis_data["updated_at"] = datetime.utcnow()
             
             if status:
-                analysis_data["status"] = status
+                self._set_status(analysis_data, status)
+                await self._persist(analysis_data)
             
             # WebSocket으로 업데이트 전송
             await self._broadcast_update(analysis_id, {
@@ -79,20 +147,119 @@ class AnalysisService:
                 "updated_at": analysis_data["updated_at"].isoformat()
             })
 
+    def _set_status(self, analysis_data: Dict[str, Any], status: AnalysisStatus):
+        """분석 상태를 바꾸고 상태별 개수와 완료/실패 집계를 갱신합니다."""
+        previous = analysis_data.get("status")
+        if previous == status:
+            return
+        
+        if previous is not None:
+            self.status_counts[previous] -= 1
+        self.status_counts[status] += 1
+        analysis_data["status"] = status
+        
+        if status in TERMINAL_STATUSES:
+            # 끝난 분석은 진행 중 목록에서 최근 분석 캐시로 이동
+            self.active_analyses.pop(analysis_data["id"], None)
+            self._remember(analysis_data)
+        
+        if status == AnalysisStatus.COMPLETED:
+            elapsed = (datetime.utcnow() - analysis_data["created_at"]).total_seconds()
+            self.completed_counter.add()
+            self.processing_time_ewma.update(elapsed)
+            self.recent_latency.add(elapsed)
+        elif status == AnalysisStatus.FAILED:
+            self.failed_counter.add()
+
+    def _remember(self, analysis_data: Dict[str, Any]):
+        """끝난 분석을 최근 분석 캐시에 넣습니다. 한도를 넘으면 오래 조회되지 않은 것부터 제거됩니다."""
+        self.recent_analyses[analysis_data["id"]] = analysis_data
+        self.recent_analyses.move_to_end(analysis_data["id"])
+        while len(self.recent_analyses) > self.hot_cache_size:
+            self.recent_analyses.popitem(last=False)
+
+    async def _lookup(self, analysis_id: str) -> Optional[Dict[str, Any]]:
+        """진행 중 목록 -> 최근 분석 캐시 -> 저장소(ID 인덱스) 순으로 분석을 찾습니다."""
+        analysis_data = self.active_analyses.get(analysis_id)
+        if analysis_data is not None:
+            return analysis_data
+        
+        analysis_data = self.recent_analyses.get(analysis_id)
+        if analysis_data is not None:
+            self.recent_analyses.move_to_end(analysis_id)
+            return analysis_data
+        
+        analysis_data = await self.store.get(analysis_id)
+        if analysis_data is not None:
+            self._remember(analysis_data)
+        return analysis_data
+
+    async def initialize(self):
+        """저장소에 연결하고 상태별 개수를 복원한 뒤 주기적 정리를 시작합니다."""
+        await self.store.connect()
+        if not self.store.is_connected:
+            return
+        
+        # 이전 실행에서 끝나지 못한 분석은 실패로 기록
+        interrupted = await self.store.mark_interrupted(
+            [AnalysisStatus.PENDING.value, AnalysisStatus.PROCESSING.value], AnalysisStatus.FAILED.value
+        )
+        if interrupted:
+            logger.warning(f"재시작으로 중단된 분석 {interrupted}개를 실패로 표시했습니다.")
+        
+        for status, count in (await self.store.count_by_status()).items():
+            self.status_counts[AnalysisStatus(status)] += count
+        
+        if self._cleanup_task is None or self._cleanup_task.done():
+            self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+
+    async def _cleanup_loop(self):
+        """보관 기간이 지난 분석을 주기적으로 정리합니다."""
+        try:
+            while True:
+                await asyncio.sleep(settings.ANALYSIS_CLEANUP_INTERVAL)
+                await self.cleanup_completed_analyses(settings.ANALYSIS_RETENTION_HOURS)
+        except asyncio.CancelledError:
+            pass
+
+    async def _persist(self, analysis_data: Dict[str, Any]):
+        """분석 기록을 저장소에 저장합니다. 상태가 바뀔 때만 호출합니다."""
+        if self.store.is_connected:
+            await self.store.save(analysis_data)
+
+    async def get_video_analyses(self, video_id: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """영상 ID의 분석 기록을 최신순으로 조회합니다. 진행 중인 분석이 앞에 옵니다."""
+        in_progress = [a for a in self.active_analyses.values() if a.get("video_id") == video_id]
+        stored = await self.store.find_by_video(video_id, limit)
+        seen = {a["id"] for a in in_progress}
+        return (in_progress + [a for a in stored if a["id"] not in seen])[:limit]
+
     async def start_analysis(
         self,
         video_url: str,
         analysis_types: List[str],
-        priority: str = "normal"
+        priority: str = "normal",
+        deadline_seconds: Optional[float] = None,
+        force_refresh: bool = False
     ) -> str:
-        """분석을 시작합니다."""
+        """분석을 시작합니다.
+        
+        deadline_seconds가 주어지면 요청 시점부터의 시간 예산으로 AI 분석에 전달됩니다.
+        같은 영상·분석 종류·모델 버전·콘텐츠의 이전 결과가 있으면 모델을 다시 실행하지 않고 재사용하며,
+        force_refresh=True이면 항상 새로 분석합니다.
+        """
         try:
             # 분석 ID 생성
             analysis_id = str(uuid4())
             
+            # 시간 예산을 마감 시각으로 변환 (time.monotonic 기준)
+            budget = deadline_seconds or settings.ANALYSIS_DEADLINE_SECONDS
+            deadline = time.monotonic() + budget if budget else None
+            
             # 분석 작업 생성
             analysis_data = {
                 "id": analysis_id,
+                "video_id": self._extract_video_id(video_url),
                 "video_url": video_url,
                 "analysis_types": analysis_types,
                 "priority": priority,
@@ -104,20 +271,30 @@ class AnalysisService:
                 "estimated_completion": None,
                 "video_metadata": None,
                 "results": None,
-                "error": None
+                "error": None,
+                "deadline": deadline,
+                "force_refresh": force_refresh
             }
             
             # 저장소에 저장
             self.active_analyses[analysis_id] = analysis_data
+            self.status_counts[AnalysisStatus.PENDING] += 1
+            await self._persist(analysis_data)
             
-            # 우선순위에 따라 큐에 추가
-            if priority == "high":
-                self.analysis_queue.insert(0, analysis_id)
+            # 영상 정보가 캐시에 있으면 큐를 거치지 않고 이전 결과를 바로 확인
+            if analysis_data["video_id"] and not force_refresh:
+                cached_metadata = await cache_service.get(f"video_metadata:{analysis_data['video_id']}")
             else:
-                self.analysis_queue.append(analysis_id)
-            
-            # 백그라운드에서 분석 시작
-            asyncio.create_task(self._process_analysis_queue())
+                cached_metadata = None
+            if cached_metadata and await self._try_cached_result(analysis_data, cached_metadata):
+                logger.info(f"분석 요청 등록 (이전 결과 재사용): {analysis_id} - {video_url}")
+                return analysis_id
+            
+            # 우선순위에 따라 큐에 추가 (같은 우선순위는 등록 순서대로)
+            self._ensure_workers()
+            self.analysis_queue.put_nowait(
+                (PRIORITY_RANKS.get(priority, PRIORITY_RANKS["normal"]), next(self._queue_seq), analysis_id)
+            )
             
             logger.info(f"분석 요청 등록: {analysis_id} - {video_url}")
             return analysis_id
@@ -128,11 +305,11 @@ class AnalysisService:
 
     async def get_analysis_status(self, analysis_id: str) -> Optional[Dict[str, Any]]:
         """분석 상태를 조회합니다."""
-        return self.active_analyses.get(analysis_id)
+        return await self._lookup(analysis_id)
 
     async def get_analysis_result(self, analysis_id: str) -> Optional[AnalysisResult]:
         """분석 결과를 조회합니다."""
-        analysis_data = self.active_analyses.get(analysis_id)
+        analysis_data = await self._lookup(analysis_id)
         if not analysis_data or analysis_data["status"] != AnalysisStatus.COMPLETED:
             return None
             
@@ -149,103 +326,260 @@ class AnalysisService:
 
     async def cancel_analysis(self, analysis_id: str) -> bool:
         """분석을 취소합니다."""
-        if analysis_id not in self.active_analyses:
-            return False
-            
-        analysis_data = self.active_analyses[analysis_id]
-        if analysis_data["status"] in [AnalysisStatus.COMPLETED, AnalysisStatus.FAILED, AnalysisStatus.CANCELLED]:
+        # 진행 중 목록에 없으면 이미 끝났거나 없는 분석
+        analysis_data = self.active_analyses.get(analysis_id)
+        if analysis_data is None or analysis_data["status"] in TERMINAL_STATUSES:
             return False
             
-        analysis_data["status"] = AnalysisStatus.CANCELLED
+        self._set_status(analysis_data, AnalysisStatus.CANCELLED)
         analysis_data["message"] = "사용자에 의해 취소되었습니다."
         analysis_data["updated_at"] = datetime.utcnow()
+        await self._persist(analysis_data)
         
-        # 큐에서 제거
-        if analysis_id in self.analysis_queue:
-            self.analysis_queue.remove(analysis_id)
+        # 대기 중이면 워커가 큐에서 꺼낼 때 취소 상태를 보고 건너뜀
+        # 실행 중이면 작업을 취소해 남은 분석기 실행을 중단
+        task = self.analysis_tasks.pop(analysis_id, None)
+        if task is not None and not task.done():
+            task.cancel()
             
         logger.info(f"분석 취소: {analysis_id}")
         return True
 
-    async def _process_analysis_queue(self):
-        """분석 큐를 처리합니다."""
-        while self.analysis_queue:
-            # 동시 실행 제한 확인
-            running_count = sum(
-                1 for a in self.active_analyses.values() 
-                if a["status"] == AnalysisStatus.PROCESSING
-            )
-            
-            if running_count >= self.max_concurrent_analyses:
-                await asyncio.sleep(1)
-                continue
+    def _ensure_workers(self):
+        """단계별 워커가 실행 중이 아니면 시작합니다.
+        
+        추론 단계 워커 수는 동시 분석 한도의 최댓값이며 실제 동시 실행 수는 슬롯으로 제한합니다.
+        """
+        self.workers = [worker for worker in self.workers if not worker.done()]
+        if self.workers:
+            return
+        
+        for stage, (count, gated) in {
+            "collect": (settings.ANALYSIS_FETCH_CONCURRENCY, False),
+            # 텍스트 준비는 이벤트 루프에서 실행되는 가벼운 작업이므로 워커 하나로 충분
+            "prepare": (1, False),
+            "infer": (self.concurrency_limiter.max_limit, True),
+            "persist": (settings.ANALYSIS_PERSIST_CONCURRENCY, False)
+        }.items():
+            self.stage_workers[stage] = max(1, count)
+            for _ in range(self.stage_workers[stage]):
+                self.workers.append(asyncio.create_task(self._stage_worker(stage, gated)))
+
+    async def _acquire_slot(self):
+        """추론 슬롯을 얻을 때까지 기다립니다. 슬롯 수는 자동 조정되는 동시 분석 한도를 따릅니다."""
+        async with self._slot_released:
+            await self._slot_released.wait_for(lambda: self.slots_in_use < self.max_concurrent_analyses)
+            self.slots_in_use += 1
+
+    async def _release_slot(self):
+        """추론 슬롯을 반납하고 대기 중인 워커를 깨웁니다."""
+        async with self._slot_released:
+            self.slots_in_use -= 1
+            # 한도가 늘었을 수 있으므로 모든 대기 워커가 다시 확인하도록 함
+            self._slot_released.notify_all()
+
+    async def _stage_worker(self, stage: str, gated: bool = False):
+        """단계 입력 큐에서 분석을 꺼내 처리하고 다음 단계 큐로 넘기는 상주 워커
+        
+        다음 단계 큐가 가득 차면 넘길 때까지 기다리므로 앞 단계가 지나치게 앞서 나가지 않습니다.
+        """
+        in_queue = self.stage_queues[stage]
+        next_stage = STAGE_NEXT.get(stage)
+        handler = getattr(self, f"_stage_{stage}")
+        try:
+            while True:
+                forward = False
+                if gated:
+                    await self._acquire_slot()
+                try:
+                    entry = await in_queue.get()
+                    analysis_data = self.active_analyses.get(entry[2])
+                    if analysis_data is not None and analysis_data["status"] in ACTIVE_STATUSES:
+                        forward = await self._run_stage(stage, entry[2], handler)
+                    # 대기 중 취소/실패/정리된 분석은 건너뜀
+                finally:
+                    if gated:
+                        await self._release_slot()
                 
-            # 큐에서 분석 ID 가져오기
-            analysis_id = self.analysis_queue.pop(0)
-            
-            # 분석 실행
-            asyncio.create_task(self._execute_analysis(analysis_id))
+                if forward and next_stage is not None:
+                    await self.stage_queues[next_stage].put(entry)
+        except asyncio.CancelledError:
+            pass
 
-    async def _execute_analysis(self, analysis_id: str):
-        """실제 분석을 실행합니다."""
+    async def _run_stage(self, stage: str, analysis_id: str, handler) -> bool:
+        """분석 하나의 단계를 취소 가능한 작업으로 실행합니다. 다음 단계로 넘길 수 있으면 True"""
+        task = asyncio.create_task(handler(analysis_id))
+        self.analysis_tasks[analysis_id] = task
+        self.stage_running[stage] += 1
         try:
+            # 처리기가 False를 반환하면 (예: 이전 결과로 완료) 다음 단계로 넘기지 않음
+            return await asyncio.shield(task) is not False
+        except asyncio.CancelledError:
+            # 분석만 취소된 경우 워커는 계속 동작 (분석 취소 직후 워커도 취소되면 워커 취소를 전파)
+            if not task.cancelled() or asyncio.current_task().cancelling():
+                raise
+            return False
+        except Exception as e:
+            await self._fail_analysis(analysis_id, e)
+            return False
+        finally:
+            self.stage_running[stage] -= 1
+            if self.analysis_tasks.get(analysis_id) is task:
+                del self.analysis_tasks[analysis_id]
+
+    @property
+    def running_count(self) -> int:
+        """모델 추론 중인 분석 수"""
+        return self.stage_running["infer"]
+
+    async def shutdown(self):
+        """분석 워커와 실행 중인 분석을 중지하고 저장소 연결을 닫습니다."""
+        for task in list(self.analysis_tasks.values()):
+            task.cancel()
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+        
+        if self._cleanup_task is not None:
+            self._cleanup_task.cancel()
+            self._cleanup_task = None
+        await self.store.disconnect()
+
+    def _record_analysis_latency(self, elapsed: float):
+        """AI 분석 소요 시간을 동시 실행 한도 조정에 반영합니다."""
+        self.concurrency_limiter.record(elapsed, in_flight=self.running_count)
+
+    async def _stage_collect(self, analysis_id: str):
+        """1단계: YouTube 영상 정보를 수집합니다."""
+        analysis_data = self.active_analyses[analysis_id]
+        
+        # 상태를 처리 중으로 변경하고 WebSocket으로 전송
+        await self._update_analysis_progress(
+            analysis_id, 10, "영상 데이터를 수집하고 있습니다...", AnalysisStatus.PROCESSING
+        )
+        
+        video_metadata = await self._collect_video_data(analysis_id)
+        if not video_metadata:
+            raise Exception("영상 정보 수집 실패")
+        
+        if await self._try_cached_result(analysis_data, video_metadata):
+            return False
+        
+        analysis_data["video_metadata"] = video_metadata
+        await self._update_analysis_progress(
+            analysis_id, 20, "AI 분석 순서를 기다리고 있습니다..."
+        )
+
+    async def _stage_prepare(self, analysis_id: str):
+        """2단계: 분석할 텍스트를 준비합니다."""
+        analysis_data = self.active_analyses[analysis_id]
+        analysis_data["text_content"] = self._prepare_text_content(analysis_data["video_metadata"])
+
+    async def _stage_infer(self, analysis_id: str):
+        """3단계: AI 분석을 수행합니다. 분석기별 부분 결과는 완료 즉시 전송합니다."""
+        analysis_data = self.active_analyses[analysis_id]
+        await self._update_analysis_progress(
+            analysis_id, 30, "AI 모델로 분석을 수행하고 있습니다..."
+        )
+        
+        ai_start_time = time.monotonic()
+        analysis_data["results"] = await self._perform_ai_analysis(
+            analysis_data["video_metadata"], analysis_data["analysis_types"], analysis_id,
+            deadline=analysis_data.get("deadline"),
+            text_content=analysis_data.pop("text_content", None)
+        )
+        self._record_analysis_latency(time.monotonic() - ai_start_time)
+
+    async def _stage_persist(self, analysis_id: str):
+        """4단계: 결과를 정리하고 완료 상태를 전송합니다."""
+        analysis_data = self.active_analyses[analysis_id]
+        await self._update_analysis_progress(
+            analysis_id, 80, "결과를 정리하고 있습니다..."
+        )
+        
+        # 메타데이터 생성 (완료 상태와 함께 저장되도록 먼저 생성)
+        self._finalize(analysis_data)
+        
+        # 완료 상태로 업데이트하고 WebSocket으로 전송
+        await self._update_analysis_progress(
+            analysis_id, 100, "분석이 완료되었습니다.", AnalysisStatus.COMPLETED
+        )
+        
+        await self._cache_result(analysis_data)
+        logger.info(f"분석 완료: {analysis_id}")
+
+    def _finalize(self, analysis_data: Dict[str, Any]):
+        """완료 시각과 분석 메타데이터를 기록합니다."""
+        analysis_data["completed_at"] = datetime.utcnow()
+        analysis_data["metadata"] = AnalysisMetadata(
+            analysis_type=",".join(analysis_data["analysis_types"]),
+            processing_time=(analysis_data["completed_at"] - analysis_data["created_at"]).total_seconds(),
+            started_at=analysis_data["created_at"],
+            completed_at=analysis_data["completed_at"],
+            video_metadata=analysis_data["video_metadata"]
+        )
+
+    def _result_cache_key(self, analysis_data: Dict[str, Any], video_metadata: Dict[str, Any]) -> str:
+        """영상 ID, 분석 종류, 모델 버전, 제목/설명/자막 지문으로 결과 캐시 키를 만듭니다."""
+        fingerprint = hashlib.sha256("\x00".join(
+            str(video_metadata.get(field) or "") for field in ("title", "description", "transcript")
+        ).encode("utf-8")).hexdigest()[:16]
+        analysis_types = ",".join(sorted(analysis_data["analysis_types"]))
+        return f"analysis_result:{analysis_data['video_id']}:{analysis_types}:{ai_model_service.model_version}:{fingerprint}"
+
+    async def _try_cached_result(self, analysis_data: Dict[str, Any], video_metadata: Dict[str, Any]) -> bool:
+        """이전 분석 결과가 있으면 그 결과로 분석을 완료하고 True를 반환합니다."""
+        if analysis_data.get("force_refresh") or settings.ANALYSIS_RESULT_CACHE_TTL <= 0 or not analysis_data.get("video_id"):
+            return False
+        
+        cache_key = self._result_cache_key(analysis_data, video_metadata)
+        if analysis_data.get("result_cache_key") == cache_key:
+            return False  # 같은 키로 이미 확인함
+        analysis_data["result_cache_key"] = cache_key
+        
+        cached = await cache_service.get(cache_key)
+        if not cached:
+            self.result_cache_misses += 1
+            return False
+        
+        self.result_cache_hits += 1
+        analysis_data["video_metadata"] = video_metadata
+        analysis_data["results"] = cached["results"]
+        analysis_data["cached_from"] = cached["analysis_id"]
+        self._finalize(analysis_data)
+        await self._update_analysis_progress(
+            analysis_data["id"], 100, "이전 분석 결과를 재사용했습니다.", AnalysisStatus.COMPLETED
+        )
+        logger.info(f"이전 분석 결과 재사용: {analysis_data['id']} <- {cached['analysis_id']}")
+        return True
+
+    async def _cache_result(self, analysis_data: Dict[str, Any]):
+        """경고 없이 끝난 분석 결과를 영상 단위 결과 캐시에 저장합니다."""
+        results = analysis_data.get("results") or {}
+        if settings.ANALYSIS_RESULT_CACHE_TTL <= 0 or not analysis_data.get("video_id"):
+            return
+        # 실패/시간 예산 초과(휴리스틱)가 섞인 결과는 재사용하지 않음
+        if results.get("metadata", {}).get("warnings"):
+            return
+        
+        await cache_service.set(
+            analysis_data.get("result_cache_key") or self._result_cache_key(analysis_data, analysis_data["video_metadata"]),
+            {"analysis_id": analysis_data["id"], "results": results, "cached_at": datetime.utcnow()},
+            ttl=settings.ANALYSIS_RESULT_CACHE_TTL
+        )
+
+    async def _fail_analysis(self, analysis_id: str, error: Exception):
+        """분석을 실패 상태로 바꾸고 WebSocket으로 전송합니다."""
+        logger.error(f"분석 실행 실패: {analysis_id} - {error}")
+        if analysis_id in self.active_analyses:
             analysis_data = self.active_analyses[analysis_id]
+            analysis_data["error"] = str(error)
+            analysis_data.pop("text_content", None)
             
-            # 상태를 처리 중으로 변경하고 WebSocket으로 전송
-            await self._update_analysis_progress(
-                analysis_id, 10, "영상 데이터를 수집하고 있습니다...", AnalysisStatus.PROCESSING
-            )
-            
-            # 1. YouTube 영상 정보 수집
-            video_metadata = await self._collect_video_data(analysis_id)
-            if not video_metadata:
-                raise Exception("영상 정보 수집 실패")
-                
-            analysis_data["video_metadata"] = video_metadata
             await self._update_analysis_progress(
-                analysis_id, 30, "AI 모델로 분석을 수행하고 있습니다..."
-            )
-            
-            # 2. AI 분석 수행
-            analysis_result = await self._perform_ai_analysis(
-                video_metadata, analysis_data["analysis_types"]
+                analysis_id, 0, f"분석 실패: {str(error)}", AnalysisStatus.FAILED
             )
-            
-            await self._update_analysis_progress(
-                analysis_id, 80, "결과를 정리하고 있습니다..."
-            )
-            
-            # 3. 결과 정리
-            analysis_data["results"] = analysis_result
-            analysis_data["completed_at"] = datetime.utcnow()
-            
-            # 완료 상태로 업데이트하고 WebSocket으로 전송
-            await self._update_analysis_progress(
-                analysis_id, 100, "분석이 완료되었습니다.", AnalysisStatus.COMPLETED
-            )
-            
-            # 메타데이터 생성
-            metadata = AnalysisMetadata(
-                analysis_type=",".join(analysis_data["analysis_types"]),
-                processing_time=(analysis_data["completed_at"] - analysis_data["created_at"]).total_seconds(),
-                started_at=analysis_data["created_at"],
-                completed_at=analysis_data["completed_at"],
-                video_metadata=video_metadata
-            )
-            analysis_data["metadata"] = metadata
-            
-            logger.info(f"분석 완료: {analysis_id}")
-            
-        except Exception as e:
-            logger.error(f"분석 실행 실패: {analysis_id} - {e}")
-            if analysis_id in self.active_analyses:
-                analysis_data = self.active_analyses[analysis_id]
-                analysis_data["error"] = str(e)
-                
-                # 실패 상태로 업데이트하고 WebSocket으로 전송
-                await self._update_analysis_progress(
-                    analysis_id, 0, f"분석 실패: {str(e)}", AnalysisStatus.FAILED
-                )
 
     async def _collect_video_data(self, analysis_id: str) -> Optional[Dict[str, Any]]:
         """YouTube 영상 데이터를 수집합니다."""
@@ -282,83 +616,171 @@ class AnalysisService:
     async def _perform_ai_analysis(
         self,
         video_metadata: Dict[str, Any],
-        analysis_types: List[str]
+        analysis_types: List[str],
+        analysis_id: Optional[str] = None,
+        deadline: Optional[float] = None,
+        text_content: Optional[str] = None
     ) -> Dict[str, Any]:
-        """AI 모델로 분석을 수행합니다."""
+        """AI 모델로 분석을 수행합니다.
+        
+        분석기 결과는 완료되는 순서대로 받아 WebSocket 구독자에게 부분 결과로 전송합니다.
+        """
         try:
-            # 분석할 텍스트 준비
-            text_content = self._prepare_text_content(video_metadata)
+            # 분석할 텍스트 준비 (준비 단계를 거치지 않은 경우)
+            if text_content is None:
+                text_content = self._prepare_text_content(video_metadata)
+            analysis_type = "full" if "full" in analysis_types else ",".join(analysis_types)
+            start_time = datetime.utcnow()
             
-            # AI 분석 실행
-            analysis_result = await ai_model_service.analyze_content(
+            # AI 분석 실행 (분석기별 스트리밍)
+            results = {}
+            raw_results = []
+            async for name, result in ai_model_service.analyze_content_stream(
                 text=text_content,
                 video_metadata=video_metadata,
-                analysis_type="full" if "full" in analysis_types else ",".join(analysis_types)
-            )
-            
-            # 결과를 딕셔너리로 변환
-            results = {}
-            if analysis_result.credibility:
-                results["credibility"] = {
-                    "score": analysis_result.credibility.overall_score,
-                    "fact_check_score": analysis_result.credibility.fact_check_score,
-                    "source_reliability": analysis_result.credibility.source_reliability,
-                    "bias_indicator": analysis_result.credibility.bias_indicator,
-                    "confidence": analysis_result.credibility.confidence,
-                    "reasoning": analysis_result.credibility.reasoning
-                }
-            
-            if analysis_result.bias:
-                results["bias"] = {
-                    "score": analysis_result.bias.overall_bias_score,
-                    "types": analysis_result.bias.bias_types,
-                    "indicators": analysis_result.bias.bias_indicators,
-                    "confidence": analysis_result.bias.confidence,
-                    "reasoning": analysis_result.bias.reasoning
-                }
-            
-            if analysis_result.fact_check:
-                results["facts"] = {
-                    "score": analysis_result.fact_check.overall_fact_score,
-                    "claims": analysis_result.fact_check.fact_claims,
-                    "verification_status": analysis_result.fact_check.verification_status,
-                    "sources": analysis_result.fact_check.sources,
-                    "confidence": analysis_result.fact_check.confidence,
-                    "reasoning": analysis_result.fact_check.reasoning
-                }
-            
-            if analysis_result.sentiment:
-                results["sentiment"] = {
-                    "score": analysis_result.sentiment.overall_sentiment,
-                    "dominant_emotion": analysis_result.sentiment.dominant_emotion,
-                    "emotion_breakdown": analysis_result.sentiment.emotion_breakdown,
-                    "confidence": analysis_result.sentiment.confidence,
-                    "reasoning": analysis_result.sentiment.reasoning
-                }
+                analysis_type=analysis_type,
+                deadline=deadline
+            ):
+                raw_results.append(result)
+                if isinstance(result, Exception):
+                    logger.error(f"{name} 분석 실패: {result}")
+                    continue
+                
+                serialized = self._serialize_analyzer_result(name, result)
+                if serialized is None:
+                    continue
+                results[name] = serialized
+                
+                if analysis_id:
+                    await self._broadcast_partial_result(
+                        analysis_id, name, serialized, len(raw_results)
+                    )
             
-            if analysis_result.classification:
-                results["classification"] = {
-                    "primary_category": analysis_result.classification.primary_category,
-                    "secondary_categories": analysis_result.classification.secondary_categories,
-                    "content_type": analysis_result.classification.content_type,
-                    "target_audience": analysis_result.classification.target_audience,
-                    "confidence": analysis_result.classification.confidence,
-                    "reasoning": analysis_result.classification.reasoning
-                }
+            analysis_result = await ai_model_service._process_results(
+                raw_results, analysis_type, start_time, video_metadata
+            )
             
             # 메타데이터 추가
             results["metadata"] = {
+                "warnings": analysis_result.warnings,
                 "processing_time": analysis_result.processing_time,
                 "model_version": analysis_result.model_version,
                 "analysis_timestamp": analysis_result.completed_at.isoformat() if analysis_result.completed_at else None
             }
             
+            # 댓글 분석 (전체 댓글을 한 번의 배치로 감정 분석): 감정 분석을 요청한 경우에만
+            if any(analysis in COMMENT_ANALYSIS_TYPES for analysis in analysis_types):
+                comment_analysis = await ai_model_service.analyze_comments(
+                    self._get_comments(video_metadata), deadline=deadline
+                )
+                if comment_analysis:
+                    results["comments"] = comment_analysis
+                    if comment_analysis["degraded"]:
+                        results["metadata"]["warnings"].append("시간 예산 초과로 일부 댓글에 휴리스틱 결과 사용")
+            
             return results
             
         except Exception as e:
             logger.error(f"AI 분석 실패: {e}")
             raise
 
+    async def _broadcast_partial_result(
+        self,
+        analysis_id: str,
+        analysis_name: str,
+        result: Dict[str, Any],
+        completed_count: int
+    ):
+        """완료된 분석기 하나의 결과를 진행률과 함께 전송합니다."""
+        analysis_data = self.active_analyses.get(analysis_id)
+        if not analysis_data:
+            return
+        
+        partial_results = analysis_data.setdefault("partial_results", {})
+        partial_results[analysis_name] = result
+        
+        # AI 분석 구간(30% ~ 80%)을 완료된 분석기 수에 비례해 진행
+        total = 5 if "full" in analysis_data["analysis_types"] else max(1, len(analysis_data["analysis_types"]))
+        progress = 30 + int(50 * min(completed_count, total) / total)
+        analysis_data["progress"] = progress
+        analysis_data["updated_at"] = datetime.utcnow()
+        
+        await self._broadcast_update(analysis_id, {
+            "analysis": analysis_name,
+            "result": result,
+            "progress": progress,
+            "completed": list(partial_results.keys()),
+            "updated_at": analysis_data["updated_at"].isoformat()
+        }, message_type="analysis_partial_result")
+
+    def _serialize_analyzer_result(self, name: str, result: Any) -> Optional[Dict[str, Any]]:
+        """분석기 결과 객체를 응답용 딕셔너리로 변환합니다."""
+        if name == "credibility":
+            # CredibilityAnalysis
+            return {
+                "score": result.credibility_score,
+                "fact_check_score": result.fact_check_score,
+                "source_reliability": result.source_reliability_score,
+                "consistency_score": result.consistency_score,
+                "objectivity_score": result.objectivity_score,
+                "level": result.credibility_level,
+                "reasoning": result.reasoning,
+                "degraded": result.degraded
+            }
+        
+        if name == "bias":
+            # BiasAnalysis
+            return {
+                "score": result.bias_score,
+                "has_bias": result.has_bias,
+                "types": result.bias_types,
+                "political_bias": result.political_bias,
+                "gender_bias": result.gender_bias,
+                "racial_bias": result.racial_bias,
+                "religious_bias": result.religious_bias,
+                "other_biases": result.other_biases,
+                "reasoning": result.reasoning,
+                "degraded": result.degraded
+            }
+        
+        if name == "facts":
+            # FactCheckAnalysis
+            return {
+                "score": result.fact_check_score,
+                "claim_verification_score": result.claim_verification_score,
+                "source_analysis_score": result.source_analysis_score,
+                "evidence_strength_score": result.evidence_strength_score,
+                "verification_status": result.fact_check_result,
+                "reasoning": result.reasoning,
+                "degraded": result.degraded
+            }
+        
+        if name == "sentiment":
+            # SentimentAnalysis
+            return {
+                "score": result.overall_sentiment,
+                "dominant_emotion": result.dominant_emotion,
+                "emotion_breakdown": result.emotion_breakdown,
+                "confidence": result.confidence,
+                "reasoning": result.reasoning,
+                "degraded": result.degraded
+            }
+        
+        if name == "classification":
+            # ContentClassification
+            return {
+                "primary_category": result.primary_category,
+                "confidence": result.primary_confidence,
+                "all_categories": result.all_categories,
+                "content_type": result.content_type,
+                "topic": result.topic,
+                "target_audience": result.target_audience,
+                "reasoning": result.reasoning,
+                "degraded": result.degraded
+            }
+        
+        return None
+
     def _prepare_text_content(self, video_metadata: Dict[str, Any]) -> str:
         """분석할 텍스트 콘텐츠를 준비합니다."""
         text_parts = []
@@ -375,14 +797,15 @@ class AnalysisService:
         if video_metadata.get("transcript"):
             text_parts.append(f"자막: {video_metadata['transcript']}")
         
-        # 댓글 (최대 10개)
-        comments = video_metadata.get("comments", [])
-        if comments:
-            comment_texts = [comment.get("text", "") for comment in comments[:10]]
-            text_parts.append(f"댓글: {' '.join(comment_texts)}")
-        
+        # 댓글은 별도의 댓글 분석 단계(analyze_comments)에서 처리
         return " ".join(text_parts)
 
+    def _get_comments(self, video_metadata: Any) -> List[Any]:
+        """영상 메타데이터(딕셔너리 또는 모델)에서 댓글 목록을 꺼냅니다."""
+        if isinstance(video_metadata, dict):
+            return video_metadata.get("comments") or []
+        return getattr(video_metadata, "comments", None) or []
+
     def _extract_video_id(self, url: str) -> Optional[str]:
         """YouTube URL에서 비디오 ID를 추출합니다."""
         import re
@@ -405,43 +828,61 @@ class AnalysisService:
         return list(self.active_analyses.values())
 
     async def cleanup_completed_analyses(self, max_age_hours: int = 24):
-        """완료된 분석을 정리합니다."""
+        """보관 기간이 지난 완료된 분석을 최근 분석 캐시와 저장소에서 정리합니다."""
         try:
             cutoff_time = datetime.utcnow() - timedelta(hours=max_age_hours)
-            to_remove = []
-            
-            for analysis_id, analysis_data in self.active_analyses.items():
-                if (analysis_data["status"] in [AnalysisStatus.COMPLETED, AnalysisStatus.FAILED, AnalysisStatus.CANCELLED] and 
-                    analysis_data["updated_at"] < cutoff_time):
-                    to_remove.append(analysis_id)
-            
+            to_remove = [
+                analysis_id for analysis_id, analysis_data in self.recent_analyses.items()
+                if analysis_data["updated_at"] < cutoff_time
+            ]
             for analysis_id in to_remove:
-                del self.active_analyses[analysis_id]
+                analysis_data = self.recent_analyses.pop(analysis_id)
+                if not self.store.is_connected:
+                    self.status_counts[analysis_data["status"]] -= 1
+            
+            removed = len(to_remove)
+            if self.store.is_connected:
+                deleted = await self.store.delete_before(cutoff_time, [status.value for status in TERMINAL_STATUSES])
+                for status, count in deleted.items():
+                    self.status_counts[AnalysisStatus(status)] -= count
+                removed = sum(deleted.values())
                 
-            if to_remove:
-                logger.info(f"{len(to_remove)}개의 완료된 분석 정리됨")
+            if removed:
+                logger.info(f"{removed}개의 완료된 분석 정리됨")
                 
         except Exception as e:
             logger.error(f"분석 정리 실패: {e}")
 
     async def get_service_stats(self) -> Dict[str, Any]:
-        """서비스 통계를 반환합니다."""
+        """서비스 통계를 반환합니다. 상태 전환 시 갱신된 집계만 읽으므로 보관 중인 분석 수와 무관합니다."""
         try:
-            total_analyses = len(self.active_analyses)
-            pending_count = sum(1 for a in self.active_analyses.values() if a["status"] == AnalysisStatus.PENDING)
-            processing_count = sum(1 for a in self.active_analyses.values() if a["status"] == AnalysisStatus.PROCESSING)
-            completed_count = sum(1 for a in self.active_analyses.values() if a["status"] == AnalysisStatus.COMPLETED)
-            failed_count = sum(1 for a in self.active_analyses.values() if a["status"] == AnalysisStatus.FAILED)
-            cancelled_count = sum(1 for a in self.active_analyses.values() if a["status"] == AnalysisStatus.CANCELLED)
-            
             return {
-                "total_analyses": total_analyses,
-                "pending": pending_count,
-                "processing": processing_count,
-                "completed": completed_count,
-                "failed": failed_count,
-                "cancelled": cancelled_count,
-                "queue_length": len(self.analysis_queue),
+                "total_analyses": sum(self.status_counts.values()),
+                "in_memory": len(self.active_analyses) + len(self.recent_analyses),
+                "persistent_store": self.store.is_connected,
+                "pending": self.status_counts[AnalysisStatus.PENDING],
+                "processing": self.status_counts[AnalysisStatus.PROCESSING],
+                "completed": self.status_counts[AnalysisStatus.COMPLETED],
+                "failed": self.status_counts[AnalysisStatus.FAILED],
+                "cancelled": self.status_counts[AnalysisStatus.CANCELLED],
+                "throughput_per_minute": self.completed_counter.count(),
+                "failures_per_minute": self.failed_counter.count(),
+                "average_processing_time": round(self.processing_time_ewma.get(), 3),
+                "latency_p50": self.recent_latency.quantile(0.50),
+                "latency_p95": self.recent_latency.quantile(0.95),
+                "result_cache_hits": self.result_cache_hits,
+                "result_cache_misses": self.result_cache_misses,
+                "queue_length": self.analysis_queue.qsize(),
+                "running": self.running_count,
+                "workers": len(self.workers),
+                "stages": {
+                    stage: {
+                        "queued": self.stage_queues[stage].qsize(),
+                        "running": self.stage_running[stage],
+                        "workers": self.stage_workers[stage]
+                    }
+                    for stage in STAGES
+                },
                 "max_concurrent": self.max_concurrent_analyses,
                 "timestamp": datetime.utcnow().isoformat()
             }
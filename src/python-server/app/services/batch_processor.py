@@ -4,19 +4,33 @@
 """
 
 import asyncio
-from typing import Dict, List, Any, Optional, Callable
-from datetime import datetime, timedelta
-from dataclasses import dataclass
+import os
+import bisect
+import dataclasses
+import hashlib
+import heapq
+import itertools
+import math
+from typing import Dict, List, Any, Optional, Callable, Iterator, Tuple, AsyncIterator, Sequence
+from datetime import datetime
+from dataclasses import dataclass, field
 from enum import Enum
 import uuid
 import time
-from collections import deque, defaultdict
+from collections import deque, defaultdict, Counter, OrderedDict
 
 from app.core.logging import get_logger
+from app.core.config import get_settings
+from app.core.exceptions import RateLimitError
 from app.core.gpu_config import get_gpu_config
 from app.services.ai_models import AIModelService
+from app.services.cache import CacheService, cache_service
+from app.utils.concurrency import AdaptiveConcurrencyLimiter
+from app.utils.metrics import RollingCounter, RollingHistogram, LatencyHistogram, EWMA, DecayedLinearFit
+from app.utils.telemetry import ResourceSampler, ResourceSnapshot
 
 logger = get_logger(__name__)
+settings = get_settings()
 
 
 class BatchStatus(Enum):
@@ -37,6 +51,7 @@ class BatchRequest:
     priority: int = 1
     created_at: datetime = None
     metadata: Dict[str, Any] = None
+    future: Optional[asyncio.Future] = None  # 처리 완료 시 BatchResult로 완료됨
     
     def __post_init__(self):
         if self.created_at is None:
@@ -45,6 +60,394 @@ class BatchRequest:
             self.metadata = {}
 
 
+class PriorityRequestQueue:
+    """우선순위 요청 큐
+    
+    (우선순위, 삽입 순서)를 키로 하는 힙으로, 같은 우선순위 안에서는 FIFO를 보장합니다.
+    삽입/추출은 O(log n)이며, 취소는 항목을 무효화만 하고 추출 시 건너뛰는 방식으로 처리합니다.
+    """
+    
+    def __init__(self):
+        self._heap: List[list] = []
+        self._entries: Dict[str, list] = {}
+        self._counter = itertools.count()
+        self._depth: Counter = Counter()
+    
+    def push(self, request: BatchRequest):
+        """요청을 큐에 추가합니다. 우선순위 값이 클수록 먼저 처리됩니다."""
+        if request.request_id in self._entries:
+            self.remove(request.request_id)
+        
+        entry = [-request.priority, next(self._counter), request]
+        self._entries[request.request_id] = entry
+        self._depth[request.priority] += 1
+        heapq.heappush(self._heap, entry)
+    
+    def pop(self) -> BatchRequest:
+        """가장 우선순위가 높은 요청을 꺼냅니다."""
+        while self._heap:
+            _, _, request = heapq.heappop(self._heap)
+            if request is not None:
+                self._forget(request)
+                return request
+        raise IndexError("pop from an empty priority queue")
+    
+    def peek(self) -> Optional[BatchRequest]:
+        """가장 우선순위가 높은 요청을 꺼내지 않고 반환합니다."""
+        while self._heap and self._heap[0][2] is None:
+            heapq.heappop(self._heap)
+        return self._heap[0][2] if self._heap else None
+    
+    def remove(self, request_id: str) -> Optional[BatchRequest]:
+        """요청을 큐에서 제거합니다. 힙 항목은 무효화되어 이후 추출 시 버려집니다."""
+        entry = self._entries.get(request_id)
+        if entry is None:
+            return None
+        
+        request = entry[2]
+        entry[2] = None
+        self._forget(request)
+        
+        # 무효 항목이 절반을 넘으면 힙을 재구성해 메모리를 회수
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [e for e in self._heap if e[2] is not None]
+            heapq.heapify(self._heap)
+        return request
+    
+    def get(self, request_id: str) -> Optional[BatchRequest]:
+        """대기 중인 요청을 조회합니다."""
+        entry = self._entries.get(request_id)
+        return entry[2] if entry else None
+    
+    def depth_by_priority(self) -> Dict[int, int]:
+        """우선순위별 대기 요청 수를 반환합니다."""
+        return {priority: count for priority, count in sorted(self._depth.items(), reverse=True)}
+    
+    def _forget(self, request: BatchRequest):
+        del self._entries[request.request_id]
+        self._depth[request.priority] -= 1
+        if self._depth[request.priority] <= 0:
+            del self._depth[request.priority]
+    
+    def __contains__(self, request_id: str) -> bool:
+        return request_id in self._entries
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+    
+    def __iter__(self) -> Iterator[BatchRequest]:
+        """처리 순서대로 대기 요청을 순회합니다."""
+        for _, _, request in sorted(e for e in self._heap if e[2] is not None):
+            yield request
+
+
+GroupKey = Tuple[str, str, int]
+
+
+class GroupedRequestQueue:
+    """작업 그룹별 우선순위 요청 큐
+    
+    (analysis_type, profile, 길이 구간)이 같은 요청끼리 묶어 그룹마다 PriorityRequestQueue를 두고,
+    배치는 한 그룹 안에서만 구성합니다. 그룹 간에는 선두 요청의 우선순위와 대기 순서로 선택합니다.
+    """
+    
+    def __init__(self, length_buckets: Tuple[int, ...] = (256, 1024, 4096)):
+        self.length_buckets = tuple(sorted(length_buckets))
+        self._groups: Dict[GroupKey, PriorityRequestQueue] = {}
+        self._request_groups: Dict[str, GroupKey] = {}
+        self._counter = itertools.count()
+        self._arrival: Dict[str, int] = {}
+    
+    def group_key(self, request: BatchRequest) -> GroupKey:
+        """요청이 속할 그룹 키를 계산합니다."""
+        profile = str(request.metadata.get("profile", "default"))
+        length_bucket = bisect.bisect_left(self.length_buckets, len(request.text or ""))
+        return (request.analysis_type, profile, length_bucket)
+    
+    def push(self, request: BatchRequest):
+        """요청을 해당 그룹 큐에 추가합니다."""
+        if request.request_id in self._request_groups:
+            self.remove(request.request_id)
+        
+        key = self.group_key(request)
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = PriorityRequestQueue()
+        
+        group.push(request)
+        self._request_groups[request.request_id] = key
+        self._arrival[request.request_id] = next(self._counter)
+    
+    def next_group(self) -> Optional[GroupKey]:
+        """선두 요청의 우선순위가 가장 높고, 같으면 가장 먼저 도착한 그룹을 반환합니다."""
+        best_key = None
+        best_rank = None
+        for key, group in self._groups.items():
+            head = group.peek()
+            if head is None:
+                continue
+            rank = (-head.priority, self._arrival[head.request_id])
+            if best_rank is None or rank < best_rank:
+                best_key, best_rank = key, rank
+        return best_key
+    
+    def has_group(self, key: GroupKey) -> bool:
+        """해당 그룹에 대기 요청이 있는지 확인합니다."""
+        return key in self._groups
+    
+    def group_size(self, key: GroupKey) -> int:
+        """해당 그룹의 대기 요청 수를 반환합니다."""
+        group = self._groups.get(key)
+        return len(group) if group is not None else 0
+    
+    def pop_batch(self, key: GroupKey, max_size: int) -> List[BatchRequest]:
+        """그룹에서 우선순위 순으로 최대 max_size개의 요청을 꺼냅니다."""
+        group = self._groups.get(key)
+        batch = []
+        while group and len(batch) < max_size:
+            request = group.pop()
+            self._forget(request.request_id)
+            batch.append(request)
+        
+        if group is not None and not group:
+            del self._groups[key]
+        return batch
+    
+    def pop(self) -> BatchRequest:
+        """전체에서 가장 우선순위가 높은 요청을 꺼냅니다."""
+        key = self.next_group()
+        if key is None:
+            raise IndexError("pop from an empty priority queue")
+        return self.pop_batch(key, 1)[0]
+    
+    def peek(self) -> Optional[BatchRequest]:
+        key = self.next_group()
+        return self._groups[key].peek() if key is not None else None
+    
+    def remove(self, request_id: str) -> Optional[BatchRequest]:
+        """요청을 큐에서 제거합니다."""
+        key = self._request_groups.get(request_id)
+        if key is None:
+            return None
+        
+        group = self._groups[key]
+        request = group.remove(request_id)
+        self._forget(request_id)
+        if not group:
+            del self._groups[key]
+        return request
+    
+    def get(self, request_id: str) -> Optional[BatchRequest]:
+        key = self._request_groups.get(request_id)
+        return self._groups[key].get(request_id) if key is not None else None
+    
+    def depth_by_priority(self) -> Dict[int, int]:
+        """우선순위별 대기 요청 수를 반환합니다."""
+        depth: Counter = Counter()
+        for group in self._groups.values():
+            depth.update(group.depth_by_priority())
+        return {priority: count for priority, count in sorted(depth.items(), reverse=True)}
+    
+    def depth_by_group(self) -> Dict[str, int]:
+        """그룹별 대기 요청 수를 반환합니다."""
+        return {
+            f"{analysis_type}/{profile}/{bucket}": len(group)
+            for (analysis_type, profile, bucket), group in self._groups.items()
+        }
+    
+    def _forget(self, request_id: str):
+        self._request_groups.pop(request_id, None)
+        self._arrival.pop(request_id, None)
+    
+    def __contains__(self, request_id: str) -> bool:
+        return request_id in self._request_groups
+    
+    def __len__(self) -> int:
+        return len(self._request_groups)
+    
+    def __bool__(self) -> bool:
+        return bool(self._request_groups)
+    
+    def __iter__(self) -> Iterator[BatchRequest]:
+        """처리 우선순위 순서대로 대기 요청을 순회합니다."""
+        requests = [request for group in self._groups.values() for request in group]
+        requests.sort(key=lambda request: (-request.priority, self._arrival[request.request_id]))
+        return iter(requests)
+
+
+class TenantFairQueue:
+    """테넌트 간 가중 공정 큐 (Deficit Round-Robin)
+    
+    테넌트(user_id 등)마다 GroupedRequestQueue를 두고, 라운드마다 클라이언트 유형 가중치만큼
+    처리 한도(deficit)를 적립해 그 한도 안에서만 요청을 꺼냅니다. 테넌트 안에서는 기존처럼
+    우선순위와 작업 그룹 순서를 따르므로, 한 클라이언트의 대량 요청이 다른 사용자를 굶기지 않습니다.
+    """
+    
+    def __init__(self, class_weights: Optional[Dict[str, float]] = None, default_class: str = "default"):
+        self.class_weights = dict(class_weights or {})
+        self.default_class = default_class
+        self._tenants: Dict[str, GroupedRequestQueue] = {}
+        self._tenant_classes: Dict[str, str] = {}
+        self._request_tenants: Dict[str, str] = {}
+        self._deficits: Dict[str, float] = {}
+        self._ring: deque = deque()  # 대기 요청이 있는 테넌트의 라운드로빈 순서
+    
+    @staticmethod
+    def tenant_of(request: BatchRequest) -> str:
+        """요청의 테넌트 식별자"""
+        tenant = request.metadata.get("tenant_id") or request.metadata.get("user_id")
+        return str(tenant) if tenant else "anonymous"
+    
+    def client_class_of(self, request: BatchRequest) -> str:
+        return str(request.metadata.get("client_class") or self.default_class)
+    
+    def quantum(self, tenant: str) -> float:
+        """테넌트가 한 라운드에 적립하는 처리 한도"""
+        client_class = self._tenant_classes.get(tenant, self.default_class)
+        return max(0.01, self.class_weights.get(client_class, self.class_weights.get(self.default_class, 1.0)))
+    
+    def push(self, request: BatchRequest):
+        """요청을 테넌트 큐에 추가합니다."""
+        if request.request_id in self._request_tenants:
+            self.remove(request.request_id)
+        
+        tenant = self.tenant_of(request)
+        queue = self._tenants.get(tenant)
+        if queue is None:
+            queue = self._tenants[tenant] = GroupedRequestQueue()
+            self._deficits[tenant] = 0.0
+            self._ring.append(tenant)
+        
+        self._tenant_classes[tenant] = self.client_class_of(request)
+        queue.push(request)
+        self._request_tenants[request.request_id] = tenant
+    
+    def next_group(self) -> Optional[GroupKey]:
+        """라운드로빈 순서상 현재 차례인 테넌트의 다음 작업 그룹을 반환합니다."""
+        if not self._ring:
+            return None
+        return self._tenants[self._ring[0]].next_group()
+    
+    def pop_batch(self, key: GroupKey, max_size: int) -> List[BatchRequest]:
+        """DRR 순서로 테넌트를 돌며 같은 작업 그룹의 요청을 최대 max_size개 꺼냅니다."""
+        batch: List[BatchRequest] = []
+        idle_visits = 0
+        
+        while self._ring and len(batch) < max_size and idle_visits < len(self._ring):
+            tenant = self._ring[0]
+            queue = self._tenants[tenant]
+            
+            if not queue.has_group(key):
+                # 이번 배치에 넣을 요청이 없는 테넌트는 적립 없이 순서만 넘김
+                self._ring.rotate(-1)
+                idle_visits += 1
+                continue
+            
+            if self._deficits[tenant] < 1.0:
+                self._deficits[tenant] += self.quantum(tenant)
+            
+            allowance = min(int(self._deficits[tenant]), max_size - len(batch))
+            taken = queue.pop_batch(key, allowance) if allowance > 0 else []
+            for request in taken:
+                del self._request_tenants[request.request_id]
+            batch.extend(taken)
+            self._deficits[tenant] -= len(taken)
+            # 그룹 요청이 있는 테넌트는 방문마다 한도가 쌓이므로 언젠가는 꺼낼 수 있음
+            idle_visits = 0
+            
+            if not queue:
+                self._drop_tenant(tenant)
+            elif self._deficits[tenant] < 1.0 or not queue.has_group(key):
+                # 한도를 소진했거나 그룹 요청이 없으면 다음 테넌트 차례
+                self._ring.rotate(-1)
+            else:
+                break  # 배치가 가득 참, 남은 한도는 다음 배치에서 사용
+        
+        return batch
+    
+    def group_size(self, key: GroupKey) -> int:
+        """모든 테넌트에 걸친 해당 작업 그룹의 대기 요청 수를 반환합니다."""
+        return sum(queue.group_size(key) for queue in self._tenants.values())
+    
+    def pop(self) -> BatchRequest:
+        key = self.next_group()
+        if key is None:
+            raise IndexError("pop from an empty priority queue")
+        return self.pop_batch(key, 1)[0]
+    
+    def peek(self) -> Optional[BatchRequest]:
+        return self._tenants[self._ring[0]].peek() if self._ring else None
+    
+    def remove(self, request_id: str) -> Optional[BatchRequest]:
+        """요청을 큐에서 제거합니다."""
+        tenant = self._request_tenants.pop(request_id, None)
+        if tenant is None:
+            return None
+        
+        queue = self._tenants[tenant]
+        request = queue.remove(request_id)
+        if not queue:
+            self._drop_tenant(tenant)
+        return request
+    
+    def get(self, request_id: str) -> Optional[BatchRequest]:
+        tenant = self._request_tenants.get(request_id)
+        return self._tenants[tenant].get(request_id) if tenant is not None else None
+    
+    def depth_by_priority(self) -> Dict[int, int]:
+        """우선순위별 대기 요청 수를 반환합니다."""
+        depth: Counter = Counter()
+        for queue in self._tenants.values():
+            depth.update(queue.depth_by_priority())
+        return {priority: count for priority, count in sorted(depth.items(), reverse=True)}
+    
+    def depth_by_group(self) -> Dict[str, int]:
+        """작업 그룹별 대기 요청 수를 반환합니다."""
+        depth: Counter = Counter()
+        for queue in self._tenants.values():
+            depth.update(queue.depth_by_group())
+        return dict(depth)
+    
+    def depth_by_tenant(self) -> Dict[str, Dict[str, Any]]:
+        """테넌트별 대기 요청 수, 클라이언트 유형, 남은 처리 한도를 반환합니다."""
+        return {
+            tenant: {
+                "pending": len(queue),
+                "client_class": self._tenant_classes.get(tenant, self.default_class),
+                "weight": self.quantum(tenant),
+                "deficit": round(self._deficits.get(tenant, 0.0), 3)
+            }
+            for tenant, queue in self._tenants.items()
+        }
+    
+    def _drop_tenant(self, tenant: str):
+        del self._tenants[tenant]
+        self._deficits.pop(tenant, None)
+        self._tenant_classes.pop(tenant, None)
+        try:
+            self._ring.remove(tenant)
+        except ValueError:
+            pass
+    
+    def __contains__(self, request_id: str) -> bool:
+        return request_id in self._request_tenants
+    
+    def __len__(self) -> int:
+        return len(self._request_tenants)
+    
+    def __bool__(self) -> bool:
+        return bool(self._request_tenants)
+    
+    def __iter__(self) -> Iterator[BatchRequest]:
+        """우선순위와 요청 시각 순서로 대기 요청을 순회합니다."""
+        requests = [request for queue in self._tenants.values() for request in queue]
+        requests.sort(key=lambda request: (-request.priority, request.created_at))
+        return iter(requests)
+
+
 @dataclass
 class BatchResult:
     """배치 결과"""
@@ -55,6 +458,123 @@ class BatchResult:
     error: Optional[str] = None
 
 
+class CompletedResultStore:
+    """완료된 배치 결과 저장소
+    
+    결과마다 완료 시각을 기록해 TTL이 지나면 만료시키고, 최대 보관 개수를 넘으면
+    가장 오래 조회되지 않은 결과부터 제거(LRU)합니다. 캐시가 주어지면 메모리에서
+    밀려난 결과를 캐시에 옮겨 두어 이후 조회할 수 있게 합니다.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl_seconds: float = 3600,
+        cache: Optional[CacheService] = None,
+        key_prefix: str = "batch_result:"
+    ):
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.cache = cache
+        self.key_prefix = key_prefix
+        self._entries: "OrderedDict[str, Tuple[BatchResult, float]]" = OrderedDict()
+        self.total_expired = 0
+        self.total_evicted = 0
+        self.total_spilled = 0
+    
+    def put(self, result: BatchResult):
+        """결과를 저장하고, 최대 개수를 넘으면 오래된 결과를 제거합니다."""
+        self._entries[result.request_id] = (result, time.monotonic())
+        self._entries.move_to_end(result.request_id)
+        
+        evicted = []
+        while len(self._entries) > self.max_entries:
+            _, (old_result, _) = self._entries.popitem(last=False)
+            evicted.append(old_result)
+        
+        if evicted:
+            self.total_evicted += len(evicted)
+            self._schedule_spill(evicted)
+    
+    def get(self, request_id: str) -> Optional[BatchResult]:
+        """메모리에서 결과를 조회합니다. 만료된 결과는 제거 후 None을 반환합니다."""
+        entry = self._entries.get(request_id)
+        if entry is None:
+            return None
+        
+        result, completed_at = entry
+        if self._is_expired(completed_at, time.monotonic()):
+            del self._entries[request_id]
+            self.total_expired += 1
+            return None
+        
+        self._entries.move_to_end(request_id)
+        return result
+    
+    async def load(self, request_id: str) -> Optional[BatchResult]:
+        """메모리에 없으면 캐시로 옮겨진 결과를 조회합니다."""
+        result = self.get(request_id)
+        if result is not None or self.cache is None:
+            return result
+        return await self.cache.get(self._cache_key(request_id))
+    
+    def expire(self, max_age_seconds: Optional[float] = None) -> int:
+        """max_age_seconds(기본값: TTL)보다 오래된 결과를 제거하고 제거한 개수를 반환합니다."""
+        max_age = self.ttl_seconds if max_age_seconds is None else max_age_seconds
+        now = time.monotonic()
+        
+        expired = [
+            request_id for request_id, (_, completed_at) in self._entries.items()
+            if now - completed_at >= max_age
+        ]
+        for request_id in expired:
+            del self._entries[request_id]
+        
+        self.total_expired += len(expired)
+        return len(expired)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """저장소 통계를 반환합니다."""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "total_expired": self.total_expired,
+            "total_evicted": self.total_evicted,
+            "total_spilled": self.total_spilled
+        }
+    
+    def _is_expired(self, completed_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - completed_at >= self.ttl_seconds
+    
+    def _cache_key(self, request_id: str) -> str:
+        return f"{self.key_prefix}{request_id}"
+    
+    def _schedule_spill(self, results: List[BatchResult]):
+        if self.cache is None:
+            return
+        try:
+            asyncio.get_running_loop().create_task(self._spill(results))
+        except RuntimeError:
+            # 이벤트 루프 밖에서는 캐시로 옮기지 않음
+            pass
+    
+    async def _spill(self, results: List[BatchResult]):
+        ttl = max(1, int(self.ttl_seconds)) if self.ttl_seconds else None
+        for result in results:
+            if await self.cache.set(self._cache_key(result.request_id), result, ttl=ttl):
+                self.total_spilled += 1
+    
+    def clear(self):
+        self._entries.clear()
+    
+    def __contains__(self, request_id: str) -> bool:
+        return self.get(request_id) is not None
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 @dataclass
 class BatchMetrics:
     """배치 처리 메트릭"""
@@ -66,8 +586,14 @@ class BatchMetrics:
     average_wait_time: float = 0.0
     throughput_per_minute: float = 0.0
     success_rate: float = 0.0
-    gpu_utilization: float = 0.0
-    memory_usage: float = 0.0
+    gpu_utilization: Optional[float] = None  # GPU 사용률 (%), 측정 불가 시 None
+    memory_usage: float = 0.0  # 시스템 메모리 대비 프로세스 RSS 비율 (%)
+    resources: Dict[str, Any] = field(default_factory=dict)  # 최근 리소스 측정값
+    latency_p50: Optional[float] = None
+    latency_p95: Optional[float] = None
+    latency_p99: Optional[float] = None
+    coalesced_requests: int = 0
+    coalesce_rate: float = 0.0
 
 
 class BatchProcessor:
@@ -81,39 +607,92 @@ class BatchProcessor:
         self.max_batch_size = self.gpu_config.batch_size
         self.min_batch_size = max(1, self.max_batch_size // 4)  # 최소 배치 크기
         self.current_batch_size = self.max_batch_size  # 현재 배치 크기
+        # 배치가 차지 않았을 때 선두 요청이 배치를 채우려고 기다리는 최대 시간 (0이면 즉시 시작)
+        self.max_wait = settings.BATCH_MAX_WAIT_SECONDS
         
-        # 적응형 대기 시간
-        self.max_wait_time = 5.0  # 최대 대기 시간 (초)
-        self.min_wait_time = 0.5  # 최소 대기 시간 (초)
-        self.current_wait_time = self.max_wait_time  # 현재 대기 시간
+        # 동시 처리 배치 수: 모델 복제본 용량에서 시작해 관측된 지연 시간으로 자동 조정
+        capacity = self.ai_service.get_inference_capacity()["concurrent_analyses"]
+        self.concurrency_limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=capacity,
+            max_limit=settings.BATCH_MAX_CONCURRENCY or max(capacity, os.cpu_count() or 1)
+        )
         
-        self.processing_interval = 0.1  # 처리 간격 (초)
+        # 스케줄러 깨우기 이벤트 (요청 추가, 배치 완료, 중지 시 설정)
+        self._wakeup = asyncio.Event()
         
         # 배치 큐
-        self.pending_requests: List[BatchRequest] = []
+        self.pending_requests = TenantFairQueue(settings.BATCH_CLIENT_CLASS_WEIGHTS)
         self.processing_batches: Dict[str, List[BatchRequest]] = {}
-        self.completed_results: Dict[str, BatchResult] = {}
+        self.completed_results = CompletedResultStore(
+            max_entries=settings.BATCH_RESULT_MAX_ENTRIES,
+            ttl_seconds=settings.BATCH_RESULT_TTL_SECONDS,
+            cache=cache_service if settings.BATCH_RESULT_SPILL_TO_CACHE else None
+        )
+        self.result_sweep_interval = settings.BATCH_RESULT_SWEEP_INTERVAL
+        self._sweeper_task: Optional[asyncio.Task] = None
+        
+        # 중복 요청 병합 (singleflight): 병합 키 -> 처리 중인 대표 요청 ID
+        self.inflight_requests: Dict[str, str] = {}
+        self.inflight_keys: Dict[str, str] = {}  # 대표 요청 ID -> 병합 키
+        self.coalesced_followers: Dict[str, List[str]] = defaultdict(list)  # 대표 요청 ID -> 병합된 요청 ID들
+        self.coalesced_leaders: Dict[str, str] = {}  # 병합된 요청 ID -> 대표 요청 ID
+        
+        # 결과 스트리밍용 배치 핸들: 핸들 ID -> 요청 ID 목록
+        self.batch_handles: "OrderedDict[str, List[str]]" = OrderedDict()
+        self.max_batch_handles = 10000
+        
+        # 취소 관리
+        self.running_tasks: Dict[str, asyncio.Task] = {}  # 처리 중인 요청 ID -> 분석 작업
+        self.detached_requests: set = set()  # 취소됐지만 병합된 요청 때문에 작업은 계속되는 대표 요청
+        self.result_futures: Dict[str, asyncio.Future] = {}  # 결과 대기용 Future
         
         # 상태 관리
         self.is_running = False
         self.total_processed = 0
         self.total_failed = 0
         self.total_cancelled = 0
+        self.total_submitted = 0
+        self.total_coalesced = 0
+        self.total_rejected = 0
+        
+        # 승인 제어 (대기열 용량, 예상 대기 시간, 우선순위별 예약 용량)
+        self.queue_capacity = settings.BATCH_QUEUE_CAPACITY
+        self.max_estimated_wait = settings.BATCH_MAX_ESTIMATED_WAIT_SECONDS
+        self.reserved_capacity = dict(settings.BATCH_RESERVED_CAPACITY)
         
         # 성능 모니터링
         self.performance_history = deque(maxlen=1000)  # 최근 1000개 요청의 성능 데이터
         self.batch_history = deque(maxlen=100)  # 최근 100개 배치의 성능 데이터
+        self.open_batches: Dict[str, Dict[str, Any]] = {}  # 처리 중인 배치의 히스토리 항목 인덱스
         self.start_time = time.time()
         
+        # 스트리밍 집계 (갱신 비용이 히스토리 길이와 무관)
+        self.completed_counter = RollingCounter(window=60.0, slots=60)  # 분당 처리량
+        self.processing_time_ewma = EWMA(half_life=60.0)
+        self.wait_time_ewma = EWMA(half_life=60.0)
+        self.latency_histogram = LatencyHistogram()  # 전체 기간 요청 지연 분포
+        
         # 메트릭 수집
         self.metrics = BatchMetrics()
         self.last_metrics_update = time.time()
         self.metrics_update_interval = 60.0  # 1분마다 메트릭 업데이트
         
-        # 적응형 최적화
-        self.optimization_interval = 30.0  # 30초마다 최적화 수행
-        self.last_optimization = time.time()
-        self.performance_window = 300  # 5분간의 성능 데이터로 최적화
+        # SLO 기반 배치 크기 제어 (AIMD)
+        self.latency_slo = settings.BATCH_LATENCY_SLO_SECONDS  # 요청 지연 시간 p95 목표
+        self.controller_window = 30.0  # p95 계산 구간 (초)
+        self.recent_latency = RollingHistogram(window=self.controller_window, slots=6)
+        self.batch_latency_fit = DecayedLinearFit(decay=0.98)  # 배치 크기-처리 시간 곡선
+        self.controller_min_samples = 5  # 결정에 필요한 최소 표본 수
+        self.slo_headroom = 0.8  # p95가 SLO의 80% 미만일 때만 배치 크기 증가
+        self.decrease_factor = 0.7  # SLO 초과 시 배치 크기 감소 비율
+        
+        # 리소스 텔레메트리 (최적화 판단에 사용)
+        self.resource_sampler = ResourceSampler(
+            interval=settings.RESOURCE_SAMPLE_INTERVAL,
+            model_memory_provider=self.ai_service.get_model_memory
+        )
+        self.memory_high_watermark = settings.BATCH_MEMORY_HIGH_WATERMARK  # 이 이상이면 배치 크기 축소
+        self.event_loop_lag_threshold = 0.1  # 이벤트 루프 지연이 이보다 크면 과부하로 판단 (초)
         
         logger.info(f"배치 처리기 초기화됨 (최대 배치 크기: {self.max_batch_size}, 최소: {self.min_batch_size})")
     
@@ -124,48 +703,257 @@ class BatchProcessor:
         priority: int = 1,
         metadata: Dict[str, Any] = None
     ) -> str:
-        """분석 요청을 배치 큐에 추가합니다."""
+        """분석 요청을 배치 큐에 추가합니다.
+        
+        같은 텍스트/분석 유형/모델 버전의 요청이 이미 처리 중이면 새 작업을 만들지 않고
+        기존 요청의 결과를 함께 받도록 병합합니다.
+        """
+        coalesce_key = self._coalesce_key(text, analysis_type)
+        leader_id = self.inflight_requests.get(coalesce_key)
+        if leader_id is None or leader_id not in self.result_futures:
+            # 대기열에 여유가 없으면 RateLimitError
+            self.check_admission(priority)
+        
+        request_id = self._enqueue(text, analysis_type, priority, metadata, coalesce_key)
+        logger.info(f"배치 요청 추가됨: {request_id} (우선순위: {priority})")
+        
+        self._notify_enqueued()
+        return request_id
+    
+    async def add_requests(self, items: List[Dict[str, Any]], priority: int = 1) -> List[str]:
+        """여러 분석 요청을 한 번에 배치 큐에 추가합니다.
+        
+        items의 각 항목은 text, analysis_type, priority, metadata 키를 가질 수 있습니다.
+        승인 확인과 스케줄러 깨우기를 묶음 전체에 대해 한 번만 수행하며, 승인되지 않으면
+        아무 요청도 추가하지 않고 RateLimitError를 발생시킵니다.
+        승인은 묶음에서 가장 낮은 우선순위로 확인하므로, 높은 우선순위 항목을 섞어
+        예약 용량을 쓰게 할 수 없습니다.
+        """
+        if not items:
+            return []
+        
+        priorities = [item.get("priority", priority) for item in items]
+        # 낮은 우선순위의 한도가 더 작고 앞선 대기 요청도 많으므로 최저 우선순위 기준 확인이 가장 엄격함
+        self.check_admission(min(priorities), count=len(items))
+        
+        request_ids = [
+            self._enqueue(
+                item["text"],
+                item.get("analysis_type", "full"),
+                item_priority,
+                item.get("metadata")
+            )
+            for item, item_priority in zip(items, priorities)
+        ]
+        logger.info(f"배치 요청 {len(request_ids)}개 일괄 추가됨 (우선순위: {priority})")
+        
+        self._notify_enqueued()
+        return request_ids
+    
+    def create_batch_handle(self, request_ids: Sequence[str]) -> str:
+        """여러 요청 ID를 묶는 배치 핸들을 만듭니다. 한도를 넘으면 오래된 핸들부터 정리됩니다."""
+        handle = str(uuid.uuid4())
+        self.batch_handles[handle] = list(request_ids)
+        while len(self.batch_handles) > self.max_batch_handles:
+            self.batch_handles.popitem(last=False)
+        return handle
+    
+    def get_batch_handle(self, handle: str) -> Optional[List[str]]:
+        """배치 핸들에 묶인 요청 ID 목록을 반환합니다."""
+        return self.batch_handles.get(handle)
+    
+    async def iter_results(
+        self,
+        request_ids: Sequence[str],
+        timeout: Optional[float] = None
+    ) -> AsyncIterator[BatchResult]:
+        """요청들의 결과를 완료된 순서대로 반환합니다. timeout초가 지나면 남은 요청은 반환하지 않습니다."""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        waiting: Dict[asyncio.Future, str] = {}
+        
+        for request_id in request_ids:
+            result = self.completed_results.get(request_id)
+            if result is not None:
+                yield result
+                continue
+            
+            future = self.result_futures.get(request_id)
+            if future is not None:
+                waiting[future] = request_id
+                continue
+            
+            # 메모리에서 밀려났거나 존재하지 않는 요청
+            result = await self.completed_results.load(request_id)
+            yield result or BatchResult(
+                request_id=request_id,
+                result=None,
+                processing_time=0.0,
+                status=BatchStatus.FAILED.value,
+                error="요청을 찾을 수 없습니다."
+            )
+        
+        while waiting:
+            remaining = deadline - time.monotonic() if deadline is not None else None
+            if remaining is not None and remaining <= 0:
+                break
+            
+            # asyncio.wait는 타임아웃 시 Future를 취소하지 않으므로 다른 대기자에게 영향이 없음
+            done, _ = await asyncio.wait(list(waiting), timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                del waiting[future]
+                yield future.result()
+    
+    def _enqueue(
+        self,
+        text: str,
+        analysis_type: str,
+        priority: int,
+        metadata: Optional[Dict[str, Any]],
+        coalesce_key: Optional[str] = None
+    ) -> str:
+        """요청을 만들어 큐에 넣거나 처리 중인 동일 요청에 병합하고 요청 ID를 반환합니다."""
         request_id = str(uuid.uuid4())
+        self.total_submitted += 1
+        
+        coalesce_key = coalesce_key or self._coalesce_key(text, analysis_type)
+        leader_id = self.inflight_requests.get(coalesce_key)
+        if leader_id is not None and leader_id in self.result_futures:
+            return self._join_inflight(leader_id, request_id, priority)
+        
         request = BatchRequest(
             request_id=request_id,
             text=text,
             analysis_type=analysis_type,
             priority=priority,
-            metadata=metadata
+            metadata=metadata,
+            future=asyncio.get_running_loop().create_future()
         )
         
+        # 결과 전달용 Future 등록
+        self.result_futures[request_id] = request.future
+        self.inflight_requests[coalesce_key] = request_id
+        self.inflight_keys[request_id] = coalesce_key
+        
         # 우선순위에 따라 큐에 삽입
-        self._insert_by_priority(request)
+        self.pending_requests.push(request)
         
         # 성능 모니터링 데이터 수집
         self._record_request_added(request)
         
-        logger.info(f"배치 요청 추가됨: {request_id} (우선순위: {priority})")
+        return request_id
+    
+    def _notify_enqueued(self):
+        """요청 추가 후 결과 정리 작업과 배치 처리를 시작합니다."""
+        # 만료 결과 정리 작업과 리소스 측정 시작
+        self._ensure_result_sweeper()
+        self.resource_sampler.ensure_started()
         
         # 배치 처리 시작
+        self._wakeup.set()
         if not self.is_running:
             asyncio.create_task(self._start_processing())
+    
+    def check_admission(self, priority: int = 1, count: int = 1):
+        """count개의 요청을 받을 수 있는지 확인하고, 불가하면 RateLimitError를 발생시킵니다.
         
-        return request_id
+        우선순위가 낮은 요청은 더 높은 우선순위에 예약된 용량을 쓰지 못하며, 같은 우선순위 이상의
+        대기 요청을 현재 처리량으로 소화하는 데 걸리는 예상 시간이 한도를 넘어도 거절됩니다.
+        details["retry_after"]에 재시도까지 권장 대기 시간(초)을 담습니다.
+        """
+        reserved = sum(
+            fraction for min_priority, fraction in self.reserved_capacity.items()
+            if min_priority > priority
+        )
+        limit = int(self.queue_capacity * max(0.0, 1.0 - reserved))
+        queue_depth = len(self.pending_requests)
+        
+        depth_by_priority = self.pending_requests.depth_by_priority()
+        ahead = sum(c for p, c in depth_by_priority.items() if p >= priority) + count
+        throughput = self._throughput_per_second()
+        estimated_wait = ahead / throughput if throughput > 0 else None
+        
+        if queue_depth + count > limit:
+            reason = f"대기열이 가득 찼습니다 ({queue_depth}/{limit})"
+            excess = queue_depth + count - limit
+        elif estimated_wait is not None and estimated_wait > self.max_estimated_wait:
+            reason = f"예상 대기 시간이 너무 깁니다 ({estimated_wait:.0f}s)"
+            excess = ahead - self.max_estimated_wait * throughput
+        else:
+            return
+        
+        if throughput > 0:
+            retry_after = max(1, math.ceil(excess / throughput))
+        else:
+            retry_after = max(1, math.ceil(self.processing_time_ewma.get(1.0)))
+        
+        self.total_rejected += count
+        logger.warning(f"배치 요청 거절: {reason}, 우선순위 {priority}, {retry_after}s 후 재시도 권장")
+        raise RateLimitError(
+            reason,
+            error_code="BATCH_QUEUE_FULL",
+            details={
+                "retry_after": retry_after,
+                "queue_depth": queue_depth,
+                "queue_limit": limit,
+                "estimated_wait": estimated_wait
+            }
+        )
+    
+    def _throughput_per_second(self) -> float:
+        """최근 1분간의 초당 처리량"""
+        return self.completed_counter.count() / self.completed_counter.window
     
-    def _insert_by_priority(self, request: BatchRequest):
-        """우선순위에 따라 요청을 삽입합니다."""
-        for i, existing_request in enumerate(self.pending_requests):
-            if request.priority > existing_request.priority:
-                self.pending_requests.insert(i, request)
-                return
+    def _coalesce_key(self, text: str, analysis_type: str) -> str:
+        """중복 요청 병합 키를 계산합니다."""
+        digest = hashlib.sha256()
+        for part in (self.ai_service.model_version, analysis_type, text or ""):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+    
+    def _join_inflight(self, leader_id: str, request_id: str, priority: int) -> str:
+        """처리 중인 대표 요청에 새 요청을 병합합니다."""
+        self.result_futures[request_id] = asyncio.get_running_loop().create_future()
+        self.coalesced_followers[leader_id].append(request_id)
+        self.coalesced_leaders[request_id] = leader_id
+        self.total_coalesced += 1
+        
+        # 아직 대기 중인 대표 요청은 더 높은 우선순위로 끌어올림
+        leader = self.pending_requests.get(leader_id)
+        if leader is not None and priority > leader.priority:
+            self.pending_requests.remove(leader_id)
+            leader.priority = priority
+            self.pending_requests.push(leader)
         
-        # 우선순위가 낮으면 맨 뒤에 추가
-        self.pending_requests.append(request)
+        logger.info(f"배치 요청 병합됨: {request_id} -> {leader_id}")
+        return request_id
+    
+    def _ensure_result_sweeper(self):
+        """만료 결과 정리 작업이 실행 중이 아니면 시작합니다."""
+        if self._sweeper_task is None or self._sweeper_task.done():
+            self._sweeper_task = asyncio.create_task(self._sweep_completed_results())
+    
+    async def _sweep_completed_results(self):
+        """주기적으로 TTL이 지난 완료 결과를 정리합니다."""
+        try:
+            while True:
+                await asyncio.sleep(self.result_sweep_interval)
+                expired = self.completed_results.expire()
+                if expired:
+                    logger.info(f"만료된 배치 결과 {expired}개 정리됨")
+        except asyncio.CancelledError:
+            pass
     
     def _record_request_added(self, request: BatchRequest):
         """요청 추가 시 성능 데이터를 기록합니다."""
+        now = time.time()
+        queue_length = len(self.pending_requests)
         self.performance_history.append({
-            'timestamp': time.time(),
+            'timestamp': now,
             'action': 'request_added',
             'request_id': request.request_id,
             'priority': request.priority,
-            'queue_length': len(self.pending_requests)
+            'queue_length': queue_length
         })
     
     async def _start_processing(self):
@@ -178,16 +966,21 @@ class BatchProcessor:
         
         try:
             while self.is_running and (self.pending_requests or self.processing_batches):
+                self._wakeup.clear()
                 await self._process_batch_cycle()
-                await asyncio.sleep(self.processing_interval)
                 
                 # 메트릭 업데이트
                 if time.time() - self.last_metrics_update >= self.metrics_update_interval:
                     await self._update_metrics()
                 
-                # 적응형 최적화 수행
-                if time.time() - self.last_optimization >= self.optimization_interval:
-                    await self._perform_adaptive_optimization()
+                if not self.pending_requests and not self.processing_batches:
+                    break
+                
+                # 요청 추가/배치 완료 이벤트 또는 다음 주기 작업 시각까지 대기
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self._time_until_next_timer())
+                except asyncio.TimeoutError:
+                    pass
                 
         except Exception as e:
             logger.error(f"배치 처리 중 오류 발생: {e}")
@@ -195,131 +988,87 @@ class BatchProcessor:
             self.is_running = False
             logger.info("배치 처리 종료됨")
     
-    async def _perform_adaptive_optimization(self):
-        """적응형 최적화를 수행합니다."""
-        try:
-            current_time = time.time()
-            self.last_optimization = current_time
-            
-            # 최근 성능 데이터 수집
-            recent_performance = [
-                p for p in self.performance_history
-                if current_time - p['timestamp'] <= self.performance_window
-            ]
-            
-            if len(recent_performance) < 10:  # 충분한 데이터가 없으면 스킵
-                return
-            
-            # 성공률 계산
-            completed_requests = [p for p in recent_performance if p['action'] == 'request_completed']
-            if not completed_requests:
-                return
-            
-            success_count = len([p for p in completed_requests if p.get('success', False)])
-            success_rate = success_count / len(completed_requests) if completed_requests else 0
-            
-            # 평균 처리 시간 계산
-            processing_times = [p.get('processing_time', 0) for p in completed_requests if 'processing_time' in p]
-            avg_processing_time = sum(processing_times) / len(processing_times) if processing_times else 0
-            
-            # 평균 대기 시간 계산
-            wait_times = [p.get('wait_time', 0) for p in completed_requests if 'wait_time' in p]
-            avg_wait_time = sum(wait_times) / len(wait_times) if wait_times else 0
-            
-            # 큐 길이 분석
-            queue_lengths = [p.get('queue_length', 0) for p in recent_performance if 'queue_length' in p]
-            avg_queue_length = sum(queue_lengths) / len(queue_lengths) if queue_lengths else 0
-            
-            # 최적화 전략 결정
-            await self._apply_optimization_strategy(
-                success_rate, avg_processing_time, avg_wait_time, avg_queue_length
-            )
-            
-            logger.debug(f"적응형 최적화 완료: 성공률 {success_rate:.2f}, 처리시간 {avg_processing_time:.3f}s, 대기시간 {avg_wait_time:.3f}s")
-            
-        except Exception as e:
-            logger.error(f"적응형 최적화 실패: {e}")
-    
-    async def _apply_optimization_strategy(self, success_rate: float, avg_processing_time: float, 
-                                         avg_wait_time: float, avg_queue_length: float):
-        """최적화 전략을 적용합니다."""
-        # 성공률이 낮으면 배치 크기 줄이기
-        if success_rate < 0.8 and self.current_batch_size > self.min_batch_size:
-            self.current_batch_size = max(self.min_batch_size, self.current_batch_size - 1)
-            logger.info(f"성공률 저하로 배치 크기 감소: {self.current_batch_size}")
-        
-        # 성공률이 높고 처리 시간이 빠르면 배치 크기 늘리기
-        elif success_rate > 0.95 and avg_processing_time < 2.0 and self.current_batch_size < self.max_batch_size:
-            self.current_batch_size = min(self.max_batch_size, self.current_batch_size + 1)
-            logger.info(f"성능 향상으로 배치 크기 증가: {self.current_batch_size}")
-        
-        # 대기 시간이 길면 대기 시간 줄이기
-        if avg_wait_time > 3.0 and self.current_wait_time > self.min_wait_time:
-            self.current_wait_time = max(self.min_wait_time, self.current_wait_time - 0.5)
-            logger.info(f"대기 시간 단축: {self.current_wait_time:.1f}s")
-        
-        # 큐가 비어있으면 대기 시간 늘리기
-        elif avg_queue_length < 2 and self.current_wait_time < self.max_wait_time:
-            self.current_wait_time = min(self.max_wait_time, self.current_wait_time + 0.5)
-            logger.info(f"대기 시간 증가: {self.current_wait_time:.1f}s")
+    def _time_until_next_timer(self) -> float:
+        """다음 메트릭 업데이트 또는 선두 요청의 배치 대기 마감까지 남은 시간(초)을 반환합니다."""
+        next_timer = self.last_metrics_update + self.metrics_update_interval - time.time()
+        
+        # 처리 여유가 있는데 배치가 덜 차서 기다리는 중이면 선두 요청의 대기 마감에 깨어남
+        if self.pending_requests and self.concurrency_limiter.has_capacity():
+            next_timer = min(next_timer, self.max_wait - self._head_request_age())
+        return max(0.0, next_timer)
+    
+    def _head_request_age(self) -> float:
+        """다음 배치의 선두 요청이 대기한 시간(초)을 반환합니다."""
+        head = self.pending_requests.peek()
+        if head is None:
+            return 0.0
+        return (datetime.utcnow() - head.created_at).total_seconds()
+    
+    def _batch_ready(self) -> bool:
+        """다음 배치를 시작할 수 있는지 확인합니다.
+        
+        같은 작업 그룹의 대기 요청으로 배치가 가득 차거나, 선두 요청의 대기 시간이 max_wait에
+        도달하면 시작합니다. 그 전까지는 요청을 더 모아 배치 크기 조정이 의미를 갖게 합니다.
+        """
+        group_key = self.pending_requests.next_group()
+        if group_key is None:
+            return False
+        if self.pending_requests.group_size(group_key) >= self.current_batch_size:
+            return True
+        return self._head_request_age() >= self.max_wait
     
     async def _process_batch_cycle(self):
         """배치 처리 사이클을 실행합니다."""
         # 완료된 배치 확인
         await self._check_completed_batches()
         
-        # 새로운 배치 시작
-        if self.pending_requests and len(self.processing_batches) < 3:  # 최대 3개 배치 동시 처리
+        # 동시 처리 한도까지, 가득 찼거나 대기 마감이 된 배치 시작
+        while self.pending_requests and self.concurrency_limiter.has_capacity() and self._batch_ready():
             await self._start_new_batch()
     
     async def _start_new_batch(self):
         """새로운 배치를 시작합니다."""
-        # 현재 최적화된 배치 크기만큼 요청 수집
-        batch_requests = []
-        batch_id = str(uuid.uuid4())
+        # 선두 요청의 우선순위/대기 순서가 가장 앞선 그룹에서 같은 종류의 요청만 수집
+        group_key = self.pending_requests.next_group()
+        if group_key is None:
+            return
         
-        # 우선순위가 높은 요청부터 처리
-        while (len(batch_requests) < self.current_batch_size and 
-               self.pending_requests and 
-               self._should_start_batch(batch_requests)):
-            
-            request = self.pending_requests.pop(0)
-            batch_requests.append(request)
+        batch_id = str(uuid.uuid4())
+        batch_requests = self.pending_requests.pop_batch(group_key, self.current_batch_size)
         
         if not batch_requests:
             return
         
         # 배치 처리 시작
         self.processing_batches[batch_id] = batch_requests
+        self.concurrency_limiter.acquire()
         batch_start_time = time.time()
         
         # 배치 성능 데이터 기록
-        self.batch_history.append({
+        batch_data = {
             'batch_id': batch_id,
             'start_time': batch_start_time,
             'request_count': len(batch_requests),
             'batch_size': self.current_batch_size,
-            'wait_time': self.current_wait_time,
+            'max_wait': self.max_wait,
+            'group': {
+                'analysis_type': group_key[0],
+                'profile': group_key[1],
+                'length_bucket': group_key[2]
+            },
             'average_priority': sum(r.priority for r in batch_requests) / len(batch_requests)
-        })
+        }
+        self.batch_history.append(batch_data)
+        self.open_batches[batch_id] = batch_data
         
-        logger.info(f"배치 {batch_id} 시작됨: {len(batch_requests)}개 요청 (배치 크기: {self.current_batch_size})")
+        logger.info(
+            f"배치 {batch_id} 시작됨: {len(batch_requests)}개 요청 "
+            f"(그룹: {group_key[0]}/{group_key[1]}/{group_key[2]}, 배치 크기: {self.current_batch_size})"
+        )
         
         # 비동기로 배치 처리
         asyncio.create_task(self._process_batch(batch_id, batch_requests, batch_start_time))
     
-    def _should_start_batch(self, current_batch: List[BatchRequest]) -> bool:
-        """배치를 시작해야 하는지 결정합니다."""
-        if not current_batch:
-            return True
-        
-        # 첫 번째 요청의 대기 시간 확인
-        first_request = current_batch[0]
-        wait_time = (datetime.utcnow() - first_request.created_at).total_seconds()
-        
-        # 현재 최적화된 대기 시간을 초과했거나 배치가 가득 찬 경우
-        return wait_time >= self.current_wait_time or len(current_batch) >= self.current_batch_size
-    
     async def _process_batch(self, batch_id: str, requests: List[BatchRequest], batch_start_time: float):
         """배치를 처리합니다."""
         start_time = time.time()
@@ -327,21 +1076,37 @@ class BatchProcessor:
         try:
             logger.info(f"배치 {batch_id} 처리 시작: {len(requests)}개 요청")
             
-            # 배치 내 모든 요청을 병렬로 처리
+            # 배치 내 모든 요청을 병렬로 처리 (요청별 작업은 취소할 수 있도록 등록)
             tasks = []
             for request in requests:
-                task = self._process_single_request(request)
+                task = asyncio.create_task(self._process_single_request(request))
+                self.running_tasks[request.request_id] = task
                 tasks.append(task)
             
             # 모든 요청 완료 대기
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            try:
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+            finally:
+                for request in requests:
+                    self.running_tasks.pop(request.request_id, None)
             
             # 결과 처리
             for i, result in enumerate(results):
                 request = requests[i]
                 processing_time = time.time() - start_time
                 
-                if isinstance(result, Exception):
+                if isinstance(result, asyncio.CancelledError):
+                    # 처리 도중 취소됨
+                    batch_result = BatchResult(
+                        request_id=request.request_id,
+                        result=None,
+                        processing_time=processing_time,
+                        status=BatchStatus.CANCELLED.value,
+                        error="요청이 취소되었습니다."
+                    )
+                    if request.request_id not in self.detached_requests:  # 이미 취소 집계됨
+                        self.total_cancelled += 1
+                elif isinstance(result, Exception):
                     # 오류 발생
                     batch_result = BatchResult(
                         request_id=request.request_id,
@@ -363,7 +1128,7 @@ class BatchProcessor:
                     self.total_processed += 1
                     self._record_request_completed(request, batch_result, True)
                 
-                self.completed_results[request.request_id] = batch_result
+                self._store_result(batch_result)
             
             # 배치 완료 성능 데이터 기록
             batch_processing_time = time.time() - batch_start_time
@@ -383,7 +1148,7 @@ class BatchProcessor:
                     status=BatchStatus.FAILED.value,
                     error=str(e)
                 )
-                self.completed_results[request.request_id] = batch_result
+                self._store_result(batch_result)
                 self.total_failed += 1
                 self._record_request_completed(request, batch_result, False)
         
@@ -391,13 +1156,118 @@ class BatchProcessor:
             # 처리 중인 배치에서 제거
             if batch_id in self.processing_batches:
                 del self.processing_batches[batch_id]
+            self.open_batches.pop(batch_id, None)
+            
+            # 요청당 처리 시간으로 동시 처리 한도 갱신
+            self.concurrency_limiter.release((time.time() - batch_start_time) / max(1, len(requests)))
+            
+            # 대기 중인 요청이 있으면 스케줄러를 깨움
+            self._wakeup.set()
+    
+    def _store_result(self, batch_result: BatchResult):
+        """결과를 저장하고 대기 중인 Future를 완료시킵니다. 병합된 요청에도 결과를 전달합니다."""
+        coalesce_key = self.inflight_keys.pop(batch_result.request_id, None)
+        if coalesce_key is not None and self.inflight_requests.get(coalesce_key) == batch_result.request_id:
+            del self.inflight_requests[coalesce_key]
+        
+        followers = self.coalesced_followers.pop(batch_result.request_id, [])
+        for follower_id in followers:
+            self.coalesced_leaders.pop(follower_id, None)
+        results = [
+            dataclasses.replace(batch_result, request_id=follower_id) for follower_id in followers
+        ]
+        
+        # 이미 취소된 대표 요청에는 결과를 다시 저장하지 않음
+        if batch_result.request_id in self.detached_requests:
+            self.detached_requests.discard(batch_result.request_id)
+        else:
+            results.insert(0, batch_result)
+        
+        for result in results:
+            self.completed_results.put(result)
+            
+            future = self.result_futures.pop(result.request_id, None)
+            if future is not None and not future.done():
+                future.set_result(result)
+    
+    async def cancel(self, request_id: str) -> bool:
+        """요청을 취소합니다.
+        
+        대기 중인 요청은 큐에서 제거하고, 처리 중인 요청은 분석 작업을 취소해 남은 분석기 실행을
+        건너뜁니다. 같은 작업에 병합된 다른 요청이 결과를 기다리는 경우에는 해당 요청만 취소합니다.
+        """
+        future = self.result_futures.get(request_id)
+        if future is None or future.done():
+            return False
+        
+        leader_id = self.coalesced_leaders.pop(request_id, None)
+        if leader_id is not None:
+            # 병합된 요청: 대표 요청의 결과 대기 목록에서만 제외
+            followers = self.coalesced_followers.get(leader_id, [])
+            if request_id in followers:
+                followers.remove(request_id)
+            self._store_cancelled(request_id)
+            
+            # 대표 요청도 이미 취소됐고 더 기다리는 요청이 없으면 작업 자체를 취소
+            if leader_id in self.detached_requests and not followers:
+                self._cancel_work(leader_id)
+            return True
+        
+        if self.coalesced_followers.get(request_id):
+            # 병합된 요청이 결과를 기다리므로 작업은 계속하고 이 요청만 취소
+            self.detached_requests.add(request_id)
+            self._store_cancelled(request_id)
+            return True
+        
+        if self._cancel_work(request_id):
+            logger.info(f"배치 요청 취소됨: {request_id}")
+            return True
+        return False
+    
+    def _cancel_work(self, request_id: str) -> bool:
+        """대기 중이면 큐에서 제거하고, 처리 중이면 분석 작업을 취소합니다."""
+        if self.pending_requests.remove(request_id) is not None:
+            if request_id not in self.detached_requests:  # 이미 취소 집계됨
+                self.total_cancelled += 1
+            self._store_result(BatchResult(
+                request_id=request_id,
+                result=None,
+                processing_time=0.0,
+                status=BatchStatus.CANCELLED.value,
+                error="요청이 취소되었습니다."
+            ))
+            return True
+        
+        task = self.running_tasks.get(request_id)
+        if task is not None and not task.done():
+            # 결과는 _process_batch에서 취소 상태로 저장됨
+            task.cancel()
+            return True
+        return False
+    
+    def _store_cancelled(self, request_id: str):
+        """단일 요청을 취소 상태로 완료시킵니다."""
+        result = BatchResult(
+            request_id=request_id,
+            result=None,
+            processing_time=0.0,
+            status=BatchStatus.CANCELLED.value,
+            error="요청이 취소되었습니다."
+        )
+        self.completed_results.put(result)
+        self.total_cancelled += 1
+        
+        future = self.result_futures.pop(request_id, None)
+        if future is not None and not future.done():
+            future.set_result(result)
     
     def _record_request_completed(self, request: BatchRequest, result: BatchResult, success: bool):
         """요청 완료 시 성능 데이터를 기록합니다."""
         wait_time = (datetime.utcnow() - request.created_at).total_seconds()
         
+        now = time.time()
         self.performance_history.append({
-            'timestamp': time.time(),
+            'timestamp': now,
             'action': 'request_completed',
             'request_id': request.request_id,
             'success': success,
@@ -405,15 +1275,88 @@ class BatchProcessor:
             'wait_time': wait_time,
             'priority': request.priority
         })
+        
+        self.completed_counter.add(now=now)
+        self.processing_time_ewma.update(result.processing_time, now)
+        self.wait_time_ewma.update(wait_time, now)
+        self.latency_histogram.add(wait_time)
+        self.recent_latency.add(wait_time, now)
     
     def _record_batch_completed(self, batch_id: str, request_count: int, processing_time: float):
-        """배치 완료 시 성능 데이터를 기록합니다."""
-        # 배치 히스토리에서 해당 배치 찾기
-        for batch_data in self.batch_history:
-            if batch_data['batch_id'] == batch_id:
-                batch_data['processing_time'] = processing_time
-                batch_data['completed'] = True
-                break
+        """배치 완료 시 성능 데이터를 기록하고 배치 크기 제어 결정을 함께 남깁니다."""
+        self.batch_latency_fit.add(request_count, processing_time)
+        decision = self._adjust_batch_size()
+        
+        batch_data = self.open_batches.pop(batch_id, None)
+        if batch_data is not None:
+            batch_data['processing_time'] = processing_time
+            batch_data['completed'] = True
+            batch_data['controller'] = decision
+    
+    def _latency_p95(self) -> Optional[float]:
+        """최근 controller_window 동안 완료된 요청 지연 시간의 p95를 반환합니다."""
+        now = time.time()
+        if self.recent_latency.count(now) < self.controller_min_samples:
+            return None
+        return self.recent_latency.quantile(0.95, now)
+    
+    def _predict_batch_latency(self, batch_size: int) -> Optional[float]:
+        """완료된 배치들의 (요청 수, 처리 시간)에 맞춘 직선으로 batch_size의 처리 시간을 예측합니다."""
+        return self.batch_latency_fit.predict(batch_size)
+    
+    def _adjust_batch_size(self) -> Dict[str, Any]:
+        """p95 지연 시간을 SLO와 비교해 배치 크기를 AIMD 방식으로 조정합니다.
+        
+        SLO를 넘으면 배치 크기를 곱셈적으로 줄이고, 여유가 있고 대기열이 밀려 있으며
+        관측된 크기-지연 곡선상 한 단계 큰 배치도 SLO 안에 들어올 때만 1씩 늘립니다.
+        """
+        p95 = self._latency_p95()
+        previous_size = self.current_batch_size
+        action = "hold"
+        predicted = None
+        resources = self.resource_sampler.latest
+        memory_pressure = resources.memory_pressure
+        
+        if memory_pressure >= self.memory_high_watermark and previous_size > self.min_batch_size:
+            # 메모리가 부족하면 지연 시간과 무관하게 배치 크기를 줄임
+            self.current_batch_size = max(self.min_batch_size, int(previous_size * self.decrease_factor))
+            action = "decrease_memory"
+        elif p95 is not None:
+            if p95 > self.latency_slo and previous_size > self.min_batch_size:
+                self.current_batch_size = max(self.min_batch_size, int(previous_size * self.decrease_factor))
+                action = "decrease"
+            elif (p95 < self.latency_slo * self.slo_headroom and
+                  previous_size < self.max_batch_size and
+                  len(self.pending_requests) >= previous_size and
+                  not self._host_saturated(resources)):
+                predicted = self._predict_batch_latency(previous_size + 1)
+                if predicted is None or predicted < self.latency_slo * self.slo_headroom:
+                    self.current_batch_size = previous_size + 1
+                    action = "increase"
+        
+        if action != "hold":
+            logger.info(
+                f"배치 크기 조정 ({action}): {previous_size} -> {self.current_batch_size} "
+                f"(p95 {p95 if p95 is not None else 0.0:.3f}s, SLO {self.latency_slo:.3f}s, "
+                f"메모리 {memory_pressure * 100:.1f}%)"
+            )
+        
+        return {
+            'action': action,
+            'memory_pressure': memory_pressure,
+            'p95_latency': p95,
+            'latency_slo': self.latency_slo,
+            'predicted_latency': predicted,
+            'previous_batch_size': previous_size,
+            'batch_size': self.current_batch_size
+        }
+    
+    def _host_saturated(self, resources: ResourceSnapshot) -> bool:
+        """이벤트 루프가 밀리거나 추론 스레드 풀에 대기 작업이 쌓였는지 확인합니다."""
+        return (
+            resources.event_loop_lag > self.event_loop_lag_threshold or
+            resources.executor_queue_depth > self.concurrency_limiter.limit
+        )
     
     async def _process_single_request(self, request: BatchRequest):
         """단일 요청을 처리합니다."""
@@ -422,7 +1365,8 @@ class BatchProcessor:
             result = await self.ai_service.analyze_content(
                 text=request.text,
                 analysis_type=request.analysis_type,
-                video_metadata=request.metadata.get("video_metadata")
+                video_metadata=request.metadata.get("video_metadata"),
+                deadline=request.metadata.get("deadline")
             )
             
             return result
@@ -441,34 +1385,19 @@ class BatchProcessor:
         """메트릭을 업데이트합니다."""
         try:
             current_time = time.time()
+            self.last_metrics_update = current_time
             uptime = current_time - self.start_time
             
             # 기본 통계
             total_requests = self.total_processed + self.total_failed + self.total_cancelled
             success_rate = (self.total_processed / total_requests * 100) if total_requests > 0 else 0
             
-            # 성능 통계 계산
-            if self.performance_history:
-                processing_times = [p['processing_time'] for p in self.performance_history 
-                                 if p['action'] == 'request_completed' and 'processing_time' in p]
-                wait_times = [p['wait_time'] for p in self.performance_history 
-                            if p['action'] == 'request_completed' and 'wait_time' in p]
-                
-                avg_processing_time = sum(processing_times) / len(processing_times) if processing_times else 0
-                avg_wait_time = sum(wait_times) / len(wait_times) if wait_times else 0
-            else:
-                avg_processing_time = 0
-                avg_wait_time = 0
-            
-            # 처리량 계산 (분당)
-            recent_requests = [p for p in self.performance_history 
-                             if p['action'] == 'request_completed' and 
-                             current_time - p['timestamp'] <= 60]
-            throughput_per_minute = len(recent_requests)
+            # 성능 통계 (스트리밍 집계)
+            avg_processing_time = self.processing_time_ewma.get()
+            avg_wait_time = self.wait_time_ewma.get()
+            throughput_per_minute = self.completed_counter.count(current_time)
             
-            # GPU 사용률 및 메모리 사용량 (간단한 추정)
-            gpu_utilization = min(100, len(self.processing_batches) * 30)  # 배치당 30% 사용률로 추정
-            memory_usage = min(100, len(self.completed_results) * 0.1)  # 결과당 0.1% 메모리 사용률로 추정
+            resources = self.resource_sampler.latest
             
             # 메트릭 업데이트
             self.metrics = BatchMetrics(
@@ -480,57 +1409,88 @@ class BatchProcessor:
                 average_wait_time=avg_wait_time,
                 throughput_per_minute=throughput_per_minute,
                 success_rate=success_rate,
-                gpu_utilization=gpu_utilization,
-                memory_usage=memory_usage
+                gpu_utilization=resources.gpu_utilization,
+                memory_usage=resources.memory_usage,
+                resources=resources.to_dict(),
+                latency_p50=self.latency_histogram.quantile(0.50),
+                latency_p95=self.latency_histogram.quantile(0.95),
+                latency_p99=self.latency_histogram.quantile(0.99),
+                coalesced_requests=self.total_coalesced,
+                coalesce_rate=self._coalesce_rate()
             )
             
-            self.last_metrics_update = current_time
-            
             # 메트릭 로깅 (디버그 레벨)
             logger.debug(f"메트릭 업데이트됨: 성공률 {success_rate:.1f}%, 처리량 {throughput_per_minute}/분")
             
         except Exception as e:
             logger.error(f"메트릭 업데이트 실패: {e}")
     
+    def _coalesce_rate(self) -> float:
+        """전체 제출 요청 중 병합된 요청 비율(%)을 반환합니다."""
+        if self.total_submitted == 0:
+            return 0.0
+        return self.total_coalesced / self.total_submitted * 100
+    
     async def get_result(self, request_id: str, timeout: float = 30.0) -> Optional[BatchResult]:
-        """요청 결과를 가져옵니다."""
-        start_time = time.time()
+        """요청 결과를 가져옵니다. 완료되지 않았으면 최대 timeout초 동안 완료를 기다립니다."""
+        result = self.completed_results.get(request_id)
+        if result is not None:
+            return result
         
-        while (time.time() - start_time) < timeout:
-            if request_id in self.completed_results:
-                return self.completed_results[request_id]
-            
-            await asyncio.sleep(0.1)
+        future = self.result_futures.get(request_id)
+        if future is None:
+            # 메모리에서 밀려나 캐시로 옮겨진 결과 조회
+            return await self.completed_results.load(request_id)
+        if timeout <= 0:
+            return None
         
-        # 타임아웃
-        logger.warning(f"요청 {request_id} 결과 대기 타임아웃")
-        return None
+        try:
+            # 다른 대기자와 공유하는 Future가 취소되지 않도록 shield로 감쌈
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"요청 {request_id} 결과 대기 타임아웃")
+            return None
     
     def get_status(self) -> Dict[str, Any]:
         """배치 처리기 상태를 반환합니다."""
         return {
             "is_running": self.is_running,
             "pending_requests": len(self.pending_requests),
+            "pending_by_priority": self.pending_requests.depth_by_priority(),
+            "pending_by_group": self.pending_requests.depth_by_group(),
+            "pending_by_tenant": self.pending_requests.depth_by_tenant(),
             "processing_batches": len(self.processing_batches),
             "completed_results": len(self.completed_results),
+            "result_store": self.completed_results.get_stats(),
             "total_processed": self.total_processed,
             "total_failed": self.total_failed,
             "total_cancelled": self.total_cancelled,
+            "inflight_requests": len(self.inflight_requests),
+            "total_coalesced": self.total_coalesced,
+            "coalesce_rate": self._coalesce_rate(),
+            "total_rejected": self.total_rejected,
+            "queue_capacity": self.queue_capacity,
             "max_batch_size": self.max_batch_size,
             "min_batch_size": self.min_batch_size,
             "current_batch_size": self.current_batch_size,
-            "max_wait_time": self.max_wait_time,
-            "min_wait_time": self.min_wait_time,
-            "current_wait_time": self.current_wait_time,
+            "max_wait": self.max_wait,
+            "concurrency": self.concurrency_limiter.get_stats(),
+            "latency_slo": self.latency_slo,
+            "latency_p95": self._latency_p95(),
             "gpu_device": self.gpu_config.device,
-            "uptime_seconds": time.time() - self.start_time,
-            "last_optimization": time.time() - self.last_optimization,
-            "optimization_interval": self.optimization_interval
+            "resources": self.resource_sampler.latest.to_dict(),
+            "uptime_seconds": time.time() - self.start_time
         }
     
     def get_metrics(self) -> BatchMetrics:
-        """배치 처리 메트릭을 반환합니다."""
-        return self.metrics
+        """배치 처리 메트릭을 반환합니다. 리소스 항목은 가장 최근 측정값으로 채웁니다."""
+        resources = self.resource_sampler.latest
+        return dataclasses.replace(
+            self.metrics,
+            gpu_utilization=resources.gpu_utilization,
+            memory_usage=resources.memory_usage,
+            resources=resources.to_dict()
+        )
     
     def get_performance_history(self, limit: int = 100) -> List[Dict[str, Any]]:
         """성능 히스토리를 반환합니다."""
@@ -543,30 +1503,30 @@ class BatchProcessor:
     async def stop(self):
         """배치 처리를 중지합니다."""
         self.is_running = False
+        self._wakeup.set()
+        if self._sweeper_task is not None:
+            self._sweeper_task.cancel()
+            self._sweeper_task = None
+        self.resource_sampler.stop()
         logger.info("배치 처리 중지 요청됨")
     
     async def clear_completed_results(self, max_age_hours: int = 24):
-        """오래된 완료 결과를 정리합니다."""
-        cutoff_time = datetime.utcnow() - timedelta(hours=max_age_hours)
-        old_results = []
-        
-        for request_id, result in self.completed_results.items():
-            # 결과 생성 시간을 추정 (정확한 시간은 request_id에서 추출 불가)
-            # 간단한 정리 로직 사용
-            if len(self.completed_results) > 1000:  # 결과가 많으면 오래된 것부터 정리
-                old_results.append(request_id)
-        
-        # 오래된 결과 제거
-        for request_id in old_results[:100]:  # 한 번에 최대 100개 제거
-            del self.completed_results[request_id]
+        """max_age_hours보다 오래된 완료 결과를 정리합니다."""
+        removed = self.completed_results.expire(max_age_hours * 3600)
         
-        if old_results:
-            logger.info(f"오래된 완료 결과 {len(old_results)}개 정리됨")
+        if removed:
+            logger.info(f"오래된 완료 결과 {removed}개 정리됨")
     
     async def reset_metrics(self):
         """메트릭을 초기화합니다."""
         self.performance_history.clear()
         self.batch_history.clear()
+        self.open_batches.clear()
+        for aggregate in (
+            self.completed_counter, self.processing_time_ewma, self.wait_time_ewma,
+            self.latency_histogram, self.recent_latency, self.batch_latency_fit
+        ):
+            aggregate.reset()
         self.start_time = time.time()
         self.last_metrics_update = time.time()
         self.metrics = BatchMetrics()
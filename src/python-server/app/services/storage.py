@@ -0,0 +1,298 @@
+"""
+분석 저장소 서비스
+분석 기록을 SQLite(로컬) 또는 PostgreSQL(DATABASE_URL)에 저장하고 ID/영상 ID/상태 인덱스로 조회합니다.
+"""
+
+import asyncio
+import os
+import pickle
+import sqlite3
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.core.logging import get_logger
+from app.core.config import get_settings
+from app.models.analysis import AnalysisStatus
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+SCHEMA_STATEMENTS = (
+    """CREATE TABLE IF NOT EXISTS analyses (
+        id TEXT PRIMARY KEY,
+        video_id TEXT,
+        video_url TEXT NOT NULL,
+        status TEXT NOT NULL,
+        created_at DOUBLE PRECISION NOT NULL,
+        updated_at DOUBLE PRECISION NOT NULL,
+        data {blob} NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_analyses_video_id ON analyses (video_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_analyses_status ON analyses (status, updated_at)"
+)
+
+
+def _timestamp(value: Any) -> float:
+    """datetime(UTC)을 epoch 초로 변환합니다."""
+    if isinstance(value, datetime):
+        return (value - datetime(1970, 1, 1)).total_seconds()
+    return float(value or 0.0)
+
+
+def _to_row(record: Dict[str, Any]) -> tuple:
+    """분석 기록을 테이블 행으로 변환합니다. 마감 시각(time.monotonic 기준)은 재시작 후 의미가 없으므로 제외합니다."""
+    data = {key: value for key, value in record.items() if key != "deadline"}
+    status = record["status"]
+    return (
+        record["id"],
+        record.get("video_id"),
+        record["video_url"],
+        status.value if hasattr(status, "value") else str(status),
+        _timestamp(record.get("created_at")),
+        _timestamp(record.get("updated_at")),
+        pickle.dumps(data)
+    )
+
+
+def _from_row(status: str, data: bytes) -> Dict[str, Any]:
+    """테이블 행을 분석 기록으로 복원합니다. 상태는 행의 값(재시작 시 갱신될 수 있음)을 따릅니다."""
+    record = pickle.loads(data)
+    record["status"] = AnalysisStatus(status)
+    return record
+
+
+class SQLiteBackend:
+    """표준 라이브러리 sqlite3 기반 저장소. 블로킹 호출은 워커 스레드에서 실행합니다."""
+
+    placeholder = "?"
+    blob_type = "BLOB"
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    async def connect(self):
+        def open_db():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            return conn
+        self._conn = await asyncio.to_thread(open_db)
+
+    async def close(self):
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            await asyncio.to_thread(conn.close)
+
+    async def execute_script(self, statements: Sequence[str]):
+        def run():
+            with self._lock, self._conn:
+                for statement in statements:
+                    self._conn.execute(statement)
+        await asyncio.to_thread(run)
+
+    async def execute(self, query: str, *args) -> int:
+        def run():
+            with self._lock, self._conn:
+                return self._conn.execute(query, args).rowcount
+        return await asyncio.to_thread(run)
+
+    async def fetch(self, query: str, *args) -> List[tuple]:
+        def run():
+            with self._lock:
+                return self._conn.execute(query, args).fetchall()
+        return await asyncio.to_thread(run)
+
+    async def execute_returning(self, query: str, *args) -> List[tuple]:
+        """RETURNING 절이 있는 변경 문을 한 트랜잭션으로 실행하고 반환 행을 돌려줍니다. (SQLite 3.35 이상)"""
+        def run():
+            with self._lock, self._conn:
+                return self._conn.execute(query, args).fetchall()
+        return await asyncio.to_thread(run)
+
+
+class PostgresBackend:
+    """asyncpg 연결 풀 기반 저장소"""
+
+    placeholder = "$"
+    blob_type = "BYTEA"
+
+    def __init__(self, dsn: str):
+        self.dsn = dsn
+        self._pool = None
+
+    async def connect(self):
+        import asyncpg
+        self._pool = await asyncpg.create_pool(self.dsn, min_size=1, max_size=10)
+
+    async def close(self):
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await pool.close()
+
+    async def execute_script(self, statements: Sequence[str]):
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                for statement in statements:
+                    await conn.execute(statement)
+
+    async def execute(self, query: str, *args) -> int:
+        status = await self._pool.execute(query, *args)
+        # asyncpg는 "UPDATE 3" 형태의 상태 문자열을 반환
+        parts = status.split()
+        return int(parts[-1]) if parts and parts[-1].isdigit() else 0
+
+    async def fetch(self, query: str, *args) -> List[tuple]:
+        return [tuple(row) for row in await self._pool.fetch(query, *args)]
+
+    async def execute_returning(self, query: str, *args) -> List[tuple]:
+        """RETURNING 절이 있는 변경 문을 실행하고 반환 행을 돌려줍니다. 단일 문이므로 원자적으로 실행됩니다."""
+        return [tuple(row) for row in await self._pool.fetch(query, *args)]
+
+
+class AnalysisStore:
+    """분석 기록 저장소
+
+    DATABASE_URL이 postgres(ql)://로 시작하면 PostgreSQL을, 그 외에는 SQLite 파일을 사용합니다.
+    연결에 실패하면 저장소 없이 동작하며 모든 조회는 빈 결과를 반환합니다.
+    """
+
+    def __init__(self, database_url: Optional[str] = None):
+        self.database_url = database_url
+        self.backend = None
+
+    def _create_backend(self):
+        url = self.database_url or ""
+        if url.startswith(("postgres://", "postgresql://")):
+            return PostgresBackend(url)
+        if url.startswith("sqlite:///"):
+            return SQLiteBackend(url[len("sqlite:///"):])
+        return SQLiteBackend(settings.ANALYSIS_DB_PATH)
+
+    def _sql(self, query: str) -> str:
+        """'?' 자리표시자를 백엔드 형식으로 바꿉니다."""
+        if self.backend.placeholder == "?":
+            return query
+        parts = query.split("?")
+        return "".join(f"{part}${i}" for i, part in enumerate(parts[:-1], start=1)) + parts[-1]
+
+    @property
+    def is_connected(self) -> bool:
+        return self.backend is not None
+
+    async def connect(self):
+        """저장소에 연결하고 스키마를 준비합니다."""
+        backend = self._create_backend()
+        try:
+            await backend.connect()
+            await backend.execute_script([
+                statement.format(blob=backend.blob_type) for statement in SCHEMA_STATEMENTS
+            ])
+            self.backend = backend
+            logger.info(f"분석 저장소 연결 성공 ({type(backend).__name__})")
+        except Exception as e:
+            logger.error(f"분석 저장소 연결 실패: {e}")
+            self.backend = None
+
+    async def disconnect(self):
+        if self.backend is not None:
+            backend, self.backend = self.backend, None
+            await backend.close()
+            logger.info("분석 저장소 연결 해제")
+
+    async def save(self, record: Dict[str, Any]) -> bool:
+        """분석 기록을 저장(갱신)합니다."""
+        if not self.backend:
+            return False
+
+        try:
+            await self.backend.execute(self._sql(
+                "INSERT INTO analyses (id, video_id, video_url, status, created_at, updated_at, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET status = excluded.status, "
+                "updated_at = excluded.updated_at, data = excluded.data"
+            ), *_to_row(record))
+            return True
+        except Exception as e:
+            logger.error(f"분석 기록 저장 실패 ({record.get('id')}): {e}")
+            return False
+
+    async def get(self, analysis_id: str) -> Optional[Dict[str, Any]]:
+        """ID로 분석 기록을 조회합니다."""
+        if not self.backend:
+            return None
+
+        try:
+            rows = await self.backend.fetch(
+                self._sql("SELECT status, data FROM analyses WHERE id = ?"), analysis_id
+            )
+            return _from_row(*rows[0]) if rows else None
+        except Exception as e:
+            logger.error(f"분석 기록 조회 실패 ({analysis_id}): {e}")
+            return None
+
+    async def find_by_video(self, video_id: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """영상 ID의 분석 기록을 최신순으로 조회합니다."""
+        if not self.backend:
+            return []
+
+        try:
+            rows = await self.backend.fetch(self._sql(
+                "SELECT status, data FROM analyses WHERE video_id = ? ORDER BY created_at DESC LIMIT ?"
+            ), video_id, limit)
+            return [_from_row(*row) for row in rows]
+        except Exception as e:
+            logger.error(f"영상별 분석 기록 조회 실패 ({video_id}): {e}")
+            return []
+
+    async def count_by_status(self) -> Dict[str, int]:
+        """상태별 분석 수를 반환합니다."""
+        if not self.backend:
+            return {}
+
+        try:
+            rows = await self.backend.fetch("SELECT status, COUNT(*) FROM analyses GROUP BY status")
+            return {status: int(count) for status, count in rows}
+        except Exception as e:
+            logger.error(f"상태별 분석 수 조회 실패: {e}")
+            return {}
+
+    async def mark_interrupted(self, statuses: Sequence[str], status: str) -> int:
+        """재시작으로 중단된(statuses 상태로 남은) 분석을 status로 바꿉니다."""
+        if not self.backend or not statuses:
+            return 0
+
+        try:
+            marks = ", ".join("?" for _ in statuses)
+            return await self.backend.execute(
+                self._sql(f"UPDATE analyses SET status = ? WHERE status IN ({marks})"), status, *statuses
+            )
+        except Exception as e:
+            logger.error(f"중단된 분석 정리 실패: {e}")
+            return 0
+
+    async def delete_before(self, cutoff: datetime, statuses: Sequence[str]) -> Dict[str, int]:
+        """cutoff 이전에 마지막으로 갱신된 statuses 상태의 기록을 삭제하고 상태별 삭제 수를 반환합니다."""
+        if not self.backend or not statuses:
+            return {}
+
+        try:
+            # 삭제와 집계를 한 문장(DELETE ... RETURNING)으로 실행해 그 사이 바뀐 행이 개수에 섞이지 않게 함
+            marks = ", ".join("?" for _ in statuses)
+            rows = await self.backend.execute_returning(self._sql(
+                f"DELETE FROM analyses WHERE status IN ({marks}) AND updated_at < ? RETURNING status"
+            ), *statuses, _timestamp(cutoff))
+            return dict(Counter(status for status, in rows))
+        except Exception as e:
+            logger.error(f"오래된 분석 기록 삭제 실패: {e}")
+            return {}
+
+
+# 전역 분석 저장소 인스턴스
+analysis_store = AnalysisStore(settings.DATABASE_URL)
@@ -367,8 +367,8 @@ class YouTubeService:
             if not comments:
                 return None
             
-            # TODO: 실제 감정 분석 AI 모델 연동
-            # 현재는 기본 통계만 반환
+            # 수집 시점의 간단한 키워드 통계만 반환
+            # 모델 기반 가중 집계는 AIModelService.analyze_comments에서 수행
             total_comments = len(comments)
             positive_count = sum(1 for c in comments if any(word in c.text.lower() for word in ["좋아", "최고", "훌륭", "감사"]))
             negative_count = sum(1 for c in comments if any(word in c.text.lower() for word in ["싫어", "최악", "별로", "실망"]))
@@ -0,0 +1,97 @@
+"""
+동시 실행 한도 자동 조정 유틸리티
+관측된 지연 시간의 변화(큐잉 지연)를 보고 동시 실행 한도를 조정하는 Gradient 방식 리미터를 제공합니다.
+"""
+
+import math
+from typing import Any, Dict, Optional
+
+
+class AdaptiveConcurrencyLimiter:
+    """Gradient 기반 동시 실행 한도 조정기
+
+    장기 평균 지연 시간(부하가 없을 때의 기준)과 최근 지연 시간의 비율(gradient)로 큐잉 여부를
+    판단합니다. 지연이 늘면 한도를 줄이고, 지연이 유지되면 sqrt(limit)만큼의 여유를 더해 늘립니다.
+    한도의 절반도 사용하지 않는 상황에서는 관측값이 부족하므로 한도를 늘리지 않습니다.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        smoothing: float = 0.2,
+        tolerance: float = 1.5,
+        long_window: int = 100
+    ):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self._limit = float(min(self.max_limit, max(self.min_limit, initial_limit)))
+        self.smoothing = smoothing
+        self.tolerance = tolerance
+        self.long_window = max(1, long_window)
+        self.long_rtt: Optional[float] = None
+        self.last_rtt: Optional[float] = None
+        self.in_flight = 0
+        self.samples = 0
+
+    @property
+    def limit(self) -> int:
+        """현재 동시 실행 한도"""
+        return int(self._limit)
+
+    def has_capacity(self) -> bool:
+        return self.in_flight < self.limit
+
+    def acquire(self):
+        self.in_flight += 1
+
+    def release(self, rtt: Optional[float] = None):
+        """작업 완료를 알리고, rtt(초)가 주어지면 한도를 갱신합니다."""
+        in_flight = self.in_flight
+        self.in_flight = max(0, self.in_flight - 1)
+        if rtt is not None:
+            self.record(rtt, in_flight)
+
+    def record(self, rtt: float, in_flight: Optional[int] = None) -> int:
+        """지연 시간 표본을 반영해 한도를 갱신하고 새 한도를 반환합니다."""
+        if rtt <= 0:
+            return self.limit
+
+        in_flight = self.in_flight if in_flight is None else in_flight
+        self.samples += 1
+        self.last_rtt = rtt
+
+        if self.long_rtt is None:
+            self.long_rtt = rtt
+            return self.limit
+
+        self.long_rtt += (rtt - self.long_rtt) / min(self.samples, self.long_window)
+
+        # 최근 지연이 기준보다 tolerance배 이상 늘어난 만큼 한도를 줄임
+        gradient = max(0.5, min(1.0, self.tolerance * self.long_rtt / rtt))
+        queue_allowance = math.sqrt(self._limit)
+        new_limit = self._limit * gradient + queue_allowance
+
+        # 한도의 절반도 쓰지 않는 동안에는 늘리지 않음
+        if in_flight < self._limit / 2:
+            new_limit = min(new_limit, self._limit)
+
+        new_limit = self._limit * (1 - self.smoothing) + new_limit * self.smoothing
+        self._limit = min(self.max_limit, max(self.min_limit, new_limit))
+
+        # 지연이 크게 줄어들면 기준값도 빠르게 낮춰 이후의 증가를 바로 감지
+        if self.long_rtt > rtt * 2:
+            self.long_rtt = rtt * 2
+        return self.limit
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "in_flight": self.in_flight,
+            "long_rtt": self.long_rtt,
+            "last_rtt": self.last_rtt,
+            "samples": self.samples
+        }
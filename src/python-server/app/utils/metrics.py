@@ -0,0 +1,216 @@
+"""
+스트리밍 메트릭 유틸리티
+기록 길이와 무관하게 O(1)로 갱신되는 집계(구간 카운터, 지수 이동 평균, 지연 시간 히스토그램)를 제공합니다.
+"""
+
+import bisect
+import math
+import time
+from typing import List, Optional, Sequence
+
+
+def _default_latency_buckets() -> List[float]:
+    """1ms ~ 약 10분 구간을 1.25배 간격으로 나눈 히스토그램 경계값"""
+    bounds = []
+    value = 0.001
+    while value < 600.0:
+        bounds.append(value)
+        value *= 1.25
+    return bounds
+
+
+DEFAULT_LATENCY_BUCKETS = _default_latency_buckets()
+
+
+class RollingCounter:
+    """최근 window초 동안의 이벤트 수/합계를 고정 개수의 시간 슬롯으로 집계합니다."""
+
+    def __init__(self, window: float = 60.0, slots: int = 60):
+        self.window = window
+        self.slots = max(1, slots)
+        self.slot_width = window / self.slots
+        self._counts = [0] * self.slots
+        self._sums = [0.0] * self.slots
+        self._slot_ids = [-1] * self.slots
+
+    def add(self, value: float = 1.0, now: Optional[float] = None):
+        """현재 시각의 슬롯에 값을 더합니다."""
+        index = self._slot(now)
+        self._counts[index] += 1
+        self._sums[index] += value
+
+    def count(self, now: Optional[float] = None) -> int:
+        """구간 내 이벤트 수"""
+        current = self._slot_id(now)
+        return sum(c for c, slot_id in zip(self._counts, self._slot_ids) if current - slot_id < self.slots)
+
+    def total(self, now: Optional[float] = None) -> float:
+        """구간 내 값의 합계"""
+        current = self._slot_id(now)
+        return sum(s for s, slot_id in zip(self._sums, self._slot_ids) if current - slot_id < self.slots)
+
+    def mean(self, now: Optional[float] = None) -> float:
+        """구간 내 값의 평균"""
+        count = self.count(now)
+        return self.total(now) / count if count else 0.0
+
+    def reset(self):
+        self._counts = [0] * self.slots
+        self._sums = [0.0] * self.slots
+        self._slot_ids = [-1] * self.slots
+
+    def _slot_id(self, now: Optional[float]) -> int:
+        return int((time.time() if now is None else now) / self.slot_width)
+
+    def _slot(self, now: Optional[float]) -> int:
+        slot_id = self._slot_id(now)
+        index = slot_id % self.slots
+        if self._slot_ids[index] != slot_id:
+            # 오래된 슬롯 재사용
+            self._slot_ids[index] = slot_id
+            self._counts[index] = 0
+            self._sums[index] = 0.0
+        return index
+
+
+class EWMA:
+    """시간 기반 지수 이동 평균 (half_life초마다 과거 값의 가중치가 절반으로 감소)"""
+
+    def __init__(self, half_life: float = 60.0):
+        self.half_life = half_life
+        self.value: Optional[float] = None
+        self._last_update: Optional[float] = None
+
+    def update(self, sample: float, now: Optional[float] = None):
+        now = time.time() if now is None else now
+        if self.value is None:
+            self.value = sample
+        else:
+            elapsed = max(0.0, now - self._last_update)
+            alpha = 1.0 - math.pow(0.5, elapsed / self.half_life) if self.half_life > 0 else 1.0
+            # 같은 시각에 여러 표본이 들어와도 반영되도록 최소 가중치 보장
+            alpha = max(alpha, 0.05)
+            self.value += alpha * (sample - self.value)
+        self._last_update = now
+
+    def get(self, default: float = 0.0) -> float:
+        return self.value if self.value is not None else default
+
+    def reset(self):
+        self.value = None
+        self._last_update = None
+
+
+class LatencyHistogram:
+    """고정 경계 히스토그램으로 분위수(p50/p95/p99)를 근사합니다."""
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.bounds = list(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+
+    def add(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+
+    def merge(self, other: "LatencyHistogram"):
+        for i, c in enumerate(other.counts):
+            self.counts[i] += c
+        self.count += other.count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """q 분위수의 상한 경계값을 반환합니다. 표본이 없으면 None"""
+        return _quantile(self.bounds, self.counts, self.count, q)
+
+    def reset(self):
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+
+
+class RollingHistogram:
+    """최근 window초 동안의 지연 시간 분포를 시간 슬롯별 히스토그램으로 유지합니다."""
+
+    def __init__(self, window: float = 30.0, slots: int = 6, bounds: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.window = window
+        self.slots = max(1, slots)
+        self.slot_width = window / self.slots
+        self.bounds = list(bounds)
+        self._histograms = [[0] * (len(self.bounds) + 1) for _ in range(self.slots)]
+        self._totals = [0] * self.slots
+        self._slot_ids = [-1] * self.slots
+
+    def add(self, value: float, now: Optional[float] = None):
+        slot_id = int((time.time() if now is None else now) / self.slot_width)
+        index = slot_id % self.slots
+        if self._slot_ids[index] != slot_id:
+            self._slot_ids[index] = slot_id
+            self._histograms[index] = [0] * (len(self.bounds) + 1)
+            self._totals[index] = 0
+        self._histograms[index][bisect.bisect_left(self.bounds, value)] += 1
+        self._totals[index] += 1
+
+    def count(self, now: Optional[float] = None) -> int:
+        return sum(self._totals[i] for i in self._live_slots(now))
+
+    def quantile(self, q: float, now: Optional[float] = None) -> Optional[float]:
+        live = self._live_slots(now)
+        counts = [sum(self._histograms[i][b] for i in live) for b in range(len(self.bounds) + 1)]
+        return _quantile(self.bounds, counts, sum(counts), q)
+
+    def reset(self):
+        self._histograms = [[0] * (len(self.bounds) + 1) for _ in range(self.slots)]
+        self._totals = [0] * self.slots
+        self._slot_ids = [-1] * self.slots
+
+    def _live_slots(self, now: Optional[float]) -> List[int]:
+        current = int((time.time() if now is None else now) / self.slot_width)
+        return [i for i, slot_id in enumerate(self._slot_ids) if current - slot_id < self.slots]
+
+
+class DecayedLinearFit:
+    """지수 감쇠 가중치를 둔 단순 선형 회귀 (y = a + b·x)를 누적 합계로 유지합니다."""
+
+    def __init__(self, decay: float = 0.98):
+        self.decay = decay
+        self.reset()
+
+    def add(self, x: float, y: float):
+        d = self.decay
+        self.n = self.n * d + 1.0
+        self.sum_x = self.sum_x * d + x
+        self.sum_y = self.sum_y * d + y
+        self.sum_xx = self.sum_xx * d + x * x
+        self.sum_xy = self.sum_xy * d + x * y
+        self.samples += 1
+
+    def predict(self, x: float) -> Optional[float]:
+        """x에서의 예측값. 표본이 2개 미만이면 None"""
+        if self.samples < 2:
+            return None
+        mean_x = self.sum_x / self.n
+        mean_y = self.sum_y / self.n
+        var_x = self.sum_xx / self.n - mean_x * mean_x
+        if var_x <= 1e-12:
+            return mean_y
+        slope = (self.sum_xy / self.n - mean_x * mean_y) / var_x
+        return mean_y + slope * (x - mean_x)
+
+    def reset(self):
+        self.n = 0.0
+        self.sum_x = 0.0
+        self.sum_y = 0.0
+        self.sum_xx = 0.0
+        self.sum_xy = 0.0
+        self.samples = 0
+
+
+def _quantile(bounds: List[float], counts: List[int], total: int, q: float) -> Optional[float]:
+    if total <= 0:
+        return None
+    rank = q * total
+    cumulative = 0
+    for i, c in enumerate(counts):
+        cumulative += c
+        if cumulative >= rank and c > 0:
+            return bounds[i] if i < len(bounds) else bounds[-1]
+    return bounds[-1]
@@ -0,0 +1,216 @@
+"""
+리소스 텔레메트리 유틸리티
+프로세스 메모리/CPU 시간, 모델별 상주 메모리, torch 할당자 통계, 이벤트 루프 지연,
+기본 실행기(스레드 풀) 대기열 길이를 주기적으로 측정합니다.
+"""
+
+import asyncio
+import os
+import resource
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+import torch
+from loguru import logger
+
+
+@dataclass
+class ResourceSnapshot:
+    """한 시점의 리소스 측정값"""
+    timestamp: float = 0.0
+    process_rss_bytes: int = 0
+    system_memory_bytes: int = 0
+    memory_usage: float = 0.0  # 시스템 메모리 대비 프로세스 RSS 비율 (%)
+    cpu_time_seconds: float = 0.0  # 프로세스 누적 CPU 시간 (user + system)
+    cpu_percent: float = 0.0  # 직전 측정 이후 CPU 사용률 (코어 1개 = 100%)
+    event_loop_lag: float = 0.0  # 이벤트 루프 지연 (초)
+    executor_queue_depth: int = 0  # 기본 실행기에서 스레드를 기다리는 작업 수
+    gpu_utilization: Optional[float] = None  # GPU 사용률 (%), 측정 불가 시 None
+    gpu_memory_allocated_bytes: int = 0
+    gpu_memory_reserved_bytes: int = 0
+    gpu_memory_total_bytes: int = 0
+    gpu_memory_usage: Optional[float] = None  # GPU 전체 메모리 대비 예약 메모리 비율 (%)
+    model_memory_bytes: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def memory_pressure(self) -> float:
+        """호스트/GPU 메모리 중 더 높은 사용률 (0~1)"""
+        return max(self.memory_usage, self.gpu_memory_usage or 0.0) / 100
+
+    def to_dict(self) -> Dict[str, Any]:
+        mb = 1024 ** 2
+        return {
+            "timestamp": self.timestamp,
+            "process_rss_mb": round(self.process_rss_bytes / mb, 1),
+            "memory_usage": round(self.memory_usage, 1),
+            "cpu_time_seconds": round(self.cpu_time_seconds, 2),
+            "cpu_percent": round(self.cpu_percent, 1),
+            "event_loop_lag_ms": round(self.event_loop_lag * 1000, 2),
+            "executor_queue_depth": self.executor_queue_depth,
+            "gpu_utilization": self.gpu_utilization,
+            "gpu_memory_allocated_mb": round(self.gpu_memory_allocated_bytes / mb, 1),
+            "gpu_memory_reserved_mb": round(self.gpu_memory_reserved_bytes / mb, 1),
+            "gpu_memory_usage": round(self.gpu_memory_usage, 1) if self.gpu_memory_usage is not None else None,
+            "model_memory_mb": {
+                name: round(size / mb, 1) for name, size in self.model_memory_bytes.items()
+            }
+        }
+
+
+def process_rss_bytes() -> int:
+    """현재 프로세스의 상주 메모리(RSS)를 바이트로 반환합니다."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # /proc이 없는 환경에서는 최대 RSS로 대체 (macOS는 바이트, Linux는 KB 단위)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def system_memory_bytes() -> int:
+    """시스템 전체 물리 메모리를 바이트로 반환합니다. 알 수 없으면 0"""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (ValueError, OSError, AttributeError):
+        return 0
+
+
+def process_cpu_seconds() -> float:
+    """프로세스 누적 CPU 시간(user + system)을 초 단위로 반환합니다."""
+    times = os.times()
+    return times.user + times.system
+
+
+def executor_queue_depth(loop: asyncio.AbstractEventLoop) -> int:
+    """이벤트 루프 기본 실행기(asyncio.to_thread가 사용)의 대기 작업 수를 반환합니다."""
+    executor = getattr(loop, "_default_executor", None)
+    work_queue = getattr(executor, "_work_queue", None)
+    return work_queue.qsize() if work_queue is not None else 0
+
+
+def module_resident_bytes(*modules: Any) -> int:
+    """torch 모듈들의 파라미터/버퍼가 차지하는 메모리를 바이트로 반환합니다. 공유 텐서는 한 번만 셉니다."""
+    seen = set()
+    total = 0
+    for module in modules:
+        if not isinstance(module, torch.nn.Module):
+            continue
+        for tensor in list(module.parameters()) + list(module.buffers()):
+            key = (tensor.device, tensor.data_ptr())
+            if key in seen:
+                continue
+            seen.add(key)
+            total += tensor.numel() * tensor.element_size()
+    return total
+
+
+def torch_allocator_stats() -> Dict[str, Any]:
+    """CUDA 할당자 통계를 반환합니다. GPU가 없으면 빈 딕셔너리"""
+    if not torch.cuda.is_available():
+        return {}
+
+    device = torch.cuda.current_device()
+    stats = {
+        "allocated": torch.cuda.memory_allocated(device),
+        "reserved": torch.cuda.memory_reserved(device),
+        "total": torch.cuda.get_device_properties(device).total_memory,
+        "utilization": None
+    }
+    try:
+        # pynvml이 설치된 경우에만 측정 가능
+        stats["utilization"] = float(torch.cuda.utilization(device))
+    except Exception:
+        pass
+    return stats
+
+
+class ResourceSampler:
+    """백그라운드 작업으로 리소스를 주기적으로 측정합니다.
+
+    이벤트 루프 지연은 interval초 대기 후 실제로 깨어난 시각과의 차이로 측정합니다.
+    모델 메모리는 파라미터 전체를 순회하므로 model_refresh_interval초마다만 다시 계산합니다.
+    """
+
+    def __init__(
+        self,
+        interval: float = 5.0,
+        model_memory_provider: Optional[Callable[[], Dict[str, int]]] = None,
+        model_refresh_interval: float = 60.0
+    ):
+        self.interval = interval
+        self.model_memory_provider = model_memory_provider
+        self.model_refresh_interval = model_refresh_interval
+        self.latest = ResourceSnapshot()
+        self._task: Optional[asyncio.Task] = None
+        self._last_cpu: Optional[float] = None
+        self._last_wall: Optional[float] = None
+        self._last_model_refresh = 0.0
+
+    def ensure_started(self):
+        """측정 작업이 실행 중이 아니면 시작합니다. 실행 중인 이벤트 루프 안에서 호출해야 합니다."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        lag = 0.0
+        try:
+            while True:
+                try:
+                    self.latest = self.sample(loop, lag)
+                except Exception as e:
+                    logger.warning(f"리소스 측정 실패: {e}")
+
+                expected = time.monotonic() + self.interval
+                await asyncio.sleep(self.interval)
+                lag = max(0.0, time.monotonic() - expected)
+        except asyncio.CancelledError:
+            pass
+
+    def sample(self, loop: Optional[asyncio.AbstractEventLoop] = None, event_loop_lag: float = 0.0) -> ResourceSnapshot:
+        """현재 리소스를 측정합니다."""
+        now = time.time()
+        wall = time.monotonic()
+        cpu = process_cpu_seconds()
+        cpu_percent = 0.0
+        if self._last_cpu is not None and wall > self._last_wall:
+            cpu_percent = (cpu - self._last_cpu) / (wall - self._last_wall) * 100
+        self._last_cpu, self._last_wall = cpu, wall
+
+        rss = process_rss_bytes()
+        total_memory = system_memory_bytes()
+
+        model_memory = self.latest.model_memory_bytes
+        if self.model_memory_provider is not None and now - self._last_model_refresh >= self.model_refresh_interval:
+            model_memory = self.model_memory_provider()
+            self._last_model_refresh = now
+
+        snapshot = ResourceSnapshot(
+            timestamp=now,
+            process_rss_bytes=rss,
+            system_memory_bytes=total_memory,
+            memory_usage=rss / total_memory * 100 if total_memory else 0.0,
+            cpu_time_seconds=cpu,
+            cpu_percent=cpu_percent,
+            event_loop_lag=event_loop_lag,
+            executor_queue_depth=executor_queue_depth(loop) if loop is not None else 0,
+            model_memory_bytes=model_memory
+        )
+
+        allocator = torch_allocator_stats()
+        if allocator:
+            snapshot.gpu_utilization = allocator["utilization"]
+            snapshot.gpu_memory_allocated_bytes = allocator["allocated"]
+            snapshot.gpu_memory_reserved_bytes = allocator["reserved"]
+            snapshot.gpu_memory_total_bytes = allocator["total"]
+            snapshot.gpu_memory_usage = allocator["reserved"] / allocator["total"] * 100 if allocator["total"] else None
+
+        return snapshot
@@ -0,0 +1,110 @@
+"""
+텍스트 유틸리티
+문장 분리와 사실 확인 대상 문장 선별 기능을 제공합니다.
+"""
+
+import re
+from typing import Any, Callable, List, Optional, Sequence
+
+import numpy as np
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+# 사실성 지표들
+FACTUAL_INDICATORS = [
+    "연구", "데이터", "통계", "조사", "보고서", "논문", "전문가",
+    "공식", "공식 발표", "확인됨", "검증됨", "사실", "정확한"
+]
+
+# 의심스러운(완곡한) 지표들
+SUSPICIOUS_INDICATORS = [
+    "소문", "추측", "아마도", "어쩌면", "불확실", "미확인",
+    "의심", "혹시", "아마", "추정", "가능성"
+]
+
+# 극단적(단정적) 표현들
+EXTREME_INDICATORS = [
+    "절대", "완벽", "최고", "최악", "완전히", "전혀", "100%",
+    "완벽하게", "완전하게", "절대적으로"
+]
+
+# 수치 주장 (퍼센트, 인원, 금액, 날짜 등)
+NUMERIC_CLAIM_PATTERN = re.compile(
+    r'\d+(?:[.,]\d+)*\s*(?:%|퍼센트|명|개|년|월|일|배|원|달러|만|억|조)'
+)
+
+# 고유명사 추정 (기관명 접미사, 영문 대문자 단어/약어)
+ENTITY_PATTERN = re.compile(
+    r'[가-힣]{2,}(?:정부|부|청|처|원|대학교|대학|연구소|연구원|협회|위원회|은행|공사|재단|법원)'
+    r'|\b[A-Z][A-Za-z]{2,}\b|\b[A-Z]{2,}\b'
+)
+
+SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[.!?。])\s+|\n+')
+
+
+def split_sentences(text: str, min_length: int = 10) -> List[str]:
+    """텍스트를 문장 단위로 분리합니다. min_length 이하의 짧은 문장은 제외합니다."""
+    if not text:
+        return []
+
+    sentences = [s.strip(" .") for s in SENTENCE_SPLIT_PATTERN.split(text)]
+    return [s for s in sentences if len(s) > min_length]
+
+
+def score_sentence_salience(sentence: str) -> float:
+    """문장이 검증 가능한 주장을 담고 있을 가능성을 점수로 계산합니다."""
+    numeric_count = len(NUMERIC_CLAIM_PATTERN.findall(sentence))
+    entity_count = len(ENTITY_PATTERN.findall(sentence))
+    factual_count = sum(1 for indicator in FACTUAL_INDICATORS if indicator in sentence)
+    marker_count = sum(
+        1 for indicator in SUSPICIOUS_INDICATORS + EXTREME_INDICATORS if indicator in sentence
+    )
+
+    return (
+        1.0 * min(numeric_count, 3) +
+        0.5 * min(entity_count, 3) +
+        0.7 * min(factual_count, 3) +
+        0.5 * min(marker_count, 3)
+    )
+
+
+def select_salient_sentences(
+    sentences: Sequence[str],
+    k: int = 5,
+    embed: Optional[Callable[[List[str]], Any]] = None,
+    centrality_weight: float = 1.0,
+    candidate_pool: int = 32
+) -> List[str]:
+    """주장을 담은 상위 k개 문장을 원래 순서대로 선택합니다.
+
+    모든 문장에 정규식 기반 점수를 매긴 뒤, embed가 주어지면 상위 후보들만
+    임베딩하여 후보 중심(centroid)과의 코사인 유사도를 중심성 점수로 더합니다.
+    따라서 텍스트 길이와 무관하게 임베딩 및 NLI 비용이 일정하게 유지됩니다.
+    """
+    sentences = list(sentences)
+    if len(sentences) <= k:
+        return sentences
+
+    scores = [score_sentence_salience(sentence) for sentence in sentences]
+
+    if embed is not None:
+        pool_size = max(candidate_pool, k)
+        candidates = sorted(range(len(sentences)), key=lambda i: (-scores[i], i))[:pool_size]
+        try:
+            vectors = np.asarray(embed([sentences[i] for i in candidates]), dtype=float)
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.where(norms == 0, 1.0, norms)
+            centroid = vectors.mean(axis=0)
+            centroid_norm = np.linalg.norm(centroid)
+            if centroid_norm > 0:
+                centrality = vectors @ (centroid / centroid_norm)
+                for i, value in zip(candidates, centrality):
+                    scores[i] += centrality_weight * float(value)
+        except Exception as e:
+            logger.warning(f"문장 임베딩 중심성 계산 실패, 정규식 점수만 사용: {e}")
+
+    top = sorted(range(len(sentences)), key=lambda i: (-scores[i], i))[:k]
+    return [sentences[i] for i in sorted(top)]
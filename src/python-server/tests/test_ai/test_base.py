@@ -0,0 +1,86 @@
+"""
+AI 모델 기본 클래스 테스트
+"""
+
+import time
+
+import pytest
+
+from app.ai.base import BaseAIModel
+
+pytestmark = pytest.mark.asyncio
+
+
+class CountingPipeline:
+    """호출 횟수를 세는 파이프라인"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, text, **kwargs):
+        self.calls += 1
+        return [{"label": "ok", "score": 1.0}]
+
+
+class DummyModel(BaseAIModel):
+    """테스트용 분석기"""
+
+    def __init__(self):
+        super().__init__("dummy_model")
+        self.dummy_pipeline = CountingPipeline()
+
+    def analyze(self, text: str, **kwargs):
+        return None
+
+    def load_model(self) -> bool:
+        return True
+
+    async def analyze_heuristic(self, text: str, **kwargs):
+        return None
+
+
+class TestBaseAIModel:
+    """기본 클래스 테스트"""
+
+    @pytest.fixture
+    def model(self):
+        model = DummyModel()
+        model.create_replica_pool("dummy_pipeline", size=1)
+        return model
+
+    async def test_heuristic_is_required(self):
+        """휴리스틱 분석을 구현하지 않은 분석기는 만들 수 없어야 함"""
+        class IncompleteModel(BaseAIModel):
+            def analyze(self, text: str, **kwargs):
+                return None
+
+            def load_model(self) -> bool:
+                return True
+
+        with pytest.raises(TypeError):
+            IncompleteModel("incomplete")
+
+    async def test_run_pipeline_within_deadline(self, model):
+        """마감 전에는 복제본으로 추론해야 함"""
+        result = await model.run_pipeline("dummy_pipeline", "텍스트", deadline=time.monotonic() + 10)
+
+        assert result[0]["label"] == "ok"
+        assert model.dummy_pipeline.calls == 1
+        assert model.replica_pools["dummy_pipeline"].available == 1
+
+    async def test_run_pipeline_skips_inference_after_deadline(self, model):
+        """마감이 지난 호출은 추론하지 않고 복제본을 돌려줘야 함"""
+        with pytest.raises(TimeoutError):
+            await model.run_pipeline("dummy_pipeline", "텍스트", deadline=time.monotonic() - 1)
+
+        assert model.dummy_pipeline.calls == 0
+        assert model.replica_pools["dummy_pipeline"].available == 1
+
+    async def test_replica_wait_is_bounded_by_deadline(self, model):
+        """모든 복제본이 사용 중이면 마감 시각까지만 기다려야 함"""
+        with model.pipeline_replica("dummy_pipeline"):
+            with pytest.raises(TimeoutError):
+                await model.run_pipeline("dummy_pipeline", "텍스트", deadline=time.monotonic() + 0.05)
+
+        assert model.dummy_pipeline.calls == 0
+        assert model.replica_pools["dummy_pipeline"].available == 1
@@ -238,3 +238,40 @@ class TestFactChecker:
         
         # 테스트 후 cleanup
         await checker.cleanup()
+    
+    async def test_claim_sentence_selection(self, checker):
+        """긴 텍스트에서 주장을 담은 문장 선별 테스트"""
+        filler = ["오늘은 여러 가지 이야기를 나누어 보겠습니다."] * 20
+        claims = [
+            "통계청 조사에 따르면 실업률은 3.5%로 집계되었습니다.",
+            "정부 공식 발표에 의하면 1,200명이 지원했습니다."
+        ]
+        text = " ".join(filler[:10] + [claims[0]] + filler[10:] + [claims[1]])
+        
+        sentences = checker._select_claim_sentences(text)
+        
+        assert len(sentences) <= checker.max_claim_sentences
+        assert any("실업률" in sentence for sentence in sentences)
+        assert any("1 200명" in sentence for sentence in sentences)  # 전처리에서 쉼표는 공백으로 바뀜
+        
+        # 테스트 후 cleanup
+        await checker.cleanup()
+    
+    async def test_claim_sentence_selection_uses_shared_encoder(self, checker):
+        """공유 문장 임베딩 함수가 연결되면 주장 문장 선별에 사용되는지 테스트"""
+        encoded = []
+        
+        def embed(sentences):
+            encoded.append(list(sentences))
+            return [[1.0, 0.0] for _ in sentences]
+        
+        checker.sentence_encoder_provider = lambda: embed
+        text = " ".join(f"{i}번째 문장은 실험 결과 {i}%를 기록했습니다." for i in range(20))
+        
+        sentences = checker._select_claim_sentences(text, checker.sentence_encoder_provider())
+        
+        assert len(sentences) <= checker.max_claim_sentences
+        assert len(encoded) == 1
+        
+        # 테스트 후 cleanup
+        await checker.cleanup()
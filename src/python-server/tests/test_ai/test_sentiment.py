@@ -2,6 +2,8 @@
 감정 분석 모델 테스트
 """
 
+import time
+
 import pytest
 from app.ai.sentiment import SentimentAnalyzer
 
@@ -133,3 +135,69 @@ class TestSentimentAnalyzer:
         assert result is not None
         # overall_sentiment는 -1에서 1 사이의 값이어야 함
         assert -1.0 <= result.overall_sentiment <= 1.0
+    
+    def test_batch_analysis_uses_length_buckets(self, analyzer):
+        """배치 감정 분석이 길이별 버킷 단위로 추론하는지 테스트"""
+        calls = []
+        
+        def fake_pipeline(texts, **kwargs):
+            calls.append(list(texts))
+            return [
+                [
+                    {"label": "LABEL_2", "score": 0.7},
+                    {"label": "LABEL_1", "score": 0.2},
+                    {"label": "LABEL_0", "score": 0.1}
+                ]
+                for _ in texts
+            ]
+        
+        analyzer.sentiment_pipeline = fake_pipeline
+        analyzer.is_loaded = True
+        
+        texts = [f"좋은 댓글 {'가' * (i % 17)}" for i in range(100)]
+        results, forward_passes = analyzer.analyze_batch_with_passes(texts)
+        
+        assert len(results) == 100
+        assert len(calls) == 2  # 100개 댓글 -> 2번의 forward pass
+        assert forward_passes == len(calls)
+        assert all(len(calls[0][i]) <= len(calls[0][i + 1]) for i in range(len(calls[0]) - 1))
+        assert all(r.dominant_emotion == "positive" for r in results)
+        assert results[0].emotion_breakdown["negative"] == 0.1
+    
+    def test_batch_analysis_stops_after_deadline(self, analyzer):
+        """마감 시각이 지나면 추론하지 않고 휴리스틱 결과(degraded)를 반환하는지 테스트"""
+        calls = []
+        
+        def fake_pipeline(texts, **kwargs):
+            calls.append(list(texts))
+            return []
+        
+        analyzer.sentiment_pipeline = fake_pipeline
+        analyzer.is_loaded = True
+        
+        results = analyzer.analyze_batch(["좋은 댓글", "나쁜 댓글"], deadline=time.monotonic() - 1)
+        
+        assert calls == []
+        assert len(results) == 2
+        assert all(r.degraded for r in results)
+        assert analyzer.analyze_batch_with_passes(["좋은 댓글"], deadline=time.monotonic() - 1)[1] == 0
+    
+    def test_batch_forward_passes_exclude_failed_calls(self, analyzer):
+        """실패한 파이프라인 호출은 forward pass 수에 포함하지 않는지 테스트"""
+        calls = []
+        
+        def flaky_pipeline(texts, **kwargs):
+            calls.append(list(texts))
+            if len(calls) == 1:
+                raise RuntimeError("추론 실패")
+            return [[{"label": "LABEL_1", "score": 1.0}] for _ in texts]
+        
+        analyzer.sentiment_pipeline = flaky_pipeline
+        analyzer.is_loaded = True
+        
+        texts = [f"댓글 {i}" for i in range(analyzer.batch_size + 1)]
+        results, forward_passes = analyzer.analyze_batch_with_passes(texts)
+        
+        assert len(results) == len(texts)
+        assert len(calls) == 2
+        assert forward_passes == 1
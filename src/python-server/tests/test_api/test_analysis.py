@@ -0,0 +1,261 @@
+"""
+분석 API 테스트
+배치 처리기를 가짜 객체로 바꿔 NDJSON 대량 등록과 결과 스트리밍 엔드포인트를 검증합니다.
+"""
+
+import asyncio
+import json
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.v1 import analysis as analysis_module
+from app.api.v1.analysis import _iter_ndjson_lines, stream_batch_results
+from app.core.exceptions import RateLimitError
+from app.services.batch_processor import BatchResult, get_batch_processor
+from main import app
+
+
+class FakeBatchProcessor:
+    """등록된 요청을 기록하는 배치 처리기"""
+
+    def __init__(self):
+        self.items = []
+        self.chunks = []
+        self.handles = {}
+        self.cancellable = set()
+        self.capacity = None
+        self.results = []
+        self.cancelled = []
+        self.hold_stream = False  # True이면 결과를 모두 보낸 뒤 스트림을 열어 둠
+
+    async def add_requests(self, items, priority=1):
+        if self.capacity is not None and len(self.items) + len(items) > self.capacity:
+            raise RateLimitError("대기열이 가득 찼습니다", details={"retry_after": 3})
+        self.items.extend(items)
+        self.chunks.append(len(items))
+        return [str(uuid.uuid4()) for _ in items]
+
+    def create_batch_handle(self, request_ids):
+        batch_id = str(uuid.uuid4())
+        self.handles[batch_id] = list(request_ids)
+        return batch_id
+
+    def get_batch_handle(self, batch_id):
+        return self.handles.get(batch_id)
+
+    async def iter_results(self, request_ids, timeout=None):
+        for result in self.results:
+            yield result
+        if self.hold_stream:
+            await asyncio.Event().wait()
+
+    async def cancel(self, request_id):
+        if request_id not in self.cancellable:
+            return False
+        self.cancellable.discard(request_id)
+        self.cancelled.append(request_id)
+        return True
+
+
+@pytest.fixture
+def processor():
+    processor = FakeBatchProcessor()
+    app.dependency_overrides[get_batch_processor] = lambda: processor
+    yield processor
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def test_ndjson_registers_lines_and_reports_errors(client, processor):
+    """유효한 줄만 등록하고 잘못된 줄은 줄 번호와 함께 보고해야 함"""
+    body = "\n".join([
+        json.dumps({"text": "첫 번째 텍스트", "user_id": "u1"}),
+        "",
+        "{not json",
+        json.dumps({"text": "두 번째 텍스트", "priority": 5})
+    ])
+
+    response = client.post("/api/v1/analysis/analyze/batch/ndjson", content=body)
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["total_requests"] == 2
+    assert data["error_count"] == 1
+    assert data["errors"][0]["line"] == 3
+    assert processor.handles[data["batch_id"]] == data["request_ids"]
+    assert [item["metadata"]["line"] for item in processor.items] == [1, 4]
+    assert processor.items[1]["priority"] == 5
+
+
+def test_ndjson_registers_in_chunks(client, processor):
+    """chunk_size개씩 묶어 큐에 넣어야 함"""
+    body = "\n".join(json.dumps({"text": f"텍스트 {i}"}) for i in range(5))
+
+    response = client.post("/api/v1/analysis/analyze/batch/ndjson?chunk_size=2", content=body)
+
+    assert response.status_code == 200
+    assert processor.chunks == [2, 2, 1]
+    assert response.json()["data"]["total_requests"] == 5
+
+
+class ChunkedRequest:
+    """본문을 정해진 청크로 나눠 보내는 요청"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def stream(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+@pytest.mark.asyncio
+async def test_ndjson_lines_split_across_chunks():
+    """여러 청크에 걸친 줄을 이어 붙이고, 상한을 넘는 줄은 다음 줄바꿈까지 버리고 None으로 알려야 함"""
+    request = ChunkedRequest([b"ab", b"c\nde", b"f\n" + b"x" * 6, b"x" * 6, b"xx\ng", b"h"])
+
+    lines = [line async for line in _iter_ndjson_lines(request, max_line_bytes=8)]
+
+    assert lines == [b"abc", b"def", None, b"gh"]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_line_over_limit_within_one_chunk():
+    """한 청크 안에 들어 있는 긴 줄도 상한을 넘으면 None이어야 함"""
+    request = ChunkedRequest([b"0123456789\nok\n"])
+
+    lines = [line async for line in _iter_ndjson_lines(request, max_line_bytes=8)]
+
+    assert lines == [None, b"ok"]
+
+
+def test_ndjson_reports_oversized_line(client, processor, monkeypatch):
+    """상한을 넘는 줄은 줄 번호와 함께 오류로 보고하고 다음 줄부터 계속 등록해야 함"""
+    monkeypatch.setattr(analysis_module.settings, "BULK_MAX_LINE_BYTES", 64)
+    body = "\n".join([
+        json.dumps({"text": "짧은 텍스트"}),
+        json.dumps({"text": "긴 텍스트 " * 20}),
+        json.dumps({"text": "다음 텍스트"})
+    ])
+
+    response = client.post("/api/v1/analysis/analyze/batch/ndjson", content=body)
+
+    data = response.json()["data"]
+    assert data["total_requests"] == 2
+    assert data["error_count"] == 1
+    assert data["errors"][0]["line"] == 2
+    assert [item["metadata"]["line"] for item in processor.items] == [1, 3]
+
+
+def test_ndjson_reports_partial_registration(client, processor):
+    """중간에 대기열이 차면 등록된 요청과 거절된 줄 번호를 알려줘야 함"""
+    processor.capacity = 2
+    body = "\n".join(json.dumps({"text": f"텍스트 {i}"}) for i in range(5))
+
+    response = client.post("/api/v1/analysis/analyze/batch/ndjson?chunk_size=2", content=body)
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["status"] == "partial"
+    assert payload["data"]["total_requests"] == 2
+    assert payload["data"]["rejected_from_line"] == 3
+    assert payload["data"]["retry_after"] == 3
+
+
+def test_ndjson_rejected_entirely_returns_429(client, processor):
+    """첫 묶음부터 거절되면 429를 반환해야 함"""
+    processor.capacity = 0
+
+    response = client.post("/api/v1/analysis/analyze/batch/ndjson", content=json.dumps({"text": "텍스트"}))
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "3"
+
+
+def test_client_class_is_not_taken_from_request(client, processor):
+    """클라이언트 유형은 엔드포인트로 정해지며 요청 파라미터로 바꿀 수 없어야 함"""
+    body = json.dumps({"text": "대량 요청"})
+
+    response = client.post(
+        "/api/v1/analysis/analyze/batch/ndjson?client_class=interactive", content=body
+    )
+
+    assert response.status_code == 200
+    assert processor.items[0]["metadata"]["client_class"] == "backfill"
+
+
+def test_stream_results_as_ndjson(client, processor):
+    """완료된 결과를 한 줄씩 보내고 마지막에 남은 요청 목록을 보내야 함"""
+    batch_id = processor.create_batch_handle(["r1", "r2"])
+    processor.results = [BatchResult(request_id="r2", result={"score": 80}, processing_time=0.1, status="completed")]
+
+    response = client.get(f"/api/v1/analysis/batch/{batch_id}/stream")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[0]["type"] == "result"
+    assert lines[0]["request_id"] == "r2"
+    assert lines[0]["result"] == {"score": 80}
+    assert lines[-1] == {"type": "end", "batch_id": batch_id, "total": 2, "completed": 1, "pending": ["r1"]}
+
+
+def test_stream_results_as_sse(client, processor):
+    """format=sse이면 이벤트 스트림 형식으로 보내야 함"""
+    batch_id = processor.create_batch_handle(["r1"])
+    processor.results = [BatchResult(request_id="r1", result=None, processing_time=0.0, status="cancelled")]
+
+    response = client.get(f"/api/v1/analysis/batch/{batch_id}/stream?format=sse")
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = response.text.strip().split("\n\n")
+    assert events[0].startswith("event: result\ndata: ")
+    assert events[-1].startswith("event: end\ndata: ")
+
+
+@pytest.mark.asyncio
+async def test_stream_disconnect_cancels_undelivered_requests():
+    """스트림이 중간에 닫히면 아직 전달하지 못한 요청만 취소해야 함"""
+    processor = FakeBatchProcessor()
+    batch_id = processor.create_batch_handle(["r1", "r2", "r3"])
+    processor.results = [BatchResult(request_id="r2", result=None, processing_time=0.1, status="completed")]
+    processor.cancellable.update(["r1", "r2", "r3"])
+    processor.hold_stream = True
+
+    response = await stream_batch_results(batch_id, format="ndjson", timeout=60.0, batch_processor=processor)
+    body = response.body_iterator
+    first = json.loads(await body.__anext__())
+    pending = asyncio.ensure_future(body.__anext__())
+    await asyncio.sleep(0)
+
+    # 클라이언트 연결 해제 시 스트리밍 작업이 취소되는 상황
+    pending.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await pending
+
+    assert first["request_id"] == "r2"
+    assert processor.cancelled == ["r1", "r3"]
+
+
+def test_stream_unknown_batch_returns_404(client, processor):
+    """없는 배치 핸들은 404를 반환해야 함"""
+    response = client.get("/api/v1/analysis/batch/unknown/stream")
+
+    assert response.status_code == 404
+
+
+def test_cancel_batch_request(client, processor):
+    """취소 가능한 요청은 취소 상태를 반환하고, 두 번째 취소는 404여야 함"""
+    processor.cancellable.add("r1")
+
+    response = client.delete("/api/v1/analysis/batch/r1")
+
+    assert response.status_code == 200
+    assert response.json()["data"] == {"request_id": "r1", "status": "cancelled"}
+    assert client.delete("/api/v1/analysis/batch/r1").status_code == 404
@@ -0,0 +1,468 @@
+"""
+분석 서비스 테스트
+단계별 파이프라인(수집 -> 준비 -> 추론 -> 정리)의 순서, 취소, 실패 처리와 워커 풀, 통계, 결과 재사용을 검증합니다.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+
+from app.ai.bias import BiasDetector
+from app.ai.classifier import ContentClassifier
+from app.ai.credibility import CredibilityAnalyzer
+from app.ai.fact_checker import FactChecker
+from app.ai.sentiment import SentimentAnalyzer
+from app.models.analysis import AnalysisStatus
+from app import services as services_package
+from app.services import analysis as analysis_module
+from app.services.analysis import (
+    ACTIVE_STATUSES,
+    TERMINAL_STATUSES,
+    AnalysisService,
+)
+from app.services.ai_models import ai_model_service
+from app.services.storage import AnalysisStore
+from app.utils.concurrency import AdaptiveConcurrencyLimiter
+
+pytestmark = pytest.mark.asyncio
+
+VIDEO_URL = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+SAMPLE_TEXT = "연구에 따르면 2023년 국내 인구는 5천만 명입니다. 전문가는 이 통계가 매우 중요하다고 말했습니다."
+
+
+class FakeCache:
+    """메모리 딕셔너리 기반 캐시"""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.data[key] = value
+        return True
+
+
+async def wait_for_status(service, analysis_id, statuses, timeout=2.0):
+    """분석이 지정한 상태가 될 때까지 기다립니다."""
+    async def poll():
+        while True:
+            analysis = await service.get_analysis_status(analysis_id)
+            if analysis and analysis["status"] in statuses:
+                return analysis
+            await asyncio.sleep(0.01)
+    return await asyncio.wait_for(poll(), timeout)
+
+
+@pytest_asyncio.fixture
+async def service(monkeypatch):
+    """영상 수집과 AI 분석을 가짜 함수로 바꾼 분석 서비스"""
+    cache = FakeCache()
+    monkeypatch.setattr(analysis_module, "cache_service", cache)
+    service = AnalysisService()
+    service.store = AnalysisStore("sqlite:///:memory:")  # 연결하지 않으면 저장 없이 동작
+    service.cache = cache
+    service.collected = []
+    service.inferred = []
+    service.infer_gate = asyncio.Event()  # 해제하기 전까지 AI 분석을 멈춰 둠
+    service.infer_gate.set()
+    service.peak_running = 0
+
+    async def collect(analysis_id):
+        service.collected.append(analysis_id)
+        return {"title": "테스트 영상", "description": "설명", "transcript": ""}
+
+    async def perform(video_metadata, analysis_types, analysis_id=None, deadline=None, text_content=None):
+        service.inferred.append(analysis_id)
+        service.peak_running = max(service.peak_running, service.running_count)
+        await service.infer_gate.wait()
+        return {"sentiment": {"overall_sentiment": "neutral"}, "metadata": {}}
+
+    monkeypatch.setattr(service, "_collect_video_data", collect)
+    monkeypatch.setattr(service, "_perform_ai_analysis", perform)
+    yield service
+    await service.shutdown()
+
+
+class TestStatusConstants:
+    """상태 상수 테스트"""
+
+    async def test_constants_are_enum_members(self):
+        """상태 상수는 AnalysisStatus 열거형 값이어야 함"""
+        assert ACTIVE_STATUSES == (AnalysisStatus.PENDING, AnalysisStatus.PROCESSING)
+        assert AnalysisStatus.COMPLETED in TERMINAL_STATUSES
+        assert all(isinstance(status, AnalysisStatus) for status in ACTIVE_STATUSES + TERMINAL_STATUSES)
+
+    async def test_status_from_stored_value(self):
+        """저장된 문자열 상태를 열거형으로 복원할 수 있어야 함"""
+        assert AnalysisStatus("completed") is AnalysisStatus.COMPLETED
+
+
+class TestStagedPipeline:
+    """단계별 파이프라인 테스트"""
+
+    async def test_analysis_completes_through_all_stages(self, service):
+        """분석은 모든 단계를 거쳐 완료되어야 함"""
+        analysis_id = await service.start_analysis(VIDEO_URL, ["sentiment"])
+
+        analysis = await wait_for_status(service, analysis_id, TERMINAL_STATUSES)
+
+        assert analysis["status"] == AnalysisStatus.COMPLETED
+        assert analysis["results"]["sentiment"]["overall_sentiment"] == "neutral"
+        assert "text_content" not in analysis
+        assert analysis_id not in service.active_analyses
+        assert service.status_counts[AnalysisStatus.COMPLETED] == 1
+        assert service.status_counts[AnalysisStatus.PENDING] == 0
+
+    async def test_queue_orders_by_priority(self, service, monkeypatch):
+        """높은 우선순위 분석이 먼저 꺼내져야 하고 같은 우선순위는 등록 순서를 따라야 함"""
+        monkeypatch.setattr(service, "_ensure_workers", lambda: None)
+        low = await service.start_analysis(VIDEO_URL, ["sentiment"], priority="low")
+        normal_first = await service.start_analysis(VIDEO_URL, ["sentiment"])
+        high = await service.start_analysis(VIDEO_URL, ["sentiment"], priority="high")
+        normal_second = await service.start_analysis(VIDEO_URL, ["sentiment"])
+
+        order = [service.analysis_queue.get_nowait()[2] for _ in range(4)]
+
+        assert order == [high, normal_first, normal_second, low]
+
+    async def test_cancelled_queued_analysis_is_skipped(self, service, monkeypatch):
+        """대기 중 취소된 분석은 워커가 건너뛰어야 함"""
+        ensure_workers = service._ensure_workers
+        monkeypatch.setattr(service, "_ensure_workers", lambda: None)
+        cancelled = await service.start_analysis(VIDEO_URL, ["sentiment"])
+        kept = await service.start_analysis(VIDEO_URL, ["sentiment"])
+        assert await service.cancel_analysis(cancelled) is True
+
+        ensure_workers()
+        await wait_for_status(service, kept, TERMINAL_STATUSES)
+
+        assert service.collected == [kept]
+        assert (await service.get_analysis_status(cancelled))["status"] == AnalysisStatus.CANCELLED
+        assert await service.cancel_analysis(cancelled) is False
+
+    async def test_stage_failure_marks_analysis_failed(self, service, monkeypatch):
+        """단계에서 예외가 나면 분석은 실패 상태가 되고 워커는 계속 동작해야 함"""
+        async def broken_collect(analysis_id):
+            raise Exception("영상 정보 수집 실패")
+
+        monkeypatch.setattr(service, "_collect_video_data", broken_collect)
+        failed = await service.start_analysis(VIDEO_URL, ["sentiment"])
+        analysis = await wait_for_status(service, failed, TERMINAL_STATUSES)
+
+        assert analysis["status"] == AnalysisStatus.FAILED
+        assert "영상 정보 수집 실패" in analysis["error"]
+        assert service.status_counts[AnalysisStatus.FAILED] == 1
+        assert all(not worker.done() for worker in service.workers)
+
+    async def test_shutdown_right_after_cancelling_running_analysis(self, service):
+        """실행 중인 분석을 취소한 직후 종료해도 워커가 모두 중지되어야 함"""
+        service.infer_gate.clear()
+        analysis_id = await service.start_analysis(VIDEO_URL, ["sentiment"])
+        await wait_for_status(service, analysis_id, [AnalysisStatus.PROCESSING])
+        while not service.running_count:
+            await asyncio.sleep(0.01)
+        workers = list(service.workers)
+
+        assert await service.cancel_analysis(analysis_id) is True
+        await asyncio.wait_for(service.shutdown(), timeout=1.0)
+
+        assert all(worker.done() for worker in workers)
+
+
+class TestWorkerPool:
+    """단계별 워커 풀과 추론 슬롯 테스트"""
+
+    async def test_workers_start_once(self, service):
+        """워커는 한 번만 만들어지고, 추론 워커 수는 동시 분석 한도의 최댓값이어야 함"""
+        service._ensure_workers()
+        workers = list(service.workers)
+        service._ensure_workers()
+
+        assert service.workers == workers
+        assert service.stage_workers["infer"] == service.concurrency_limiter.max_limit
+        assert service.stage_workers["prepare"] == 1
+
+    async def test_inference_is_limited_by_slots(self, service):
+        """동시 추론 수는 현재 동시 분석 한도를 넘지 않아야 함"""
+        service.concurrency_limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=3)
+        service.infer_gate.clear()
+        analysis_ids = [await service.start_analysis(VIDEO_URL, ["sentiment"]) for _ in range(3)]
+
+        while not service.inferred:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        assert service.running_count == 1
+        assert len(service.inferred) == 1
+
+        service.infer_gate.set()
+        for analysis_id in analysis_ids:
+            await wait_for_status(service, analysis_id, TERMINAL_STATUSES)
+
+        assert service.peak_running == 1
+        assert service.slots_in_use <= 1
+        assert sorted(service.inferred) == sorted(analysis_ids)
+
+    async def test_shutdown_stops_workers(self, service):
+        """종료하면 모든 워커가 중지되어야 함"""
+        service._ensure_workers()
+        workers = list(service.workers)
+
+        await service.shutdown()
+
+        assert service.workers == []
+        assert all(worker.done() for worker in workers)
+
+
+class TestServiceStats:
+    """상태별 개수 집계 테스트"""
+
+    async def test_counts_follow_status_transitions(self, service):
+        """상태가 바뀔 때마다 이전 상태 개수는 줄고 새 상태 개수는 늘어야 함"""
+        completed = await service.start_analysis(VIDEO_URL, ["sentiment"])
+        await wait_for_status(service, completed, TERMINAL_STATUSES)
+        service.infer_gate.clear()
+        cancelled = await service.start_analysis(VIDEO_URL, ["sentiment"], force_refresh=True)
+        await wait_for_status(service, cancelled, [AnalysisStatus.PROCESSING])
+
+        assert (await service.get_service_stats())["processing"] == 1
+        assert await service.cancel_analysis(cancelled) is True
+
+        stats = await service.get_service_stats()
+        assert stats["total_analyses"] == 2
+        assert stats["completed"] == 1
+        assert stats["cancelled"] == 1
+        assert stats["pending"] == stats["processing"] == 0
+        assert stats["throughput_per_minute"] == 1
+
+    async def test_cleanup_without_store_decrements_counts(self, service):
+        """저장소가 없으면 메모리에서 정리한 분석만큼 개수를 줄여야 함"""
+        analysis_id = await service.start_analysis(VIDEO_URL, ["sentiment"])
+        await wait_for_status(service, analysis_id, TERMINAL_STATUSES)
+        service.recent_analyses[analysis_id]["updated_at"] = datetime.utcnow() - timedelta(hours=48)
+
+        await service.cleanup_completed_analyses(max_age_hours=24)
+
+        stats = await service.get_service_stats()
+        assert stats["completed"] == 0
+        assert stats["total_analyses"] == 0
+        assert stats["in_memory"] == 0
+
+    async def test_initialize_restores_counts_from_store(self, service, tmp_path):
+        """재시작 시 저장소의 상태별 개수를 복원하고 끝나지 못한 분석은 실패로 세야 함"""
+        store = AnalysisStore(f"sqlite:///{tmp_path / 'analyses.db'}")
+        await store.connect()
+        for analysis_id, status in [
+            ("done", AnalysisStatus.COMPLETED),
+            ("failed", AnalysisStatus.FAILED),
+            ("interrupted", AnalysisStatus.PROCESSING)
+        ]:
+            await store.save({
+                "id": analysis_id,
+                "video_id": "dQw4w9WgXcQ",
+                "video_url": VIDEO_URL,
+                "status": status,
+                "created_at": datetime.utcnow(),
+                "updated_at": datetime.utcnow()
+            })
+        await store.disconnect()
+        service.store = store
+
+        await service.initialize()
+
+        stats = await service.get_service_stats()
+        assert stats["completed"] == 1
+        assert stats["failed"] == 2
+        assert stats["processing"] == 0
+        assert stats["persistent_store"] is True
+
+
+class TestResultReuse:
+    """영상 단위 분석 결과 재사용 테스트"""
+
+    async def run_analysis(self, service, **kwargs):
+        """분석을 시작하고 끝날 때까지 기다립니다."""
+        analysis_id = await service.start_analysis(VIDEO_URL, ["sentiment"], **kwargs)
+        return await wait_for_status(service, analysis_id, TERMINAL_STATUSES)
+
+    async def test_same_video_reuses_previous_result(self, service):
+        """같은 영상/분석 종류/모델 버전/콘텐츠는 모델을 다시 실행하지 않아야 함"""
+        first = await self.run_analysis(service)
+        second = await self.run_analysis(service)
+
+        assert second["status"] == AnalysisStatus.COMPLETED
+        assert second["cached_from"] == first["id"]
+        assert second["results"] == first["results"]
+        assert service.inferred == [first["id"]]
+        stats = await service.get_service_stats()
+        assert (stats["result_cache_hits"], stats["result_cache_misses"]) == (1, 1)
+
+    async def test_cached_video_metadata_skips_queue(self, service):
+        """영상 정보까지 캐시에 있으면 큐를 거치지 않고 바로 완료되어야 함"""
+        first = await self.run_analysis(service)
+        service.cache.data[f"video_metadata:{first['video_id']}"] = {
+            "title": "테스트 영상", "description": "설명", "transcript": ""
+        }
+
+        analysis_id = await service.start_analysis(VIDEO_URL, ["sentiment"])
+
+        analysis = await service.get_analysis_status(analysis_id)
+        assert analysis["status"] == AnalysisStatus.COMPLETED
+        assert analysis["cached_from"] == first["id"]
+        assert service.collected == [first["id"]]
+
+    async def test_force_refresh_runs_again(self, service):
+        """force_refresh이면 이전 결과가 있어도 새로 분석해야 함"""
+        await self.run_analysis(service)
+        second = await self.run_analysis(service, force_refresh=True)
+
+        assert "cached_from" not in second
+        assert len(service.inferred) == 2
+
+    async def test_model_version_change_invalidates(self, service, monkeypatch):
+        """모델 버전이 바뀌면 이전 결과를 쓰지 않아야 함"""
+        await self.run_analysis(service)
+        monkeypatch.setattr(ai_model_service, "model_version", "2.0.0")
+
+        second = await self.run_analysis(service)
+
+        assert "cached_from" not in second
+        assert len(service.inferred) == 2
+
+    async def test_degraded_result_is_not_cached(self, service, monkeypatch):
+        """경고가 있는 결과는 재사용하지 않아야 함"""
+        async def degraded(video_metadata, analysis_types, analysis_id=None, deadline=None, text_content=None):
+            service.inferred.append(analysis_id)
+            return {"sentiment": {}, "metadata": {"warnings": ["시간 예산 초과"]}}
+
+        monkeypatch.setattr(service, "_perform_ai_analysis", degraded)
+        await self.run_analysis(service)
+        second = await self.run_analysis(service)
+
+        assert "cached_from" not in second
+        assert len(service.inferred) == 2
+
+
+class TestServiceCleanup:
+    """서비스 종료 순서 테스트"""
+
+    async def test_workers_stop_before_cache_disconnects(self, monkeypatch):
+        """분석 워커가 마지막 결과를 캐시에 쓸 수 있도록 캐시보다 먼저 멈춰야 함"""
+        order = []
+
+        def record(name):
+            async def step():
+                order.append(name)
+            return step
+
+        monkeypatch.setattr(services_package.analysis_service, "shutdown", record("analysis"))
+        monkeypatch.setattr(services_package.cache_service, "disconnect", record("cache"))
+        monkeypatch.setattr(services_package.ai_model_service, "cleanup", record("models"))
+
+        assert await services_package.cleanup_services() is True
+        assert order == ["analysis", "cache", "models"]
+
+
+class TestSerializeAnalyzerResult:
+    """분석기 결과 직렬화 테스트"""
+
+    @pytest_asyncio.fixture
+    async def analyzer_outputs(self):
+        """실제 분석기(휴리스틱 경로)의 결과 객체"""
+        analyzers = {
+            "credibility": CredibilityAnalyzer(),
+            "bias": BiasDetector(),
+            "facts": FactChecker(),
+            "sentiment": SentimentAnalyzer(),
+            "classification": ContentClassifier()
+        }
+        return {
+            name: await analyzer.analyze_heuristic(SAMPLE_TEXT)
+            for name, analyzer in analyzers.items()
+        }
+
+    async def test_serializes_real_analyzer_outputs(self, analyzer_outputs):
+        """분석기가 실제로 반환하는 모델의 필드로 직렬화해야 함"""
+        service = AnalysisService()
+        serialized = {
+            name: service._serialize_analyzer_result(name, result)
+            for name, result in analyzer_outputs.items()
+        }
+
+        assert serialized["credibility"]["score"] == analyzer_outputs["credibility"].credibility_score
+        assert serialized["credibility"]["source_reliability"] == analyzer_outputs["credibility"].source_reliability_score
+        assert serialized["bias"]["score"] == analyzer_outputs["bias"].bias_score
+        assert serialized["facts"]["score"] == analyzer_outputs["facts"].fact_check_score
+        assert serialized["facts"]["verification_status"] == analyzer_outputs["facts"].fact_check_result
+        assert serialized["sentiment"]["score"] == analyzer_outputs["sentiment"].overall_sentiment
+        assert serialized["classification"]["confidence"] == analyzer_outputs["classification"].primary_confidence
+        assert all(isinstance(result["reasoning"], str) for result in serialized.values())
+
+    async def test_unknown_analyzer_is_skipped(self):
+        """알 수 없는 분석기 이름은 None을 반환해야 함"""
+        assert AnalysisService()._serialize_analyzer_result("unknown", object()) is None
+
+    async def test_process_results_maps_real_outputs(self, analyzer_outputs):
+        """통합 결과에 신뢰도/팩트 체크 결과가 빠지지 않아야 함"""
+        result = await ai_model_service._process_results(
+            list(analyzer_outputs.values()), "full", datetime.utcnow()
+        )
+
+        assert result.credibility is analyzer_outputs["credibility"]
+        assert result.fact_check is analyzer_outputs["facts"]
+        assert result.bias is analyzer_outputs["bias"]
+        assert result.sentiment is analyzer_outputs["sentiment"]
+        assert result.classification is analyzer_outputs["classification"]
+
+
+class TestCommentAnalysis:
+    """댓글 분석 실행 조건 테스트"""
+
+    @pytest.fixture
+    def comment_calls(self, monkeypatch):
+        """AI 분석을 가짜로 바꾸고 댓글 분석 호출을 기록합니다."""
+        calls = []
+
+        async def stream(text, video_metadata=None, analysis_type="full", deadline=None):
+            return
+            yield
+
+        async def process_results(results, analysis_type, start_time, video_metadata=None):
+            return SimpleNamespace(
+                warnings=[], processing_time=0.0, model_version="1.0.0", completed_at=None
+            )
+
+        async def analyze_comments(comments, top_k=5, deadline=None):
+            calls.append(deadline)
+            return {"total_comments": len(comments), "degraded": False}
+
+        monkeypatch.setattr(ai_model_service, "analyze_content_stream", stream)
+        monkeypatch.setattr(ai_model_service, "_process_results", process_results)
+        monkeypatch.setattr(ai_model_service, "analyze_comments", analyze_comments)
+        return calls
+
+    async def test_comments_skipped_without_sentiment(self, comment_calls):
+        """감정 분석을 요청하지 않으면 댓글 분석을 건너뛰어야 함"""
+        metadata = {"title": "제목", "comments": [{"text": "좋아요", "like_count": 3}]}
+
+        results = await AnalysisService()._perform_ai_analysis(metadata, ["bias"], text_content="제목")
+
+        assert comment_calls == []
+        assert "comments" not in results
+
+    async def test_comments_use_remaining_deadline(self, comment_calls):
+        """감정 분석 요청 시 같은 마감 시각으로 댓글을 분석해야 함"""
+        metadata = {"title": "제목", "comments": [{"text": "좋아요", "like_count": 3}]}
+        deadline = time.monotonic() + 30
+
+        results = await AnalysisService()._perform_ai_analysis(
+            metadata, ["sentiment"], deadline=deadline, text_content="제목"
+        )
+
+        assert comment_calls == [deadline]
+        assert results["comments"]["total_comments"] == 1
@@ -0,0 +1,792 @@
+"""
+배치 처리기 테스트
+요청 큐(우선순위 힙, 작업 그룹, 테넌트 공정 큐)의 처리 순서, 결과 저장/전달, 승인 제어를 검증합니다.
+"""
+
+import asyncio
+import time
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+
+from app.core.exceptions import RateLimitError
+from app.services import batch_processor as batch_module
+from app.services.batch_processor import (
+    BatchProcessor,
+    BatchRequest,
+    BatchResult,
+    CompletedResultStore,
+    GroupedRequestQueue,
+    PriorityRequestQueue,
+    TenantFairQueue,
+)
+from app.utils.concurrency import AdaptiveConcurrencyLimiter
+from app.utils.telemetry import ResourceSnapshot
+
+WEIGHTS = {"interactive": 4.0, "default": 1.0, "backfill": 0.5}
+
+
+def make_request(request_id, priority=1, text="텍스트", analysis_type="full", **metadata):
+    """테스트용 배치 요청 생성"""
+    return BatchRequest(
+        request_id=request_id, text=text, analysis_type=analysis_type, priority=priority, metadata=metadata
+    )
+
+
+class FakeAIService:
+    """release 이벤트가 설정될 때까지 분석을 멈춰 두는 AI 서비스"""
+
+    model_version = "1.0.0"
+
+    def __init__(self):
+        self.calls = []
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def analyze_content(self, text, analysis_type="full", video_metadata=None, deadline=None):
+        self.calls.append(text)
+        await self.release.wait()
+        if text == "실패":
+            raise ValueError("분석 실패")
+        return {"text": text, "analysis_type": analysis_type}
+
+
+@pytest_asyncio.fixture
+async def live_processor():
+    """가짜 AI 서비스로 실제 스케줄러를 돌리는 배치 처리기"""
+    processor = BatchProcessor()
+    processor.ai_service = FakeAIService()
+    processor.completed_results.cache = None  # 캐시 서버 없이 메모리 결과만 사용
+    processor.max_wait = 0.0  # 배치 대기 없이 바로 시작 (대기 동작은 TestBatchFormation에서 검증)
+    yield processor
+    processor.ai_service.release.set()
+    for _ in range(100):
+        if not processor.is_running:
+            break
+        await asyncio.sleep(0.01)
+    await processor.stop()
+
+
+def make_result(request_id, status="completed"):
+    """테스트용 배치 결과 생성"""
+    return BatchResult(request_id=request_id, result={"id": request_id}, processing_time=0.1, status=status)
+
+
+class FakeCache:
+    """메모리 딕셔너리로 동작하는 캐시"""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.data[key] = value
+        return True
+
+
+def drain(queue, key, batch_size):
+    """큐를 배치 단위로 모두 꺼내 배치 목록을 반환합니다."""
+    batches = []
+    while queue:
+        batches.append(queue.pop_batch(key, batch_size))
+    return batches
+
+
+class TestPriorityRequestQueue:
+    """우선순위 힙 큐 테스트"""
+
+    def test_higher_priority_first_fifo_within_priority(self):
+        """우선순위가 높은 요청부터, 같은 우선순위는 들어온 순서대로 꺼내야 함"""
+        queue = PriorityRequestQueue()
+        queue.push(make_request("low1", priority=1))
+        queue.push(make_request("high1", priority=5))
+        queue.push(make_request("low2", priority=1))
+        queue.push(make_request("high2", priority=5))
+
+        order = [queue.pop().request_id for _ in range(4)]
+
+        assert order == ["high1", "high2", "low1", "low2"]
+        with pytest.raises(IndexError):
+            queue.pop()
+
+    def test_remove_skips_invalidated_entry(self):
+        """제거된 요청은 조회/추출/순회에서 빠지고 우선순위별 깊이도 줄어야 함"""
+        queue = PriorityRequestQueue()
+        queue.push(make_request("r1", priority=3))
+        queue.push(make_request("r2", priority=3))
+        queue.push(make_request("r3", priority=1))
+
+        assert queue.remove("r1").request_id == "r1"
+        assert queue.remove("r1") is None
+
+        assert "r1" not in queue
+        assert len(queue) == 2
+        assert queue.depth_by_priority() == {3: 1, 1: 1}
+        assert [request.request_id for request in queue] == ["r2", "r3"]
+        assert queue.peek().request_id == "r2"
+        assert queue.pop().request_id == "r2"
+
+    def test_push_existing_id_replaces_entry(self):
+        """같은 ID로 다시 넣으면 기존 항목을 대체해야 함"""
+        queue = PriorityRequestQueue()
+        queue.push(make_request("r1", priority=1))
+        queue.push(make_request("r2", priority=2))
+        queue.push(make_request("r1", priority=9))
+
+        assert len(queue) == 2
+        assert queue.depth_by_priority() == {9: 1, 2: 1}
+        assert queue.pop().request_id == "r1"
+
+    def test_heap_compacts_after_many_removals(self):
+        """무효 항목이 많아지면 힙을 재구성해 메모리를 회수해야 함"""
+        queue = PriorityRequestQueue()
+        for i in range(200):
+            queue.push(make_request(f"r{i}"))
+        for i in range(190):
+            queue.remove(f"r{i}")
+
+        assert len(queue._heap) <= 2 * len(queue) + 64
+        assert [request.request_id for request in queue] == [f"r{i}" for i in range(190, 200)]
+
+
+class TestGroupedRequestQueue:
+    """작업 그룹별 요청 큐 테스트"""
+
+    def test_group_key_uses_type_profile_and_length(self):
+        """분석 유형, 프로필, 길이 구간으로 그룹을 나눠야 함"""
+        queue = GroupedRequestQueue(length_buckets=(10, 100))
+
+        assert queue.group_key(make_request("r1", text="짧음")) == ("full", "default", 0)
+        assert queue.group_key(make_request("r2", text="가" * 50, profile="fast")) == ("full", "fast", 1)
+        assert queue.group_key(make_request("r3", text="가" * 500, analysis_type="bias")) == ("bias", "default", 2)
+
+    def test_batches_never_mix_groups(self):
+        """배치는 한 그룹의 요청으로만 구성되어야 함"""
+        queue = GroupedRequestQueue()
+        for i in range(3):
+            queue.push(make_request(f"full{i}"))
+            queue.push(make_request(f"bias{i}", analysis_type="bias"))
+
+        batches = []
+        while queue:
+            batches.append(queue.pop_batch(queue.next_group(), 8))
+
+        assert [[request.request_id for request in batch] for batch in batches] == [
+            ["full0", "full1", "full2"],
+            ["bias0", "bias1", "bias2"]
+        ]
+        assert queue.depth_by_group() == {}
+
+    def test_next_group_follows_head_priority_then_arrival(self):
+        """선두 요청의 우선순위가 높은 그룹, 같으면 먼저 도착한 그룹을 골라야 함"""
+        queue = GroupedRequestQueue()
+        queue.push(make_request("bias_low", analysis_type="bias"))
+        queue.push(make_request("full_low"))
+        assert queue.next_group() == ("bias", "default", 0)
+
+        queue.push(make_request("full_high", priority=5))
+
+        assert queue.next_group() == ("full", "default", 0)
+        assert [request.request_id for request in queue.pop_batch(queue.next_group(), 8)] == [
+            "full_high", "full_low"
+        ]
+
+    def test_remove_drops_empty_group(self):
+        """그룹의 마지막 요청을 제거하면 그룹도 사라져야 함"""
+        queue = GroupedRequestQueue()
+        queue.push(make_request("r1", analysis_type="bias"))
+        queue.push(make_request("r2"))
+
+        assert queue.remove("r1").request_id == "r1"
+
+        assert not queue.has_group(("bias", "default", 0))
+        assert queue.depth_by_group() == {"full/default/0": 1}
+        assert queue.pop().request_id == "r2"
+
+
+class TestCompletedResultStore:
+    """완료 결과 저장소(TTL/LRU) 테스트"""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """저장소가 보는 단조 시계를 직접 움직일 수 있게 고정"""
+        now = [1000.0]
+        monkeypatch.setattr(batch_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+        return now
+
+    def test_lru_evicts_least_recently_read(self):
+        """최대 개수를 넘으면 가장 오래 조회되지 않은 결과부터 제거해야 함"""
+        store = CompletedResultStore(max_entries=2, ttl_seconds=60)
+        store.put(make_result("r1"))
+        store.put(make_result("r2"))
+        assert store.get("r1") is not None  # r1을 최근 사용으로 갱신
+
+        store.put(make_result("r3"))
+
+        assert "r2" not in store
+        assert "r1" in store and "r3" in store
+        assert store.get_stats()["total_evicted"] == 1
+
+    def test_get_expires_after_ttl(self, clock):
+        """TTL이 지난 결과는 조회 시 제거되어야 함"""
+        store = CompletedResultStore(ttl_seconds=10)
+        store.put(make_result("r1"))
+
+        clock[0] += 9
+        assert store.get("r1") is not None
+        clock[0] += 1
+        assert store.get("r1") is None
+        assert len(store) == 0
+        assert store.total_expired == 1
+
+    def test_expire_removes_old_entries(self, clock):
+        """expire는 기준보다 오래된 결과만 제거하고 개수를 반환해야 함"""
+        store = CompletedResultStore(ttl_seconds=3600)
+        store.put(make_result("old"))
+        clock[0] += 100
+        store.put(make_result("new"))
+
+        assert store.expire(max_age_seconds=50) == 1
+        assert "old" not in store and "new" in store
+        assert store.expire() == 0
+
+    @pytest.mark.asyncio
+    async def test_evicted_results_spill_to_cache(self):
+        """밀려난 결과는 캐시에 옮겨져 load로 다시 조회할 수 있어야 함"""
+        cache = FakeCache()
+        store = CompletedResultStore(max_entries=1, ttl_seconds=60, cache=cache)
+        store.put(make_result("r1"))
+        store.put(make_result("r2"))
+        await asyncio.sleep(0)  # 캐시 저장 작업 실행
+
+        assert store.get("r1") is None
+        assert (await store.load("r1")).request_id == "r1"
+        assert store.total_spilled == 1
+        assert await store.load("missing") is None
+
+
+class TestTenantFairQueue:
+    """테넌트 가중 공정 큐(DRR) 테스트"""
+
+    def test_weights_follow_client_class(self):
+        """클라이언트 유형 가중치 비율로 처리 기회를 나눠야 함"""
+        queue = TenantFairQueue(WEIGHTS)
+        for i in range(40):
+            queue.push(make_request(f"a{i}", user_id="alice", client_class="interactive"))
+            queue.push(make_request(f"b{i}", user_id="bob", client_class="backfill"))
+        key = queue.next_group()
+
+        first = [request.metadata["user_id"] for request in queue.pop_batch(key, 18)]
+
+        counts = Counter(first)
+        assert counts["alice"] == 16
+        assert counts["bob"] == 2
+
+    def test_bulk_tenant_does_not_starve_others(self):
+        """한 테넌트의 대량 요청 뒤에 들어온 다른 테넌트 요청도 첫 배치에 포함되어야 함"""
+        queue = TenantFairQueue(WEIGHTS)
+        for i in range(100):
+            queue.push(make_request(f"bulk{i}", user_id="bulk", client_class="default"))
+        queue.push(make_request("small", user_id="small", client_class="default"))
+        key = queue.next_group()
+
+        first_batch = queue.pop_batch(key, 8)
+
+        assert "small" in [request.request_id for request in first_batch]
+        assert sum(len(batch) for batch in drain(queue, key, 8)) == 100 - len(first_batch) + 1
+
+    def test_remove_drops_empty_tenant(self):
+        """마지막 요청이 취소된 테넌트는 라운드에서 빠져야 함"""
+        queue = TenantFairQueue(WEIGHTS)
+        queue.push(make_request("r1", user_id="alice"))
+
+        assert queue.remove("r1").request_id == "r1"
+        assert not queue
+        assert queue.depth_by_tenant() == {}
+        assert queue.next_group() is None
+
+    def test_anonymous_requests_share_a_tenant(self):
+        """user_id가 없는 요청은 anonymous 테넌트로 묶여야 함"""
+        queue = TenantFairQueue(WEIGHTS)
+        queue.push(make_request("r1"))
+        queue.push(make_request("r2"))
+
+        depth = queue.depth_by_tenant()
+
+        assert depth["anonymous"]["pending"] == 2
+        assert depth["anonymous"]["client_class"] == "default"
+
+
+class TestAdmission:
+    """대기열 승인 제어 테스트"""
+
+    @pytest.fixture
+    def processor(self, monkeypatch):
+        processor = BatchProcessor()
+        processor.queue_capacity = 10
+        processor.reserved_capacity = {5: 0.5}  # 우선순위 5 이상에 절반 예약
+        monkeypatch.setattr(processor, "_notify_enqueued", lambda: None)
+        return processor
+
+    @pytest.mark.asyncio
+    async def test_bulk_admission_uses_lowest_item_priority(self, processor):
+        """높은 기본 우선순위로 제출해도 낮은 우선순위 항목은 예약 용량을 쓸 수 없어야 함"""
+        items = [{"text": f"텍스트 {i}", "priority": 1} for i in range(6)] + [{"text": "긴급"}]
+
+        with pytest.raises(RateLimitError):
+            await processor.add_requests(items, priority=9)
+
+        assert len(processor.pending_requests) == 0
+        assert processor.total_rejected == 7
+
+    @pytest.mark.asyncio
+    async def test_bulk_items_keep_their_priority(self, processor):
+        """승인된 항목은 각자의 우선순위로 큐에 들어가야 함"""
+        items = [{"text": "낮음", "priority": 1}, {"text": "높음"}]
+
+        await processor.add_requests(items, priority=9)
+
+        assert processor.pending_requests.depth_by_priority() == {9: 1, 1: 1}
+        assert processor.pending_requests.peek().text == "높음"
+
+    @pytest.mark.asyncio
+    async def test_bulk_items_keep_their_fields(self, processor):
+        """일괄 추가는 항목별 분석 유형과 메타데이터를 유지하고, 빈 묶음은 무시해야 함"""
+        items = [
+            {"text": "첫 번째", "analysis_type": "bias", "metadata": {"line": 1}},
+            {"text": "두 번째", "metadata": {"line": 2}}
+        ]
+
+        request_ids = await processor.add_requests(items)
+
+        queued = [processor.pending_requests.get(request_id) for request_id in request_ids]
+        assert [request.analysis_type for request in queued] == ["bias", "full"]
+        assert [request.metadata["line"] for request in queued] == [1, 2]
+        assert await processor.add_requests([]) == []
+        assert processor.total_submitted == 2
+
+    @pytest.mark.asyncio
+    async def test_high_priority_uses_reserved_capacity(self, processor):
+        """높은 우선순위만으로 된 묶음은 예약 용량까지 쓸 수 있어야 함"""
+        items = [{"text": f"텍스트 {i}"} for i in range(8)]
+
+        request_ids = await processor.add_requests(items, priority=5)
+
+        assert len(request_ids) == 8
+
+
+class TestResultDelivery:
+    """Future 기반 결과 전달과 롱 폴링 테스트"""
+
+    pytestmark = pytest.mark.asyncio
+
+    async def test_get_result_waits_for_completion(self, live_processor):
+        """완료 전에 조회해도 결과가 나올 때까지 기다려 반환해야 함"""
+        request_id = await live_processor.add_request("텍스트")
+
+        result = await live_processor.get_result(request_id, timeout=1.0)
+
+        assert result.status == "completed"
+        assert result.result == {"text": "텍스트", "analysis_type": "full"}
+        assert request_id not in live_processor.result_futures
+        assert live_processor.completed_results.get(request_id) is result
+
+    async def test_failed_analysis_is_reported(self, live_processor):
+        """분석 예외는 실패 결과로 전달되어야 함"""
+        request_id = await live_processor.add_request("실패")
+
+        result = await live_processor.get_result(request_id, timeout=1.0)
+
+        assert result.status == "failed"
+        assert result.error == "분석 실패"
+        assert live_processor.total_failed == 1
+
+    async def test_timeout_does_not_cancel_shared_future(self, live_processor):
+        """대기 시간이 지나면 None을 반환하되, 결과는 이후에도 받을 수 있어야 함"""
+        live_processor.ai_service.release.clear()
+        request_id = await live_processor.add_request("텍스트")
+
+        assert await live_processor.get_result(request_id, timeout=0) is None
+        assert await live_processor.get_result(request_id, timeout=0.05) is None
+
+        live_processor.ai_service.release.set()
+        result = await live_processor.get_result(request_id, timeout=1.0)
+
+        assert result.status == "completed"
+
+    async def test_unknown_request_returns_none(self, live_processor):
+        """없는 요청은 기다리지 않고 None을 반환해야 함"""
+        assert await live_processor.get_result("missing", timeout=1.0) is None
+
+    async def test_new_request_wakes_waiting_scheduler(self, live_processor):
+        """배치 처리 중 대기하는 스케줄러는 새 요청이 들어오면 주기를 기다리지 않고 깨어나야 함"""
+        live_processor.concurrency_limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+        live_processor.ai_service.release.clear()
+        await live_processor.add_request("첫 번째", analysis_type="bias")
+        while not live_processor.ai_service.calls:
+            await asyncio.sleep(0.01)
+
+        await live_processor.add_request("두 번째")
+        await asyncio.sleep(0.1)
+
+        assert live_processor.is_running
+        assert live_processor.ai_service.calls == ["첫 번째", "두 번째"]
+
+    async def test_scheduler_stops_when_idle_and_restarts(self, live_processor):
+        """할 일이 없으면 스케줄러가 멈추고, 새 요청이 들어오면 다시 시작해야 함"""
+        first = await live_processor.add_request("첫 번째")
+        await live_processor.get_result(first, timeout=1.0)
+        for _ in range(100):
+            if not live_processor.is_running:
+                break
+            await asyncio.sleep(0.01)
+        assert not live_processor.is_running
+
+        second = await live_processor.add_request("두 번째")
+
+        assert (await live_processor.get_result(second, timeout=1.0)).status == "completed"
+
+
+class TestBatchFormation:
+    """배치 채우기와 최대 대기 시간 테스트"""
+
+    pytestmark = pytest.mark.asyncio
+
+    async def test_partial_batch_starts_at_max_wait(self, live_processor):
+        """배치가 차지 않으면 선두 요청이 max_wait만큼 기다린 뒤, 메트릭 주기를 기다리지 않고 시작해야 함"""
+        live_processor.max_wait = 0.2
+        live_processor.current_batch_size = 4
+        live_processor.last_metrics_update = time.time()
+        live_processor.metrics_update_interval = 60.0
+        started = time.monotonic()
+
+        request_id = await live_processor.add_request("텍스트")
+        await asyncio.sleep(0.05)
+        assert live_processor.ai_service.calls == []
+
+        result = await live_processor.get_result(request_id, timeout=2.0)
+
+        assert result.status == "completed"
+        assert 0.2 <= time.monotonic() - started < 2.0
+
+    async def test_requests_within_max_wait_share_batch(self, live_processor):
+        """대기 시간 안에 도착한 같은 그룹의 요청은 한 배치로 묶여야 함"""
+        live_processor.max_wait = 0.2
+        live_processor.current_batch_size = 4
+
+        first = await live_processor.add_request("첫 번째")
+        await asyncio.sleep(0.05)
+        second = await live_processor.add_request("두 번째")
+        await live_processor.get_result(first, timeout=2.0)
+        await live_processor.get_result(second, timeout=2.0)
+
+        assert [batch["request_count"] for batch in live_processor.batch_history] == [2]
+
+    async def test_full_batch_starts_without_waiting(self, live_processor):
+        """배치가 가득 차면 대기 시간과 관계없이 바로 시작해야 함"""
+        live_processor.max_wait = 60.0
+        live_processor.current_batch_size = 2
+
+        request_ids = await live_processor.add_requests([{"text": "첫 번째"}, {"text": "두 번째"}])
+        results = [await live_processor.get_result(request_id, timeout=1.0) for request_id in request_ids]
+
+        assert [result.status for result in results] == ["completed", "completed"]
+
+    async def test_timer_tracks_head_request_deadline(self, live_processor):
+        """스케줄러 대기 시간은 메트릭 주기와 선두 요청의 대기 마감 중 빠른 쪽이어야 함"""
+        live_processor.max_wait = 30.0
+        live_processor.last_metrics_update = time.time()
+        live_processor.metrics_update_interval = 60.0
+        assert 59.0 < live_processor._time_until_next_timer() <= 60.0
+
+        live_processor.pending_requests.push(make_request("r1"))
+
+        assert 29.0 < live_processor._time_until_next_timer() <= 30.0
+
+
+class TestCoalescing:
+    """처리 중인 중복 요청 병합 테스트"""
+
+    pytestmark = pytest.mark.asyncio
+
+    async def test_duplicate_request_shares_leader_result(self, live_processor):
+        """같은 텍스트/분석 유형의 요청은 한 번만 분석하고 결과를 함께 받아야 함"""
+        live_processor.ai_service.release.clear()
+        leader_id = await live_processor.add_request("같은 텍스트")
+        follower_id = await live_processor.add_request("같은 텍스트")
+
+        live_processor.ai_service.release.set()
+        leader = await live_processor.get_result(leader_id, timeout=1.0)
+        follower = await live_processor.get_result(follower_id, timeout=1.0)
+
+        assert live_processor.ai_service.calls == ["같은 텍스트"]
+        assert follower.request_id == follower_id
+        assert follower.status == leader.status == "completed"
+        assert follower.result == leader.result
+        assert live_processor.total_coalesced == 1
+        assert live_processor.inflight_requests == {}
+
+    async def test_different_analysis_type_is_not_coalesced(self, live_processor):
+        """분석 유형이 다르면 별도로 분석해야 함"""
+        first = await live_processor.add_request("텍스트", analysis_type="full")
+        second = await live_processor.add_request("텍스트", analysis_type="bias")
+
+        await live_processor.get_result(first, timeout=1.0)
+        await live_processor.get_result(second, timeout=1.0)
+
+        assert len(live_processor.ai_service.calls) == 2
+        assert live_processor.total_coalesced == 0
+
+    async def test_follower_raises_pending_leader_priority(self, live_processor):
+        """대기 중인 대표 요청은 병합된 요청의 더 높은 우선순위로 올라가야 함"""
+        leader_id = await live_processor.add_request("텍스트", priority=1)
+        await live_processor.add_request("텍스트", priority=7)
+
+        assert live_processor.pending_requests.get(leader_id).priority == 7
+
+    async def test_completed_request_is_not_reused(self, live_processor):
+        """대표 요청이 끝난 뒤의 같은 요청은 새로 분석해야 함"""
+        first = await live_processor.add_request("텍스트")
+        await live_processor.get_result(first, timeout=1.0)
+
+        second = await live_processor.add_request("텍스트")
+        await live_processor.get_result(second, timeout=1.0)
+
+        assert len(live_processor.ai_service.calls) == 2
+        assert live_processor.total_coalesced == 0
+
+
+class TestBatchSizeController:
+    """SLO 기반 배치 크기 제어(AIMD) 테스트"""
+
+    @pytest.fixture
+    def processor(self):
+        processor = BatchProcessor()
+        processor.max_batch_size = 8
+        processor.min_batch_size = 2
+        processor.current_batch_size = 4
+        processor.latency_slo = 1.0
+        processor.memory_high_watermark = 0.9
+        processor.resource_sampler.latest = ResourceSnapshot()
+        return processor
+
+    def record_latency(self, processor, seconds, count=10):
+        """최근 요청 지연 시간 표본을 기록합니다."""
+        for _ in range(count):
+            processor.recent_latency.add(seconds)
+
+    def fill_queue(self, processor, count):
+        """대기열에 요청을 채웁니다."""
+        for i in range(count):
+            processor.pending_requests.push(make_request(f"r{i}"))
+
+    def test_holds_without_enough_samples(self, processor):
+        """표본이 부족하면 배치 크기를 유지해야 함"""
+        self.record_latency(processor, 5.0, count=processor.controller_min_samples - 1)
+
+        decision = processor._adjust_batch_size()
+
+        assert decision["action"] == "hold"
+        assert decision["p95_latency"] is None
+        assert processor.current_batch_size == 4
+
+    def test_decreases_multiplicatively_over_slo(self, processor):
+        """p95가 SLO를 넘으면 감소 비율만큼 줄이되 최소 크기 아래로는 내리지 않아야 함"""
+        processor.current_batch_size = 8
+        self.record_latency(processor, 2.0)
+
+        assert processor._adjust_batch_size()["action"] == "decrease"
+        assert processor.current_batch_size == 5
+
+        processor._adjust_batch_size()
+        processor._adjust_batch_size()
+        assert processor.current_batch_size == 2
+        assert processor._adjust_batch_size()["action"] == "hold"
+
+    def test_increases_by_one_with_headroom_and_backlog(self, processor):
+        """SLO에 여유가 있고 대기열이 밀려 있으면 1씩 늘려야 함"""
+        self.record_latency(processor, 0.1)
+        self.fill_queue(processor, 4)
+
+        decision = processor._adjust_batch_size()
+
+        assert decision["action"] == "increase"
+        assert processor.current_batch_size == 5
+
+    def test_holds_without_backlog(self, processor):
+        """대기열이 배치 크기보다 짧으면 늘리지 않아야 함"""
+        self.record_latency(processor, 0.1)
+        self.fill_queue(processor, 3)
+
+        assert processor._adjust_batch_size()["action"] == "hold"
+        assert processor.current_batch_size == 4
+
+    def test_holds_when_larger_batch_is_predicted_to_miss_slo(self, processor):
+        """크기-지연 곡선상 한 단계 큰 배치가 SLO 여유를 넘으면 늘리지 않아야 함"""
+        self.record_latency(processor, 0.1)
+        self.fill_queue(processor, 4)
+        processor.batch_latency_fit.add(2, 0.4)
+        processor.batch_latency_fit.add(4, 0.8)
+
+        decision = processor._adjust_batch_size()
+
+        assert decision["action"] == "hold"
+        assert decision["predicted_latency"] == pytest.approx(1.0)
+        assert processor.current_batch_size == 4
+
+    def test_memory_pressure_decreases_regardless_of_latency(self, processor):
+        """메모리 사용률이 기준을 넘으면 지연 시간과 무관하게 줄여야 함"""
+        self.record_latency(processor, 0.1)
+        self.fill_queue(processor, 4)
+        processor.resource_sampler.latest = ResourceSnapshot(memory_usage=95.0)
+
+        decision = processor._adjust_batch_size()
+
+        assert decision["action"] == "decrease_memory"
+        assert processor.current_batch_size == 2
+
+
+class TestCancellation:
+    """요청 취소 테스트"""
+
+    pytestmark = pytest.mark.asyncio
+
+    async def wait_until_analyzing(self, processor, count=1):
+        """분석이 count번 시작될 때까지 기다립니다."""
+        for _ in range(100):
+            if len(processor.ai_service.calls) >= count:
+                return
+            await asyncio.sleep(0.01)
+        raise AssertionError("분석이 시작되지 않았습니다.")
+
+    async def test_cancel_pending_request(self, live_processor):
+        """대기 중인 요청은 분석 없이 취소 결과로 완료되어야 함"""
+        request_id = await live_processor.add_request("텍스트")
+
+        assert await live_processor.cancel(request_id) is True
+
+        result = await live_processor.get_result(request_id, timeout=1.0)
+        assert result.status == "cancelled"
+        assert request_id not in live_processor.pending_requests
+        assert live_processor.ai_service.calls == []
+        assert live_processor.total_cancelled == 1
+
+    async def test_cancel_running_request(self, live_processor):
+        """처리 중인 요청은 분석 작업을 취소해야 함"""
+        live_processor.ai_service.release.clear()
+        request_id = await live_processor.add_request("텍스트")
+        await self.wait_until_analyzing(live_processor)
+
+        assert await live_processor.cancel(request_id) is True
+
+        result = await live_processor.get_result(request_id, timeout=1.0)
+        assert result.status == "cancelled"
+        assert live_processor.total_cancelled == 1
+        assert live_processor.total_processed == 0
+
+    async def test_cancel_finished_or_unknown_request(self, live_processor):
+        """완료됐거나 없는 요청은 취소할 수 없어야 함"""
+        request_id = await live_processor.add_request("텍스트")
+        await live_processor.get_result(request_id, timeout=1.0)
+
+        assert await live_processor.cancel(request_id) is False
+        assert await live_processor.cancel("missing") is False
+
+    async def test_cancel_follower_keeps_leader_running(self, live_processor):
+        """병합된 요청을 취소해도 대표 요청은 결과를 받아야 함"""
+        live_processor.ai_service.release.clear()
+        leader_id = await live_processor.add_request("텍스트")
+        follower_id = await live_processor.add_request("텍스트")
+
+        assert await live_processor.cancel(follower_id) is True
+        live_processor.ai_service.release.set()
+
+        assert (await live_processor.get_result(follower_id, timeout=1.0)).status == "cancelled"
+        assert (await live_processor.get_result(leader_id, timeout=1.0)).status == "completed"
+
+    async def test_cancel_leader_keeps_work_for_follower(self, live_processor):
+        """대표 요청을 취소해도 병합된 요청이 기다리면 분석은 계속되어야 함"""
+        live_processor.ai_service.release.clear()
+        leader_id = await live_processor.add_request("텍스트")
+        follower_id = await live_processor.add_request("텍스트")
+        await self.wait_until_analyzing(live_processor)
+
+        assert await live_processor.cancel(leader_id) is True
+        live_processor.ai_service.release.set()
+
+        assert (await live_processor.get_result(leader_id, timeout=1.0)).status == "cancelled"
+        follower = await live_processor.get_result(follower_id, timeout=1.0)
+        assert follower.status == "completed"
+        assert live_processor.completed_results.get(leader_id).status == "cancelled"
+        assert live_processor.total_cancelled == 1
+
+    async def test_cancelling_every_waiter_cancels_work(self, live_processor):
+        """대표 요청과 병합된 요청이 모두 취소되면 분석 작업도 취소되어야 함"""
+        live_processor.ai_service.release.clear()
+        leader_id = await live_processor.add_request("텍스트")
+        follower_id = await live_processor.add_request("텍스트")
+        await self.wait_until_analyzing(live_processor)
+
+        await live_processor.cancel(leader_id)
+        await live_processor.cancel(follower_id)
+        for _ in range(100):
+            if not live_processor.processing_batches:
+                break
+            await asyncio.sleep(0.01)
+
+        assert live_processor.processing_batches == {}
+        assert live_processor.total_processed == 0
+        assert live_processor.total_cancelled == 2
+        assert live_processor.completed_results.get(leader_id).status == "cancelled"
+
+
+class TestResultStreaming:
+    """배치 핸들과 완료 순서 결과 스트리밍 테스트"""
+
+    pytestmark = pytest.mark.asyncio
+
+    async def collect(self, processor, request_ids, timeout=1.0):
+        """iter_results가 반환하는 결과를 모두 모읍니다."""
+        return [result async for result in processor.iter_results(request_ids, timeout=timeout)]
+
+    async def test_results_arrive_in_completion_order(self, live_processor):
+        """이미 끝난 요청이 먼저, 나머지는 완료되는 대로 반환되어야 함"""
+        done_id = await live_processor.add_request("먼저 끝남")
+        await live_processor.get_result(done_id, timeout=1.0)
+        live_processor.ai_service.release.clear()
+        waiting_id = await live_processor.add_request("나중에 끝남")
+        asyncio.get_running_loop().call_later(0.05, live_processor.ai_service.release.set)
+
+        results = await self.collect(live_processor, [waiting_id, done_id])
+
+        assert [result.request_id for result in results] == [done_id, waiting_id]
+        assert all(result.status == "completed" for result in results)
+
+    async def test_unknown_request_is_reported_as_failed(self, live_processor):
+        """없는 요청은 실패 결과로 바로 반환되어야 함"""
+        results = await self.collect(live_processor, ["missing"])
+
+        assert results[0].status == "failed"
+        assert results[0].error == "요청을 찾을 수 없습니다."
+
+    async def test_timeout_leaves_unfinished_requests(self, live_processor):
+        """timeout이 지나면 끝나지 않은 요청은 반환하지 않아야 함"""
+        live_processor.ai_service.release.clear()
+        request_id = await live_processor.add_request("텍스트")
+
+        assert await self.collect(live_processor, [request_id], timeout=0.05) == []
+        assert request_id in live_processor.result_futures
+
+    async def test_batch_handles_are_bounded(self, live_processor):
+        """핸들 수가 한도를 넘으면 오래된 핸들부터 정리되어야 함"""
+        live_processor.max_batch_handles = 2
+        first = live_processor.create_batch_handle(["r1"])
+        second = live_processor.create_batch_handle(["r2", "r3"])
+        live_processor.create_batch_handle(["r4"])
+
+        assert live_processor.get_batch_handle(first) is None
+        assert live_processor.get_batch_handle(second) == ["r2", "r3"]
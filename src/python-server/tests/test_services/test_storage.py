@@ -0,0 +1,118 @@
+"""
+분석 저장소 테스트
+SQLite 백엔드로 저장/조회/상태 집계/정리 동작을 검증합니다.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+
+from app.models.analysis import AnalysisStatus
+from app.services.storage import AnalysisStore, PostgresBackend
+
+pytestmark = pytest.mark.asyncio
+
+
+def make_record(analysis_id, video_id="dQw4w9WgXcQ", status=AnalysisStatus.COMPLETED, age_hours=0):
+    """테스트용 분석 기록 생성"""
+    timestamp = datetime.utcnow() - timedelta(hours=age_hours)
+    return {
+        "id": analysis_id,
+        "video_id": video_id,
+        "video_url": f"https://www.youtube.com/watch?v={video_id}",
+        "status": status,
+        "created_at": timestamp,
+        "updated_at": timestamp,
+        "results": {"score": 80},
+        "deadline": 123.0
+    }
+
+
+class TestAnalysisStore:
+    """SQLite 분석 저장소 테스트"""
+
+    @pytest_asyncio.fixture
+    async def store(self, tmp_path):
+        store = AnalysisStore(f"sqlite:///{tmp_path / 'analyses.db'}")
+        await store.connect()
+        yield store
+        await store.disconnect()
+
+    async def test_save_and_get(self, store):
+        """저장한 기록은 상태가 열거형으로 복원되고 마감 시각은 제외되어야 함"""
+        assert store.is_connected
+        assert await store.save(make_record("a1")) is True
+
+        record = await store.get("a1")
+
+        assert record["status"] is AnalysisStatus.COMPLETED
+        assert record["results"] == {"score": 80}
+        assert "deadline" not in record
+        assert await store.get("missing") is None
+
+    async def test_save_upserts(self, store):
+        """같은 ID로 저장하면 상태와 데이터를 갱신해야 함"""
+        await store.save(make_record("a1", status=AnalysisStatus.PROCESSING))
+        await store.save(make_record("a1", status=AnalysisStatus.FAILED))
+
+        assert (await store.get("a1"))["status"] is AnalysisStatus.FAILED
+        assert await store.count_by_status() == {"failed": 1}
+
+    async def test_find_by_video_newest_first(self, store):
+        """영상 ID로 조회하면 최신 기록부터 반환해야 함"""
+        await store.save(make_record("old", age_hours=2))
+        await store.save(make_record("new", age_hours=1))
+        await store.save(make_record("other", video_id="aaaaaaaaaaa"))
+
+        records = await store.find_by_video("dQw4w9WgXcQ")
+
+        assert [record["id"] for record in records] == ["new", "old"]
+        assert len(await store.find_by_video("dQw4w9WgXcQ", limit=1)) == 1
+
+    async def test_mark_interrupted(self, store):
+        """재시작 시 진행 중 상태의 기록만 실패로 바꿔야 함"""
+        await store.save(make_record("p1", status=AnalysisStatus.PENDING))
+        await store.save(make_record("p2", status=AnalysisStatus.PROCESSING))
+        await store.save(make_record("c1"))
+
+        changed = await store.mark_interrupted(["pending", "processing"], "failed")
+
+        assert changed == 2
+        assert (await store.get("p1"))["status"] is AnalysisStatus.FAILED
+        assert await store.count_by_status() == {"failed": 2, "completed": 1}
+
+    async def test_delete_before_counts_deleted_rows(self, store):
+        """기준 시각 이전의 지정 상태 기록만 삭제하고 상태별 삭제 수를 반환해야 함"""
+        await store.save(make_record("old_done", age_hours=48))
+        await store.save(make_record("old_failed", status=AnalysisStatus.FAILED, age_hours=48))
+        await store.save(make_record("old_running", status=AnalysisStatus.PROCESSING, age_hours=48))
+        await store.save(make_record("recent_done", age_hours=1))
+
+        deleted = await store.delete_before(datetime.utcnow() - timedelta(hours=24), ["completed", "failed"])
+
+        assert deleted == {"completed": 1, "failed": 1}
+        assert await store.get("old_done") is None
+        assert await store.get("old_running") is not None
+        assert await store.count_by_status() == {"completed": 1, "processing": 1}
+
+    async def test_disconnected_store_returns_empty(self):
+        """연결되지 않은 저장소는 빈 결과를 반환해야 함"""
+        store = AnalysisStore()
+
+        assert await store.save(make_record("a1")) is False
+        assert await store.get("a1") is None
+        assert await store.delete_before(datetime.utcnow(), ["completed"]) == {}
+
+
+class TestPlaceholders:
+    """자리표시자 변환 테스트"""
+
+    async def test_postgres_placeholders(self):
+        """PostgreSQL 백엔드는 '?'를 $1, $2...로 바꿔야 함"""
+        store = AnalysisStore("postgresql://localhost/test")
+        store.backend = PostgresBackend(store.database_url)
+
+        assert store._sql("SELECT * FROM analyses WHERE id = ? AND status IN (?, ?)") == (
+            "SELECT * FROM analyses WHERE id = $1 AND status IN ($2, $3)"
+        )
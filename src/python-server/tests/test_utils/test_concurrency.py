@@ -0,0 +1,67 @@
+"""
+동시 실행 한도 자동 조정 유틸리티 테스트
+"""
+
+from app.utils.concurrency import AdaptiveConcurrencyLimiter
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Gradient 기반 동시 실행 한도 조정기 테스트"""
+
+    def test_initial_limit_is_clamped(self):
+        """초기 한도는 최소/최대 한도 안으로 맞춰져야 함"""
+        assert AdaptiveConcurrencyLimiter(100, max_limit=10).limit == 10
+        assert AdaptiveConcurrencyLimiter(0, min_limit=2).limit == 2
+
+    def test_acquire_and_release_track_in_flight(self):
+        """사용 중인 수가 한도에 닿으면 여유가 없어야 하고, 해제는 0 아래로 내려가지 않아야 함"""
+        limiter = AdaptiveConcurrencyLimiter(2)
+        limiter.acquire()
+        limiter.acquire()
+
+        assert not limiter.has_capacity()
+
+        limiter.release()
+        limiter.release()
+        limiter.release()
+        assert limiter.in_flight == 0
+        assert limiter.has_capacity()
+        assert limiter.samples == 0
+
+    def test_steady_latency_under_load_raises_limit(self):
+        """한도를 다 쓰는 동안 지연이 유지되면 한도를 늘려야 함"""
+        limiter = AdaptiveConcurrencyLimiter(4, max_limit=64)
+        for _ in range(20):
+            limiter.record(0.1, in_flight=limiter.limit)
+
+        assert limiter.limit > 4
+        assert limiter.limit <= 64
+
+    def test_rising_latency_lowers_limit(self):
+        """지연이 기준보다 크게 늘면 한도를 줄여야 함"""
+        limiter = AdaptiveConcurrencyLimiter(10, max_limit=10)
+        for _ in range(50):
+            limiter.record(0.1, in_flight=10)
+        assert limiter.limit == 10
+
+        for _ in range(5):
+            limiter.record(1.0, in_flight=10)
+
+        assert limiter.limit < 10
+        assert limiter.limit >= limiter.min_limit
+
+    def test_underused_limit_does_not_grow(self):
+        """한도의 절반도 쓰지 않으면 지연이 좋아도 늘리지 않아야 함"""
+        limiter = AdaptiveConcurrencyLimiter(10, max_limit=64)
+        for _ in range(20):
+            limiter.record(0.1, in_flight=1)
+
+        assert limiter.limit == 10
+
+    def test_invalid_rtt_is_ignored(self):
+        """0 이하의 지연 시간은 표본으로 쓰지 않아야 함"""
+        limiter = AdaptiveConcurrencyLimiter(4)
+
+        assert limiter.record(0.0) == 4
+        assert limiter.get_stats()["samples"] == 0
+        assert limiter.get_stats()["long_rtt"] is None
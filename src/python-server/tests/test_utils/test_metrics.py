@@ -0,0 +1,152 @@
+"""
+스트리밍 메트릭 유틸리티 테스트
+"""
+
+import pytest
+
+from app.utils.metrics import (
+    EWMA,
+    DecayedLinearFit,
+    LatencyHistogram,
+    RollingCounter,
+    RollingHistogram,
+)
+
+
+class TestRollingCounter:
+    """구간 카운터 테스트"""
+
+    def test_counts_only_within_window(self):
+        """window초가 지난 슬롯의 값은 집계에서 빠져야 함"""
+        counter = RollingCounter(window=10.0, slots=10)
+        counter.add(2.0, now=100.0)
+        counter.add(4.0, now=105.0)
+
+        assert counter.count(now=105.0) == 2
+        assert counter.total(now=105.0) == 6.0
+        assert counter.mean(now=105.0) == 3.0
+
+        assert counter.count(now=110.5) == 1
+        assert counter.count(now=116.0) == 0
+        assert counter.mean(now=116.0) == 0.0
+
+    def test_reused_slot_is_cleared(self):
+        """한 바퀴 돈 뒤 같은 슬롯을 쓰면 이전 값이 남지 않아야 함"""
+        counter = RollingCounter(window=10.0, slots=10)
+        counter.add(now=100.0)
+        counter.add(now=110.0)
+
+        assert counter.count(now=110.0) == 1
+
+
+class TestEWMA:
+    """지수 이동 평균 테스트"""
+
+    def test_first_sample_sets_value(self):
+        """표본이 없으면 기본값을, 첫 표본 후에는 그 값을 반환해야 함"""
+        ewma = EWMA(half_life=10.0)
+
+        assert ewma.get(default=1.5) == 1.5
+        ewma.update(4.0, now=0.0)
+        assert ewma.get() == 4.0
+
+    def test_half_life_weights_new_sample(self):
+        """half_life초 뒤의 표본은 절반의 가중치로 반영되어야 함"""
+        ewma = EWMA(half_life=10.0)
+        ewma.update(0.0, now=0.0)
+        ewma.update(10.0, now=10.0)
+
+        assert ewma.get() == pytest.approx(5.0)
+
+    def test_same_time_samples_still_count(self):
+        """같은 시각의 표본도 최소 가중치로 반영되어야 함"""
+        ewma = EWMA(half_life=10.0)
+        ewma.update(0.0, now=0.0)
+        ewma.update(10.0, now=0.0)
+
+        assert ewma.get() == pytest.approx(0.5)
+
+
+class TestLatencyHistogram:
+    """지연 시간 히스토그램 테스트"""
+
+    def test_quantiles_return_bucket_upper_bound(self):
+        """분위수는 해당 표본이 속한 구간의 상한값이어야 함"""
+        histogram = LatencyHistogram(bounds=[0.1, 0.5, 1.0, 5.0])
+        for value in [0.05] * 90 + [0.8] * 9 + [3.0]:
+            histogram.add(value)
+
+        assert histogram.quantile(0.50) == 0.1
+        assert histogram.quantile(0.95) == 1.0
+        assert histogram.quantile(0.99) == 1.0
+        assert histogram.quantile(1.0) == 5.0
+
+    def test_empty_and_merge(self):
+        """표본이 없으면 None이고, 병합하면 두 분포를 합쳐야 함"""
+        first = LatencyHistogram(bounds=[0.1, 1.0])
+        second = LatencyHistogram(bounds=[0.1, 1.0])
+        assert first.quantile(0.5) is None
+
+        first.add(0.05)
+        second.add(0.5)
+        second.add(0.5)
+        first.merge(second)
+
+        assert first.count == 3
+        assert first.quantile(0.5) == 1.0
+
+
+class TestRollingHistogram:
+    """구간 히스토그램 테스트"""
+
+    def test_old_slots_leave_the_window(self):
+        """window초가 지난 표본은 분위수 계산에서 빠져야 함"""
+        histogram = RollingHistogram(window=30.0, slots=6, bounds=[0.1, 1.0, 10.0])
+        histogram.add(5.0, now=100.0)
+        histogram.add(0.05, now=120.0)
+
+        assert histogram.count(now=120.0) == 2
+        assert histogram.quantile(0.95, now=120.0) == 10.0
+
+        assert histogram.count(now=131.0) == 1
+        assert histogram.quantile(0.95, now=131.0) == 0.1
+        assert histogram.quantile(0.95, now=200.0) is None
+
+
+class TestDecayedLinearFit:
+    """감쇠 선형 회귀 테스트"""
+
+    def test_needs_two_samples(self):
+        """표본이 2개 미만이면 예측하지 않아야 함"""
+        fit = DecayedLinearFit()
+        fit.add(4, 1.0)
+
+        assert fit.predict(8) is None
+
+    def test_predicts_on_fitted_line(self):
+        """직선 위의 표본으로 맞추면 다른 x에서도 같은 직선을 따라야 함"""
+        fit = DecayedLinearFit(decay=0.9)
+        for x in (1, 2, 4, 8):
+            fit.add(x, 0.5 + 0.25 * x)
+
+        assert fit.predict(16) == pytest.approx(4.5)
+
+    def test_constant_x_returns_mean(self):
+        """x가 모두 같으면 평균값을 반환해야 함"""
+        fit = DecayedLinearFit(decay=1.0)
+        fit.add(4, 1.0)
+        fit.add(4, 3.0)
+
+        assert fit.predict(10) == pytest.approx(2.0)
+
+    def test_recent_samples_weigh_more(self):
+        """감쇠로 인해 최근 표본에 더 가까운 값을 예측해야 함"""
+        fit = DecayedLinearFit(decay=0.5)
+        fit.add(4, 1.0)
+        fit.add(4, 1.0)
+        fit.add(4, 3.0)
+
+        assert fit.predict(4) > 2.0
+
+        fit.reset()
+        assert fit.samples == 0 and fit.predict(4) is None
@@ -0,0 +1,125 @@
+"""
+리소스 텔레메트리 유틸리티 테스트
+"""
+
+import asyncio
+
+import pytest
+import torch
+
+from app.utils import telemetry
+from app.utils.telemetry import (
+    ResourceSampler,
+    ResourceSnapshot,
+    executor_queue_depth,
+    module_resident_bytes,
+    process_rss_bytes,
+)
+
+
+class TestResourceSnapshot:
+    """리소스 측정값 테스트"""
+
+    def test_memory_pressure_uses_higher_usage(self):
+        """호스트와 GPU 메모리 중 더 높은 사용률을 0~1로 반환해야 함"""
+        assert ResourceSnapshot(memory_usage=40.0).memory_pressure == pytest.approx(0.4)
+        assert ResourceSnapshot(memory_usage=40.0, gpu_memory_usage=90.0).memory_pressure == pytest.approx(0.9)
+
+    def test_to_dict_converts_units(self):
+        """바이트는 MB로, 지연 시간은 ms로 변환해야 함"""
+        snapshot = ResourceSnapshot(
+            process_rss_bytes=512 * 1024 ** 2,
+            event_loop_lag=0.0125,
+            model_memory_bytes={"bias_detector": 3 * 1024 ** 2}
+        )
+
+        data = snapshot.to_dict()
+
+        assert data["process_rss_mb"] == 512.0
+        assert data["event_loop_lag_ms"] == 12.5
+        assert data["gpu_memory_usage"] is None
+        assert data["model_memory_mb"] == {"bias_detector": 3.0}
+
+
+class TestMeasurements:
+    """개별 측정 함수 테스트"""
+
+    def test_module_resident_bytes_counts_shared_tensors_once(self):
+        """파라미터 메모리를 합산하되 같은 모듈/텐서는 한 번만 세야 함"""
+        layer = torch.nn.Linear(4, 2)  # 가중치 8개 + 편향 2개 (float32)
+
+        assert module_resident_bytes(layer) == 40
+        assert module_resident_bytes(layer, layer) == 40
+        assert module_resident_bytes(layer, "not a module") == 40
+
+    def test_process_rss_is_positive(self):
+        """현재 프로세스의 상주 메모리를 읽을 수 있어야 함"""
+        assert process_rss_bytes() > 0
+
+    def test_executor_queue_depth_without_executor(self):
+        """기본 실행기가 아직 없으면 0이어야 함"""
+        loop = asyncio.new_event_loop()
+        try:
+            assert executor_queue_depth(loop) == 0
+        finally:
+            loop.close()
+
+
+class TestResourceSampler:
+    """리소스 측정기 테스트"""
+
+    def test_sample_reads_process_and_model_memory(self, monkeypatch):
+        """모델 메모리는 갱신 주기마다만 다시 계산해야 함"""
+        monkeypatch.setattr(telemetry, "torch_allocator_stats", lambda: {})
+        calls = []
+
+        def provider():
+            calls.append(1)
+            return {"bias_detector": 1024}
+
+        sampler = ResourceSampler(model_memory_provider=provider, model_refresh_interval=60.0)
+
+        first = sampler.sample()
+        sampler.latest = first
+        second = sampler.sample()
+
+        assert len(calls) == 1
+        assert second.model_memory_bytes == {"bias_detector": 1024}
+        assert 0.0 < first.memory_usage <= 100.0
+        assert first.cpu_percent == 0.0
+        assert first.gpu_utilization is None
+
+    def test_sample_reports_gpu_allocator(self, monkeypatch):
+        """CUDA 할당자 통계가 있으면 GPU 항목을 채워야 함"""
+        monkeypatch.setattr(telemetry, "torch_allocator_stats", lambda: {
+            "allocated": 2 * 1024 ** 3,
+            "reserved": 4 * 1024 ** 3,
+            "total": 16 * 1024 ** 3,
+            "utilization": 75.0
+        })
+
+        snapshot = ResourceSampler().sample()
+
+        assert snapshot.gpu_utilization == 75.0
+        assert snapshot.gpu_memory_usage == pytest.approx(25.0)
+        assert snapshot.memory_pressure >= 0.25
+
+    @pytest.mark.asyncio
+    async def test_background_sampling_starts_once_and_stops(self, monkeypatch):
+        """측정 작업은 한 번만 시작되고, 중지하면 취소되어야 함"""
+        monkeypatch.setattr(telemetry, "torch_allocator_stats", lambda: {})
+        sampler = ResourceSampler(interval=0.01)
+
+        sampler.ensure_started()
+        task = sampler._task
+        sampler.ensure_started()
+        await asyncio.sleep(0.05)
+
+        assert sampler._task is task
+        assert sampler.latest.timestamp > 0
+        assert sampler.latest.event_loop_lag >= 0.0
+
+        sampler.stop()
+        await asyncio.sleep(0)
+        assert task.cancelled() or task.done()
+        assert sampler._task is None